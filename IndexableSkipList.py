@@ -0,0 +1,544 @@
+#!/usr/bin/env python
+from __future__ import print_function
+import operator
+import random
+from itertools import chain
+
+"""
+Getting to the element at some index in a linked list means walking
+through every element that comes before it, so operations like
+`delete_index` and `subsequence` take longer the further into the list
+they have to go. A skip list speeds this up by giving some of the nodes
+extra links that skip over many nodes at a time.
+
+Every node has a "height" that is picked at random when it is created:
+every node has a link at level 0 (to the very next node, like a regular
+linked list), about half of the nodes also have a link at level 1 (to
+the next node that is at least 2 levels high), about a quarter also
+have a link at level 2, and so on. To find a position, we start at the
+highest level of the header node and move forward as far as possible
+without overshooting, then drop down a level and do the same thing,
+until we get to level 0. This takes a number of steps proportional to
+the logarithm of the length of the list instead of the length itself.
+
+For this to work with positions (rather than with sorted values), each
+link also stores its "width", i.e., how many positions it skips over.
+The width of a link that doesn't point to another node is the number of
+positions from its node to the end of the list.
+
+`IndexableSkipList` has the same methods as `LinkedList`, plus `insert`
+and indexing with `[]`.
+"""
+
+class SkipNode(object):
+    __slots__ = ('value', 'next_nodes', 'widths')
+
+    def __init__(self, value=None, height=1):
+        self.value = value
+        self.next_nodes = [None]*height
+        self.widths = [0]*height
+
+
+class IndexableSkipList:
+    """
+    Python implementation of an indexable skip list.
+    """
+
+    def __init__(self, max_levels=32, seed=None):
+        """
+        Initialize an empty skip list (other than a header node that
+        points to nothing).
+
+        :param max_levels: maximum height of a node (a skip list with
+                           `max_levels` levels stays fast for up to
+                           about 2**`max_levels` elements)
+        :type max_levels: int
+        :param seed: seed for the random number generator used to pick
+                     node heights (for repeatable results)
+        :type seed: int or None
+        """
+
+        self.max_levels = max_levels
+        self.random = random.Random(seed)
+        self.header_node = SkipNode(height=max_levels)
+        self.header_node.widths[0] = 1
+        self.num_levels = 1
+        self.num_elements = 0
+
+    def _random_height(self):
+        """
+        Pick a height for a new node: 1 with probability 1/2, 2 with
+        probability 1/4, 3 with probability 1/8, and so on.
+
+        :returns: height
+        :rtype: int
+        """
+
+        height = 1
+        while height < self.max_levels and self.random.random() < 0.5:
+            height += 1
+
+        return height
+
+    def _find_predecessors(self, index):
+        """
+        Find, for each level, the last node before position `index`
+        (the header node counts as being at position -1).
+
+        :param index: position
+        :type index: int
+
+        :returns: tuple of the list of nodes and the list of their
+                  positions (one of each per level)
+        :rtype: tuple
+        """
+
+        predecessors = [None]*self.num_levels
+        positions = [0]*self.num_levels
+
+        current_node = self.header_node
+        position = -1
+        for level in reversed(range(self.num_levels)):
+            while (current_node.next_nodes[level] is not None
+                   and position + current_node.widths[level] < index):
+                position += current_node.widths[level]
+                current_node = current_node.next_nodes[level]
+            predecessors[level] = current_node
+            positions[level] = position
+
+        return predecessors, positions
+
+    def _node_at(self, index):
+        """
+        Return the node at the given (valid) index.
+
+        :param index: index of the node
+        :type index: int
+
+        :returns: node at the given index
+        :rtype: SkipNode
+        """
+
+        current_node = self.header_node
+        position = -1
+        for level in reversed(range(self.num_levels)):
+            while (current_node.next_nodes[level] is not None
+                   and position + current_node.widths[level] <= index):
+                position += current_node.widths[level]
+                current_node = current_node.next_nodes[level]
+
+        return current_node
+
+    def insert(self, index, new_value):
+        """
+        Insert a new value so that it ends up at the given index,
+        shifting all of the values at or after that index one index
+        forward.
+
+        :param index: index for the new value (from 0 up to the length
+                      of the list)
+        :type index: int
+        :param new_value: new value
+        :type new_value: object
+
+        :raises IndexError: if the index is out of range
+        """
+
+        if index < 0 or index > len(self):
+            raise IndexError("Skip list index out of range.")
+
+        height = self._random_height()
+
+        # If the new node is taller than any of the others, the header
+        # node's links at the new levels go straight to the end of the
+        # list
+        for level in range(self.num_levels, height):
+            self.header_node.next_nodes[level] = None
+            self.header_node.widths[level] = self.num_elements + 1
+        self.num_levels = max(self.num_levels, height)
+
+        predecessors, positions = self._find_predecessors(index)
+
+        new_node = SkipNode(value=new_value, height=height)
+        for level in range(height):
+            prev_node = predecessors[level]
+            end_position = positions[level] + prev_node.widths[level]
+            new_node.next_nodes[level] = prev_node.next_nodes[level]
+            new_node.widths[level] = end_position + 1 - index
+            prev_node.next_nodes[level] = new_node
+            prev_node.widths[level] = index - positions[level]
+
+        # Links at the higher levels now skip over one more position
+        for level in range(height, self.num_levels):
+            predecessors[level].widths[level] += 1
+
+        self.num_elements += 1
+
+    def _delete(self, index):
+        """
+        Remove the node at the given (valid) index and return its value.
+
+        :param index: index of the node
+        :type index: int
+
+        :returns: value of the removed node
+        :rtype: object
+        """
+
+        predecessors, _ = self._find_predecessors(index)
+        removed_node = predecessors[0].next_nodes[0]
+        height = len(removed_node.next_nodes)
+
+        for level in range(height):
+            prev_node = predecessors[level]
+            prev_node.next_nodes[level] = removed_node.next_nodes[level]
+            prev_node.widths[level] += removed_node.widths[level] - 1
+
+        # Links at the higher levels now skip over one less position
+        for level in range(height, self.num_levels):
+            predecessors[level].widths[level] -= 1
+
+        self.num_elements -= 1
+
+        return removed_node.value
+
+    @classmethod
+    def from_iterable(cls, values, **kwargs):
+        """
+        Make a new skip list out of the values of any iterable in one
+        forward pass (which is faster than appending the values one by
+        one since there is no need to search for the end of the list
+        each time).
+
+        :param values: values to put in the list
+        :type values: iterable
+        :param kwargs: keyword arguments for the list's constructor
+
+        :returns: new skip list
+        :rtype: IndexableSkipList
+        """
+
+        skip_list = cls(**kwargs)
+
+        # Keep track of the last node at each level and its position
+        last_nodes = [skip_list.header_node]*skip_list.max_levels
+        last_positions = [-1]*skip_list.max_levels
+        num_levels = 1
+        position = -1
+        for position, value in enumerate(values):
+            height = skip_list._random_height()
+            num_levels = max(num_levels, height)
+            new_node = SkipNode(value=value, height=height)
+            for level in range(height):
+                last_nodes[level].next_nodes[level] = new_node
+                last_nodes[level].widths[level] = (position
+                                                   - last_positions[level])
+                last_nodes[level] = new_node
+                last_positions[level] = position
+
+        # The last node at each level links to the end of the list
+        num_elements = position + 1
+        for level in range(num_levels):
+            last_nodes[level].widths[level] = (num_elements
+                                               - last_positions[level])
+
+        skip_list.num_levels = num_levels
+        skip_list.num_elements = num_elements
+
+        return skip_list
+
+    def is_empty(self):
+        """
+        Return False if the list contains any elements; True otherwise.
+
+        :returns: boolean value
+        :rtype: bool
+        """
+
+        return self.num_elements == 0
+
+    def push(self, new_value):
+        """
+        Add the given value to the start of the list.
+
+        :param new_value: new value to add to the beginning of the list
+        :type new_value: object
+        """
+
+        self.insert(0, new_value)
+
+    def append(self, new_value):
+        """
+        Append new value to the end of the list.
+
+        :param new_value: new value to append to list
+        :type new_value: object
+        """
+
+        self.insert(len(self), new_value)
+
+    def find_index_of_value(self, value_to_find):
+        """
+        Find the index of the first occurrence of the given value in
+        the list. If it is not found, return -1 to signify that the
+        value was not found.
+
+        The values aren't in any particular order, so this still has to
+        look at each element in turn.
+
+        :param value_to_find: value to look for in the elements of the
+                              list
+        :type value_to_find: object
+
+        :returns: index of the first element matching the given value
+                  (or -1 if the value was not found in the list at all)
+        :rtype: int
+        """
+
+        for index, value in enumerate(self):
+            if value == value_to_find:
+                return index
+
+        return -1
+
+    def __len__(self):
+        """
+        Return the number of elements that are in the list.
+
+        :returns: number of elements in list
+        :rtype: int
+        """
+
+        return self.num_elements
+
+    def __iter__(self):
+        """
+        Iterate over the values of the list from the first to the last.
+
+        :returns: generator of values
+        :rtype: generator
+        """
+
+        current_node = self.header_node.next_nodes[0]
+        while current_node is not None:
+            yield current_node.value
+            current_node = current_node.next_nodes[0]
+
+    def __getitem__(self, index):
+        """
+        Return the value at the given index (negative indices count
+        from the end of the list).
+
+        :param index: index
+        :type index: int
+
+        :returns: value at the index
+        :rtype: object
+
+        :raises IndexError: if the index is out of range
+        :raises TypeError: if the index is not an integer
+        """
+
+        # Like a Python list, accept anything that can stand in for an
+        # integer (see `operator.index`) and nothing else
+        try:
+            index = operator.index(index)
+        except TypeError:
+            raise TypeError("Skip list indices must be integers, not {}."
+                            .format(type(index).__name__))
+
+        if index < 0:
+            index += len(self)
+        if index < 0 or index >= len(self):
+            raise IndexError("Skip list index out of range.")
+
+        return self._node_at(index).value
+
+    def __str__(self):
+        """
+        Return a string representation of the `IndexableSkipList`
+        object (in double braces, like `LinkedList`).
+
+        :returns: string representation of the `IndexableSkipList`
+                  object
+        :rtype: str
+        """
+
+        return "[[{}]]".format(", ".join(str(value) for value in self))
+
+    def remove_value(self, value_to_remove):
+        """
+        Find and remove the first occurrence of the given value and
+        return True if the removal was successful or False if the value
+        could not be located anywhere in the list.
+
+        :param value_to_remove: value to find/remove in the list
+        :type value_to_remove: object
+
+        :returns: whether or not the value was found/removed
+        :rtype: bool
+        """
+
+        index = self.find_index_of_value(value_to_remove)
+        if index == -1:
+            return False
+
+        self._delete(index)
+
+        return True
+
+    def subsequence(self, i, j):
+        """
+        Return a new `IndexableSkipList` object that consists of the
+        elements in the list that are from index `i` up to (but not
+        including) index `j`. If `j` represents a value that is larger
+        than the length of the list, just include the rest of the list.
+
+        The node at index `i` is found by skipping ahead, so only the
+        elements of the subsequence itself need to be walked through.
+
+        :param i: start index
+        :type i: int
+        :param j: stop index
+        :type j: int
+
+        :returns: new skip list consisting of a subsequence of the
+                  elements in the current list
+        :rtype: IndexableSkipList
+
+        :raises IndexError: if `i` is too large
+        :raises ValueError: if the list is emtpy or if `i`/`j` are
+                            invalid values or `i` is larger than `j`
+        """
+
+        if not all(isinstance(x, int) for x in [i, j]):
+            raise ValueError("Parameters i and j should be integer values.")
+
+        if i > j:
+            raise ValueError("Parameter i is larger than parameter j.")
+
+        if self.is_empty():
+            raise ValueError("Skip list is currently empty!")
+
+        if len(self) - 1 <= i:
+            raise IndexError("The value of i is too large. The skip list "
+                             "only contains {} elements.".format(len(self)))
+
+        return self.from_iterable(self._iter_from(i, min(j, len(self)) - i),
+                                  max_levels=self.max_levels)
+
+    def _iter_from(self, index, num_values):
+        """
+        Iterate over `num_values` values starting at the given (valid)
+        index.
+
+        :param index: start index
+        :type index: int
+        :param num_values: number of values
+        :type num_values: int
+
+        :returns: generator of values
+        :rtype: generator
+        """
+
+        if num_values <= 0:
+            return
+
+        current_node = self._node_at(index)
+        for _ in range(num_values):
+            yield current_node.value
+            current_node = current_node.next_nodes[0]
+
+    def pop_from_beginning(self):
+        """
+        Remove and return the first value.
+
+        :returns: value of first element
+        :rtype: object
+
+        :raises ValueError: if list is empty
+        """
+
+        if self.is_empty():
+            raise ValueError("Skip list is empty!")
+
+        return self._delete(0)
+
+    def pop_from_end(self):
+        """
+        Remove and return the last value.
+
+        :returns: value of last element
+        :rtype: object
+
+        :raises ValueError: if list is empty
+        """
+
+        if self.is_empty():
+            raise ValueError("Skip list is empty!")
+
+        return self._delete(len(self) - 1)
+
+    def delete_index(self, index):
+        """
+        Remove the element at the given index, shifting all succeeding
+        elements back by one. Return True if successful; False
+        otherwise.
+
+        :param index: index (starting from zero) of element to remove
+        :type index: int
+
+        :returns: boolean value confirming that the deletion was
+                  successful (or unsucessful)
+        :rtype: bool
+        """
+
+        if index < 0 or index >= len(self):
+            return False
+
+        self._delete(index)
+
+        return True
+
+    def __add__(self, other_skip_list):
+        """
+        Combine one skip list together with another (or any other
+        iterable) to make a larger skip list.
+
+        :param other_skip_list: other skip list
+        :type other_skip_list: IndexableSkipList
+
+        :returns: combined skip list
+        :rtype: IndexableSkipList
+        """
+
+        return self.from_iterable(chain(self, other_skip_list),
+                                  max_levels=self.max_levels)
+
+
+def main():
+
+    # Load the words of "War and Peace" into a skip list and then
+    # delete and look up words at some random positions
+    with open('data/war_and_peace.txt') as text_file:
+        skip_list = IndexableSkipList.from_iterable(
+            word for line in text_file for word in line.lower().split())
+
+    print("Length of skip_list: {}".format(len(skip_list)))
+
+    rng = random.Random(0)
+    for _ in range(5):
+        index = rng.randrange(len(skip_list))
+        print("Deleting skip_list[{}] ({})...".format(index,
+                                                     skip_list[index]))
+        skip_list.delete_index(index)
+
+    print("skip_list.subsequence(100000, 100010) = {}"
+          .format(str(skip_list.subsequence(100000, 100010))))
+    print("Length of skip_list: {}".format(len(skip_list)))
+
+    print("Program complete!")
+
+
+if __name__ == '__main__':
+    main()
@@ -1,5 +1,16 @@
 #!/usr/bin/env python
 from __future__ import print_function
+import bisect
+import operator
+import struct
+import sys
+import threading
+import time
+from array import array
+from collections import deque
+from io import StringIO
+
+from frequency_distribution import iter_text_chunks
 
 """
 In this exercise, follow along with text below sequentially instead of
@@ -183,18 +194,814 @@ list class.
      return values/types (if any).
 """
 
+"""
+One more thing about nodes before we get to the list itself. Every
+normal Python object carries around a dictionary (`__dict__`) that
+stores its attributes, which is what lets you tack new attributes onto
+an object whenever you want. That flexibility costs memory, and a
+linked list made from a whole novel has hundreds of thousands of
+nodes. By listing a class's attributes in `__slots__`, we tell Python
+to store exactly those attributes and nothing else, without a
+dictionary. `CompactNode` below behaves exactly like `Node`, but takes
+up much less memory, so it's the type of node that `LinkedList`
+actually uses. (Run `python benchmark_memory.py` to see the
+difference.)
+"""
+
+class CompactNode(object):
+    __slots__ = ('value', 'next_node')
+
+    def __init__(self, value=None, next_node=None):
+        self.value = value
+        self.next_node = next_node
+
+
+def lower_and_split(text):
+    """
+    Lower-case a piece of text and split it on whitespace.
+
+    :param text: text to tokenize
+    :type text: str
+
+    :returns: list of tokens
+    :rtype: list
+    """
+
+    return text.lower().split()
+
+
+def iter_file_tokens(text_path, tokenizer=None, chunk_size=1 << 16):
+    """
+    Iterate over the tokens in a text file, reading it in chunks of
+    `chunk_size` characters that never end in the middle of a word (see
+    `iter_text_chunks`), so the tokenizer only ever sees whole words.
+
+    :param text_path: path to text file
+    :type text_path: str
+    :param tokenizer: function that takes a piece of text and returns
+                      its tokens (`lower_and_split` by default)
+    :type tokenizer: function
+    :param chunk_size: number of characters to read at a time
+    :type chunk_size: int
+
+    :returns: generator of tokens
+    :rtype: generator
+    """
+
+    if tokenizer is None:
+        tokenizer = lower_and_split
+
+    for text in iter_text_chunks(text_path, chunk_size=chunk_size):
+        for token in tokenizer(text):
+            yield token
+
+
+# Binary files written by `LinkedList.dump` start with these bytes,
+# followed by the type of values in the file: b"s" for strings or b"q"
+# for integers (stored as 64-bit signed integers, like `array('q')`)
+BINARY_MAGIC = b"LLv1"
+
+
+def _read_exactly(fileobj, num_bytes):
+    """
+    Read exactly `num_bytes` bytes from a binary file.
+
+    :param fileobj: file to read from
+    :type fileobj: file
+    :param num_bytes: number of bytes to read
+    :type num_bytes: int
+
+    :returns: the bytes read
+    :rtype: bytes
+
+    :raises ValueError: if the file ends first
+    """
+
+    data = fileobj.read(num_bytes)
+    if len(data) != num_bytes:
+        raise ValueError("Binary linked list file is truncated.")
+
+    return data
+
+
+def _write_binary_block(fileobj, typecode, values):
+    """
+    Write a block of values to a binary linked list file (see
+    `LinkedList.dump`).
+
+    A block starts with the number of values in it. Integers follow as
+    an array of 64-bit integers. Strings follow as an array of their
+    lengths (in characters), then the number of bytes that they take up
+    when encoded as UTF-8 and then the encoded strings themselves, all
+    joined together, so that a whole block can be decoded at once.
+    Everything is written in little-endian byte order.
+
+    :param fileobj: file to write to
+    :type fileobj: file
+    :param typecode: "s" for strings or "q" for integers
+    :type typecode: str
+    :param values: values to write
+    :type values: list
+    """
+
+    fileobj.write(struct.pack('<I', len(values)))
+    if typecode == 'q':
+        packed = array('q', values)
+    else:
+        packed = array('I', [len(value) for value in values])
+    if sys.byteorder == 'big':
+        packed.byteswap()
+    fileobj.write(packed.tobytes())
+
+    if typecode == 's':
+        text = "".join(values).encode('utf-8', 'surrogatepass')
+        fileobj.write(struct.pack('<Q', len(text)))
+        fileobj.write(text)
+
+
+def _iter_binary_values(fileobj):
+    """
+    Iterate over the values in a binary linked list file (see
+    `LinkedList.dump`).
+
+    :param fileobj: file to read from
+    :type fileobj: file
+
+    :raises ValueError: if the file isn't a binary linked list file or
+                        is truncated
+    """
+
+    header = _read_exactly(fileobj, len(BINARY_MAGIC) + 1)
+    typecode = header[len(BINARY_MAGIC):]
+    if header[:len(BINARY_MAGIC)] != BINARY_MAGIC or typecode not in (b"s",
+                                                                      b"q"):
+        raise ValueError("Not a binary linked list file.")
+
+    while True:
+        num_values = struct.unpack('<I', _read_exactly(fileobj, 4))[0]
+        if num_values == 0:
+            return
+
+        if typecode == b"q":
+            values = array('q')
+            values.frombytes(_read_exactly(fileobj, 8*num_values))
+            if sys.byteorder == 'big':
+                values.byteswap()
+            for value in values:
+                yield value
+            continue
+
+        lengths = array('I')
+        lengths.frombytes(_read_exactly(fileobj,
+                                        lengths.itemsize*num_values))
+        if sys.byteorder == 'big':
+            lengths.byteswap()
+        num_bytes = struct.unpack('<Q', _read_exactly(fileobj, 8))[0]
+        text = _read_exactly(fileobj, num_bytes).decode('utf-8',
+                                                        'surrogatepass')
+        start = 0
+        for length in lengths:
+            yield text[start:start + length]
+            start += length
+
+
+def _split_chain(first_node, num_nodes):
+    """
+    Cut a chain of nodes after its first `num_nodes` nodes and return
+    the first node of the rest of the chain (or None if the chain is
+    not longer than that).
+
+    :param first_node: first node of the chain (or None)
+    :type first_node: CompactNode
+    :param num_nodes: number of nodes to keep in the first part
+    :type num_nodes: int
+
+    :returns: first node of the rest of the chain
+    :rtype: CompactNode or None
+    """
+
+    current_node = first_node
+    for _ in range(num_nodes - 1):
+        if current_node is None:
+            return None
+        current_node = current_node.next_node
+
+    if current_node is None:
+        return None
+
+    rest = current_node.next_node
+    current_node.next_node = None
+
+    return rest
+
+
+def _merge_chains(left_node, right_node, right_goes_first):
+    """
+    Merge two sorted chains of nodes into one sorted chain by relinking
+    their nodes (nothing is copied). When two nodes are tied, the one
+    from the left chain goes first, so the merge is stable.
+
+    :param left_node: first node of the left chain
+    :type left_node: CompactNode
+    :param right_node: first node of the right chain
+    :type right_node: CompactNode
+    :param right_goes_first: function that takes a node from each chain
+                             and returns True if the right one should
+                             come first
+    :type right_goes_first: function
+
+    :returns: the first and last nodes of the merged chain
+    :rtype: tuple
+    """
+
+    # Start the merged chain off with a placeholder node so that there
+    # is always a node to link the next node onto
+    start_node = CompactNode()
+    last_node = start_node
+    while left_node is not None and right_node is not None:
+        if right_goes_first(left_node, right_node):
+            last_node.next_node = right_node
+            last_node = right_node
+            right_node = right_node.next_node
+        else:
+            last_node.next_node = left_node
+            last_node = left_node
+            left_node = left_node.next_node
+
+    # Whatever is left over in one of the chains goes at the end
+    last_node.next_node = left_node if left_node is not None else right_node
+    while last_node.next_node is not None:
+        last_node = last_node.next_node
+
+    return start_node.next_node, last_node
+
+
+def _comparison(key, reverse, cached_keys=None):
+    """
+    Make a function for `_merge_chains` that compares two nodes by the
+    keys of their values.
+
+    :param key: function for getting a value's sort key (or None to
+                compare the values themselves)
+    :type key: function or None
+    :param reverse: whether larger keys should go first
+    :type reverse: bool
+    :param cached_keys: dictionary mapping nodes to their keys that
+                        have already been computed (used instead of
+                        `key` if given)
+    :type cached_keys: dict or None
+
+    :returns: comparison function
+    :rtype: function
+    """
+
+    if cached_keys is not None:
+        get_key = cached_keys.__getitem__
+    elif key is not None:
+        get_key = lambda node: key(node.value)
+    else:
+        get_key = lambda node: node.value
+
+    if reverse:
+        return lambda left, right: get_key(left) < get_key(right)
+    return lambda left, right: get_key(right) < get_key(left)
+
+
+class NodePool:
+    """
+    Pool of spare nodes for a linked list to reuse.
+
+    A program that keeps adding values to a list and removing them
+    again (e.g., a queue) creates and throws away a new node for every
+    value. Creating objects takes time, and creating lots of them also
+    makes Python's garbage collector run more often. Instead, a list
+    with a pool gives the nodes it removes to the pool, which keeps up
+    to `max_size` of them, and takes nodes from the pool when it needs
+    new ones.
+
+    The spare nodes are kept in a linked list of their own: each spare
+    node's `next_node` points to the next spare node.
+    """
+
+    def __init__(self, node_type, max_size):
+        """
+        Initialize an empty node pool.
+
+        :param node_type: type of node to create when the pool is empty
+        :type node_type: type
+        :param max_size: maximum number of spare nodes to keep
+        :type max_size: int
+
+        :raises ValueError: if `max_size` is negative
+        """
+
+        if max_size < 0:
+            raise ValueError("max_size must not be negative.")
+
+        self.node_type = node_type
+        self.max_size = max_size
+        self.first_spare_node = None
+        self.size = 0
+
+        # Statistics
+        self.num_created = 0
+        self.num_reused = 0
+        self.num_given_back = 0
+        self.num_discarded = 0
+
+    def take(self, value, next_node):
+        """
+        Get a node for a new value, reusing a spare node if there is one
+        and creating a new node otherwise.
+
+        :param value: value for the node
+        :type value: object
+        :param next_node: node that the node should link to
+        :type next_node: CompactNode
+
+        :returns: the node
+        :rtype: CompactNode
+        """
+
+        node = self.first_spare_node
+        if node is None:
+            self.num_created += 1
+            return self.node_type(value=value, next_node=next_node)
+
+        self.first_spare_node = node.next_node
+        self.size -= 1
+        self.num_reused += 1
+        node.value = value
+        node.next_node = next_node
+
+        return node
+
+    def give_back(self, node):
+        """
+        Give a node that has been removed from a list to the pool (if
+        the pool is full, the node is simply thrown away).
+
+        :param node: the removed node
+        :type node: CompactNode
+        """
+
+        self.num_given_back += 1
+        if self.size >= self.max_size:
+            self.num_discarded += 1
+            return
+
+        # Don't keep the node's value alive while the node is unused
+        node.value = None
+        node.next_node = self.first_spare_node
+        self.first_spare_node = node
+        self.size += 1
+
+    def stats(self):
+        """
+        Return statistics about the pool: how many nodes it currently
+        holds (`size`) and can hold (`max_size`), how many nodes it has
+        had to create (`num_created`), how many times it has handed out
+        a spare node (`num_reused`) and how many nodes have been given
+        back to it (`num_given_back`), not all of which it could keep
+        (`num_discarded`).
+
+        :returns: dictionary of statistics
+        :rtype: dict
+        """
+
+        return {'size': self.size,
+                'max_size': self.max_size,
+                'num_created': self.num_created,
+                'num_reused': self.num_reused,
+                'num_given_back': self.num_given_back,
+                'num_discarded': self.num_discarded}
+
+
 class LinkedList:
     """
     Python implementation of a linked list.
     """
 
-    def __init__(self):
+    # The type of node that the list is made up of (subclasses that
+    # need nodes with extra links can swap in a different type here)
+    node_type = CompactNode
+
+    # Maximum number of elements shown by `__str__` and `__repr__`
+    # (None means show all of them)
+    str_max_elements = None
+    repr_max_elements = 20
+
+    # Number of values that `write_to` writes out at a time
+    write_batch_size = 1024
+
+    # Number of values written at a time by `dump`
+    dump_block_size = 1 << 16
+
+    def __init__(self, indexed=False, pool_size=None):
         """
         Initialize an empty linked list (other than a header node that
         points to nothing).
+
+        Besides the header node, the list also keeps a reference to its
+        last node (`tail_node`) and a count of its elements
+        (`num_elements`). When the list is empty, `tail_node` is simply
+        the header node. Every method that adds or removes nodes does
+        so through `_link_after` or `_unlink_after`, which keep both of
+        these attributes up to date, so that `append` and `__len__`
+        never need to walk through the list.
+
+        If `indexed` is True, the list also keeps a hash index of its
+        values: `value_index` maps each value to the nodes holding it
+        (in list order), `node_predecessors` maps each node to the node
+        before it and `node_ordinals` maps each node to a number that
+        increases along the list, from which positions can be worked
+        out. With the index, `in` tests, `find_index_of_value` and
+        `remove_value` don't have to search through the list, at the
+        cost of extra memory per element. (Values must be hashable in
+        this mode.)
+
+        The costs of the index are as follows. Adding or removing a
+        value at either end of the list is O(1). Removing a value from
+        the middle records its ordinal in `removed_ordinals`, so that
+        `find_index_of_value` can subtract the removed nodes before a
+        node from its ordinal in O(log r) (for r removed ordinals),
+        which costs O(r) to keep sorted (a fast memory move) and an
+        O(n) renumbering once r grows past the length of the list
+        (amortized O(1)). Inserting a value into the middle, however,
+        walks forward to the next node with the same value (O(n) in the
+        worst case), and the positions of all of the nodes after it
+        shift, so the next `find_index_of_value` renumbers the whole
+        list (O(n)). Alternating middle insertions with lookups is
+        therefore O(n) per lookup.
+
+        If `pool_size` is given, nodes removed from the list are kept
+        in a `NodePool` (of up to `pool_size` nodes) and reused for new
+        values instead of creating new nodes (see `NodePool`). Don't
+        hold on to nodes after removing them from a list with a pool,
+        since they may come back with a different value.
+
+        :param indexed: whether or not to keep a value index
+        :type indexed: bool
+        :param pool_size: maximum number of removed nodes to keep for
+                          reuse (None means don't reuse nodes)
+        :type pool_size: int or None
+        """
+
+        self.node_pool = (None if pool_size is None
+                          else NodePool(self.node_type, pool_size))
+
+        self.header_node = self.node_type()
+        self.tail_node = self.header_node
+        self.num_elements = 0
+
+        self.indexed = indexed
+        self.value_index = {} if indexed else None
+        self.node_predecessors = {} if indexed else None
+        self.node_ordinals = {} if indexed else None
+        self.first_ordinal = 0
+
+        # Removing a node from the middle of the list shifts the
+        # positions of all of the nodes after it down by one, so,
+        # rather than renumbering them, the removed node's ordinal is
+        # kept (in order) and subtracted when a position is worked out
+        self.removed_ordinals = [] if indexed else None
+
+        # Inserting a node into the middle shifts the positions of the
+        # nodes after it up by one, and there is no free ordinal to give
+        # it, so the ordinals are marked stale and renumbered in one
+        # pass when a position is next needed
+        self.ordinals_stale = False
+
+    def _new_empty(self):
+        """
+        Make a new, empty list of the same type and with the same
+        settings as this one.
+
+        :returns: empty linked list
+        :rtype: LinkedList
+        """
+
+        return self.__class__(**self._settings())
+
+    def _settings(self):
+        """
+        Return the keyword arguments needed to make a new list with the
+        same settings as this one.
+
+        :returns: constructor keyword arguments
+        :rtype: dict
+        """
+
+        return {'indexed': self.indexed, 'pool_size': self.pool_size}
+
+    @property
+    def pool_size(self):
+        """
+        Maximum number of nodes kept in the list's node pool (or None if
+        the list doesn't have one).
+
+        :returns: maximum pool size
+        :rtype: int or None
+        """
+
+        if self.node_pool is None:
+            return None
+        return self.node_pool.max_size
+
+    def _link_after(self, prev_node, new_value):
+        """
+        Insert a new node with the given value directly after
+        `prev_node` and return the new node.
+
+        :param prev_node: node after which to insert the new node (may
+                          be the header node)
+        :type prev_node: CompactNode
+        :param new_value: value of the new node
+        :type new_value: object
+
+        :returns: the newly-inserted node
+        :rtype: CompactNode
+        """
+
+        if self.node_pool is None:
+            new_node = self.node_type(value=new_value,
+                                      next_node=prev_node.next_node)
+        else:
+            new_node = self.node_pool.take(new_value, prev_node.next_node)
+        prev_node.next_node = new_node
+
+        # If we just inserted after the last node, the new node is now
+        # the last node
+        if prev_node is self.tail_node:
+            self.tail_node = new_node
+        self.num_elements += 1
+
+        if self.indexed:
+            self._index_link(prev_node, new_node)
+
+        return new_node
+
+    def _unlink_after(self, prev_node):
+        """
+        Remove the node directly after `prev_node` from the list and
+        return it.
+
+        :param prev_node: node preceding the node to remove (may be the
+                          header node)
+        :type prev_node: CompactNode
+
+        :returns: the removed node
+        :rtype: CompactNode
+        """
+
+        removed_node = prev_node.next_node
+        prev_node.next_node = removed_node.next_node
+
+        # If we just removed the last node, the node before it is now
+        # the last node (or the header node if the list is now empty)
+        if removed_node is self.tail_node:
+            self.tail_node = prev_node
+        self.num_elements -= 1
+
+        if self.indexed:
+            self._index_unlink(prev_node, removed_node)
+
+        removed_node.next_node = None
+
+        return removed_node
+
+    def _remove_after(self, prev_node):
+        """
+        Remove the node directly after `prev_node` from the list and
+        return its value, handing the node over to the node pool (if
+        there is one).
+
+        :param prev_node: node preceding the node to remove (may be the
+                          header node)
+        :type prev_node: CompactNode
+
+        :returns: value of the removed node
+        :rtype: object
+        """
+
+        removed_node = self._unlink_after(prev_node)
+        value = removed_node.value
+        if self.node_pool is not None:
+            self.node_pool.give_back(removed_node)
+
+        return value
+
+    def _index_link(self, prev_node, new_node):
+        """
+        Add a node that was just linked in after `prev_node` to the
+        value index.
+
+        :param prev_node: node preceding the new node
+        :type prev_node: CompactNode
+        :param new_node: the new node
+        :type new_node: CompactNode
+        """
+
+        next_node = new_node.next_node
+        self.node_predecessors[new_node] = prev_node
+        if next_node is not None:
+            self.node_predecessors[next_node] = new_node
+
+        nodes = self.value_index.get(new_node.value)
+        if nodes is None:
+            nodes = self.value_index[new_node.value] = deque()
+
+        if prev_node is self.header_node:
+
+            # Pushed onto the front: it's the first occurrence of its
+            # value and its ordinal comes before all of the others
+            nodes.appendleft(new_node)
+            self.first_ordinal -= 1
+            self.node_ordinals[new_node] = self.first_ordinal
+        elif next_node is None:
+
+            # Appended onto the end: it's the last occurrence of its
+            # value and its ordinal comes after all of the others
+            nodes.append(new_node)
+            self.node_ordinals[new_node] = self.node_ordinals[prev_node] + 1
+        else:
+
+            # Inserted somewhere in the middle: find the next node with
+            # the same value (if any) to figure out where the new node
+            # goes among the other nodes with its value
+            current_node = next_node
+            while (current_node is not None
+                   and current_node.value != new_node.value):
+                current_node = current_node.next_node
+            if current_node is None:
+                nodes.append(new_node)
+            else:
+                nodes.insert(nodes.index(current_node), new_node)
+            self.node_ordinals[new_node] = self.node_ordinals[prev_node]
+            self.ordinals_stale = True
+
+    def _index_unlink(self, prev_node, removed_node):
+        """
+        Remove a node that was just unlinked from after `prev_node`
+        from the value index.
+
+        :param prev_node: node that preceded the removed node
+        :type prev_node: CompactNode
+        :param removed_node: the removed node
+        :type removed_node: CompactNode
+        """
+
+        next_node = prev_node.next_node
+        del self.node_predecessors[removed_node]
+        if next_node is not None:
+            self.node_predecessors[next_node] = prev_node
+
+        # The removed node is usually the first (`remove_value`,
+        # `pop_from_beginning`) or last (`pop_from_end`) occurrence of
+        # its value
+        nodes = self.value_index[removed_node.value]
+        if nodes[0] is removed_node:
+            nodes.popleft()
+        elif nodes[-1] is removed_node:
+            nodes.pop()
+        else:
+            nodes.remove(removed_node)
+        if not nodes:
+            del self.value_index[removed_node.value]
+
+        # Removed ordinals always lie between the first ordinal and the
+        # last node's ordinal, so that pushing or appending a node never
+        # hands out an ordinal that is counted as removed
+        ordinal = self.node_ordinals.pop(removed_node)
+        removed_ordinals = self.removed_ordinals
+        if prev_node is self.header_node:
+            self.first_ordinal = (ordinal + 1 if next_node is None
+                                  else self.node_ordinals[next_node])
+            if (removed_ordinals
+                    and removed_ordinals[0] < self.first_ordinal):
+                del removed_ordinals[:bisect.bisect_left(removed_ordinals,
+                                                         self.first_ordinal)]
+        elif next_node is None:
+            last_ordinal = self.node_ordinals[prev_node]
+            if removed_ordinals and removed_ordinals[-1] > last_ordinal:
+                del removed_ordinals[bisect.bisect_right(removed_ordinals,
+                                                         last_ordinal):]
+        elif not self.ordinals_stale:
+            bisect.insort(removed_ordinals, ordinal)
+            if len(removed_ordinals) > self.num_elements:
+                self._renumber()
+
+    def _index_chain(self, prev_node):
+        """
+        Add all of the nodes following `prev_node` to the value index,
+        as if they had just been appended one after the other (for
+        operations that link in a whole chain of nodes at once).
+
+        :param prev_node: node preceding the first node to add to the
+                          index (the old last node)
+        :type prev_node: CompactNode
+        """
+
+        current_node = prev_node.next_node
+        while current_node is not None:
+            nodes = self.value_index.get(current_node.value)
+            if nodes is None:
+                nodes = self.value_index[current_node.value] = deque()
+            nodes.append(current_node)
+            self.node_predecessors[current_node] = prev_node
+            self.node_ordinals[current_node] = (
+                self.first_ordinal if prev_node is self.header_node
+                else self.node_ordinals[prev_node] + 1)
+            prev_node = current_node
+            current_node = current_node.next_node
+
+    def _renumber(self):
+        """
+        Reassign the ordinals of all of the nodes so that they are
+        equal to their positions in the list.
+        """
+
+        ordinal = 0
+        current_node = self.header_node.next_node
+        while current_node is not None:
+            self.node_ordinals[current_node] = ordinal
+            ordinal += 1
+            current_node = current_node.next_node
+
+        self.first_ordinal = 0
+        del self.removed_ordinals[:]
+        self.ordinals_stale = False
+
+    def _rebuild_index(self):
+        """
+        Rebuild the value index from scratch in one pass over the list
+        (for operations that relink many nodes at once).
+        """
+
+        self.value_index.clear()
+        self.node_predecessors.clear()
+        self.node_ordinals.clear()
+        del self.removed_ordinals[:]
+
+        ordinal = 0
+        prev_node = self.header_node
+        current_node = prev_node.next_node
+        while current_node is not None:
+            nodes = self.value_index.get(current_node.value)
+            if nodes is None:
+                nodes = self.value_index[current_node.value] = deque()
+            nodes.append(current_node)
+            self.node_predecessors[current_node] = prev_node
+            self.node_ordinals[current_node] = ordinal
+            ordinal += 1
+            prev_node = current_node
+            current_node = current_node.next_node
+
+        self.first_ordinal = 0
+        del self.removed_ordinals[:]
+        self.ordinals_stale = False
+
+    def _indexed_nodes(self, value):
+        """
+        Look up the nodes holding the given value in the value index.
+
+        :param value: value to look up
+        :type value: object
+
+        :returns: nodes holding the value in list order (or None if
+                  there are none)
+        :rtype: collections.deque or None
+        """
+
+        # An unhashable value can't have been added to an indexed list
+        try:
+            return self.value_index.get(value)
+        except TypeError:
+            return None
+
+    def _node_at(self, index):
+        """
+        Return the node at the given index, where index -1 refers to
+        the header node.
+
+        :param index: index of the node (from -1 up to the length of
+                      the list minus one)
+        :type index: int
+
+        :returns: node at the given index
+        :rtype: CompactNode
         """
 
-        self.header_node = Node()
+        # Traverse the list starting from the header node, which
+        # precedes the node at index 0, so it's as if it were at index
+        # -1
+        i = -1
+        current_node = self.header_node
+        while i < index:
+            i += 1
+            current_node = current_node.next_node
+
+        return current_node
 
     def is_empty(self):
         """
@@ -216,472 +1023,1854 @@ class LinkedList:
         Add new node with the given value to the start of the list,
         "pushing" or shifting all other nodes one index forward.
 
-        :param new_value: new value to add to the beginning of the list
-        :type new_value: object
+        :param new_value: new value to add to the beginning of the list
+        :type new_value: object
+
+        :returns: the new node
+        :rtype: CompactNode
+        """
+
+        # Create a new Node with the given value and make it the node
+        # that `header_node`'s `next_node` attribute points to (the
+        # current first node in the list then becomes the new node's
+        # `next_node`)
+        return self._link_after(self.header_node, new_value)
+
+    def append(self, new_value):
+        """
+        Append new value to the end of the linked list.
+
+        This is doing something very similar to what `push` is doing:
+        it adds a new value to the list, but it tacks it onto the end
+        rather than onto the beginning. A naive implementation would
+        have to start at the header node and traverse the whole list to
+        find the last node every time a value is appended. Since the
+        list keeps a reference to its last node in `tail_node`, though,
+        appending is just as cheap as pushing: the new node is linked in
+        after `tail_node` and then becomes the new `tail_node`. If the
+        list is empty, `tail_node` is the header node, so the new node
+        becomes the one and only node (other than the header node, of
+        course) in the list.
+
+        :param new_value: new value to append to list (inside a node)
+        :type new_value: object (basically, this means any type)
+
+        :returns: the new node
+        :rtype: CompactNode
+        """
+
+        return self._link_after(self.tail_node, new_value)
+
+    def find_index_of_value(self, value_to_find):
+        """
+        Find the index of the first occurrence of the given value in
+        the list. If it is not found, return -1 to signify that the
+        value was not found.
+
+        :param value_to_find: value to look for in the elements of the
+                              linked list
+        :type value_to_find: object
+
+        :returns: index of the first element matching the given value
+                  (or -1 if the value was not found in the list at all)
+        :rtype: int
+        """
+
+        # If the list keeps a value index, we can look up the first
+        # node holding the value and work out its position from its
+        # ordinal (less the ordinals of the nodes removed before it)
+        # without searching
+        if self.indexed:
+            nodes = self._indexed_nodes(value_to_find)
+            if nodes is None:
+                return -1
+            if self.ordinals_stale:
+                self._renumber()
+            ordinal = self.node_ordinals[nodes[0]]
+            return (ordinal - self.first_ordinal
+                    - bisect.bisect_left(self.removed_ordinals, ordinal))
+
+        # Let's first check to see if the list is empty by calling the
+        # object's `is_empty` function, which simply looks to see if
+        # the object's `header_node`'s `next_node` attribute is equal
+        # to `None`
+        if self.is_empty():
+            return -1
+
+        # If the list is not empty, let's start at the first real node,
+        # i.e., the node that is pointed to by `header_node.next_node`
+        current_node = self.header_node.next_node
+
+        # Loop through the elements of the list and keep a counter for
+        # the index
+        index = 0
+        while True:
+
+            # If the value of the current node is equal to the value
+            # we're trying to find, then return the value of `index`
+            # since we're finished
+            if current_node.value == value_to_find:
+                return index
+
+            # Otherwise, check if this is the last node and, if so,
+            # return -1 since that means the value was nowhere to be
+            # found
+            if current_node.next_node is None:
+                return -1
+
+            # Move forward one node and increment the counter
+            # Note: Notice that I am not using an `else` statement here
+            # (or even above after the second `if` block). Why/how can
+            # I do this? The reason is that the `if` condition, if met,
+            # would lead to a situation where the code below it would
+            # never be executed. Thus, logically, there is no need to
+            # put an `else` statement. This is naturally an `else`
+            # statement.
+            current_node = current_node.next_node
+            index += 1
+
+    # Note: Python includes something called "magic" methods. They are
+    # a set of predefined method/function names that allow objects to
+    # be used in certain very useful ways if they are implemented. For
+    # example, `__len__` is one of these so-called magic functions. If
+    # you create a custom class (as we are doing here), implementing a
+    # `__len__` function will mean that we will be able to call `len`
+    # on an object of type `LinkedList`. For example, consider the code
+    # below:
+    #
+    # >>> x = LinkedList()
+    # >>> x.push(5)
+    # >>> x.push(6)
+    # >>> print(len(x))
+    #
+    # The call to `print` will print out the length of `x` (should be
+    # 2). You might ask how `len` can be called since what actually was
+    # implemented was called `__len__`, but just know that this is the
+    # magic part. In Python, the `len` function can be used on many
+    # different types of objects (actually, any object for which
+    # `__len__` is implemented). It's nice to be able to print out the
+    # length of a list or the number of elements in a set or the number
+    # of keys in a dictionary, etc. But, we could implement `__len__`
+    # to do something weird, like return the value 67 no matter what.
+    # This would be kind of dumb, but it would be possible. The point
+    # is just to demonstrate this capability in Python. Other magic
+    # methods include `__add__` (which allow objects to be added
+    # together via the `+` operator), `__sub__` (same thing, but with
+    # `-`), `__mult__` (same thing, but with `*`), etc. We could
+    # implement `__len__` by counting the elements one by one until we
+    # get to the end, but, since the list already keeps count of its
+    # elements in `num_elements`, we can just return that. I am going
+    # to implement another magic method here called `__str__`, which
+    # allows you to specify the way the object should be "printed",
+    # i.e., how you want to represent it. Let's use double braces to
+    # distinguish objects of type `LinkedList` from objects that are
+    # just regular Python lists.
+    def __len__(self):
+        """
+        Return the number of elements that are in the list (not
+        including the header node that does not contain an element).
+        
+        :returns: number of elements in list
+        :rtype: int
+        """
+
+        return self.num_elements
+
+    def __contains__(self, value):
+        """
+        Return True if the given value is in the list; False otherwise.
+        This is another magic method: it's what gets called when you
+        use the `in` operator, e.g., "'the' in linked_list".
+
+        :param value: value to look for
+        :type value: object
+
+        :returns: whether or not the value is in the list
+        :rtype: bool
+        """
+
+        if self.indexed:
+            return self._indexed_nodes(value) is not None
+
+        return self.find_index_of_value(value) != -1
+
+    def __iter__(self):
+        """
+        Iterate over the values of the list from the first to the last,
+        one node at a time. This is the magic method that lets you loop
+        over the list directly, e.g.:
+
+        >>> for value in linked_list:
+        ...     print(value)
+
+        :returns: generator of values
+        :rtype: generator
+        """
+
+        current_node = self.header_node.next_node
+        while current_node is not None:
+            yield current_node.value
+            current_node = current_node.next_node
+
+    def islice(self, start, stop=None, step=1):
+        """
+        Iterate over the values from index `start` up to (but not
+        including) index `stop` (or the end of the list if `stop` is
+        None), taking every `step`th value, like `itertools.islice`.
+        Nothing is copied: the values are produced one at a time as the
+        list is walked.
+
+        :param start: start index
+        :type start: int
+        :param stop: stop index (or None)
+        :type stop: int or None
+        :param step: step size
+        :type step: int
+
+        :returns: generator of values
+        :rtype: generator
+
+        :raises ValueError: if any of the arguments are negative or if
+                            `step` is zero
+        """
+
+        if start < 0 or (stop is not None and stop < 0) or step < 1:
+            raise ValueError("start and stop must be non-negative and step "
+                             "must be positive.")
+
+        if stop is None or stop > len(self):
+            stop = len(self)
+        if start >= stop:
+            return
+
+        # Find the node at index `start` and walk forward from there
+        current_node = self._node_at(start)
+        index = start
+        while True:
+            yield current_node.value
+            for _ in range(step):
+                current_node = current_node.next_node
+                index += 1
+                if index >= stop:
+                    return
+
+    def _iter_slice(self, start, stop, step):
+        """
+        Iterate over the values selected by a slice whose `start`,
+        `stop` and `step` have already been resolved with
+        `slice.indices`.
+
+        :param start: start index
+        :type start: int
+        :param stop: stop index
+        :type stop: int
+        :param step: step size (may be negative)
+        :type step: int
+
+        :returns: generator of values
+        :rtype: generator
+        """
+
+        if step > 0:
+            for value in self.islice(start, stop, step):
+                yield value
+            return
+
+        # The nodes only link forward, so, to go backward, the selected
+        # part of the list has to be collected first
+        indices = range(start, stop, step)
+        if len(indices) == 0:
+            return
+        values = list(self.islice(indices[-1], start + 1))
+        for value in values[::step]:
+            yield value
+
+    def __getitem__(self, index):
+        """
+        Return the value at the given index (negative indices count
+        from the end of the list, like with a Python list) or, if a
+        slice is given, e.g., "linked_list[10:20]", a `LinkedListView`
+        of that part of the list. The view doesn't copy anything until
+        it is iterated over or turned into a new list with
+        `to_linked_list`.
+
+        :param index: index or slice
+        :type index: int or slice
+
+        :returns: value at the index or view of the slice
+        :rtype: object or LinkedListView
+
+        :raises IndexError: if the index is out of range
+        :raises TypeError: if the index is neither an integer nor a
+                           slice
+        """
+
+        if isinstance(index, slice):
+            return LinkedListView(self, index)
+
+        # Like a Python list, accept anything that can stand in for an
+        # integer (see `operator.index`) and nothing else
+        try:
+            index = operator.index(index)
+        except TypeError:
+            raise TypeError("Linked list indices must be integers or "
+                            "slices, not {}.".format(type(index).__name__))
+
+        if index < 0:
+            index += len(self)
+        if index < 0 or index >= len(self):
+            raise IndexError("Linked list index out of range.")
+
+        return self._node_at(index).value
+
+    def __str__(self):
+        """
+        Return a string representation of the `LinkedList` object.
+
+        If the class attribute `str_max_elements` is set to a number,
+        only that many elements are shown (see `to_string`).
+
+        :returns: string representation of the `LinkedList` object
+        :rtype: str
+        """
+
+        return self.to_string(max_elements=self.str_max_elements)
+
+    def __repr__(self):
+        """
+        Return a string representation of the `LinkedList` object that
+        shows at most `repr_max_elements` elements (so that a list with
+        hundreds of thousands of elements doesn't flood the screen or a
+        log file when it shows up in the interpreter or in an error
+        message).
+
+        :returns: string representation of the `LinkedList` object
+        :rtype: str
+        """
+
+        return self.to_string(max_elements=self.repr_max_elements)
+
+    def to_string(self, max_elements=None):
+        """
+        Return a string representation of the `LinkedList` object,
+        e.g., "[[a, b, c]]", or, if only the first three of a list of
+        120345 elements are shown, "[[a, b, c, ... (n=120345)]]".
+
+        :param max_elements: maximum number of elements to show (None
+                             means show all of them)
+        :type max_elements: int or None
+
+        :returns: string representation of the `LinkedList` object
+        :rtype: str
+        """
+
+        # Build the string in memory using the same code that writes it
+        # out to a file
+        string_file = StringIO()
+        self.write_to(string_file, max_elements=max_elements)
+
+        return string_file.getvalue()
+
+    def write_to(self, fileobj, max_elements=None):
+        """
+        Write the string representation of the `LinkedList` object (see
+        `to_string`) to a file (or any object with a `write` method)
+        without building the whole string in memory.
+
+        A naive way of building the string would be to start with an
+        empty string and add ", " and the next value to it for every
+        node. But strings can't be changed, so each addition creates a
+        brand new string and copies everything that came before into
+        it, which takes time proportional to the square of the length
+        of the list. Instead, the values are converted to strings and
+        written out a batch at a time.
+
+        :param fileobj: file to write to
+        :type fileobj: file
+        :param max_elements: maximum number of elements to show (None
+                             means show all of them)
+        :type max_elements: int or None
+        """
+
+        if max_elements is None:
+            max_elements = len(self)
+
+        fileobj.write("[[")
+
+        # Nothing needs to come before the first batch of values, but
+        # every batch after that has to be separated from the one
+        # before it
+        separator = ""
+        batch = []
+        num_written = 0
+        current_node = self.header_node.next_node
+        while current_node is not None and num_written < max_elements:
+            batch.append(str(current_node.value))
+            num_written += 1
+            if len(batch) == self.write_batch_size:
+                fileobj.write(separator)
+                fileobj.write(", ".join(batch))
+                separator = ", "
+                batch = []
+            current_node = current_node.next_node
+
+        if batch:
+            fileobj.write(separator)
+            fileobj.write(", ".join(batch))
+            separator = ", "
+
+        # Let the reader know how many elements were left out
+        if num_written < len(self):
+            fileobj.write(separator)
+            fileobj.write("... (n={})".format(len(self)))
+
+        fileobj.write("]]")
+
+    def remove_value(self, value_to_remove):
+        """
+        Find and remove the first occurrence of the given value and
+        return True if the removal was successful or False if the value
+        could not be located anywhere in the list.
+
+        :param value_to_remove: value to find/remove in the list
+        :tyep value_to_remove: object
+
+        :returns: whether or not the value was found/removed
+        :rtype: bool
+        """
+
+        # If it's empty, return False since there's nothing to remove
+        if self.is_empty():
+            return False
+
+        # If the list keeps a value index, we can look up the first node
+        # holding the value and the node preceding it directly
+        if self.indexed:
+            nodes = self._indexed_nodes(value_to_remove)
+            if nodes is None:
+                return False
+            self._remove_after(self.node_predecessors[nodes[0]])
+            return True
+
+        # Get the index of the value to remove (remember, that function
+        # will return -1 if it can't find the value in the list)
+        value_to_remove_index = self.find_index_of_value(value_to_remove)
+
+        # If `value_to_remove_index` is -1, that means the value was
+        # not found, so return False
+        if value_to_remove_index == -1:
+            return False
+
+        # Now traverse the list until we get to the node that is
+        # directly preceding the node we want to remove (starting at
+        # the header node, which precedes the node at index 0)
+        current_node = self.header_node
+        current_index = -1
+        while True:
+
+            # If we're at the node before the node we want to remove,
+            # we can stop and do the removal, i.e., make the current
+            # node skip over the next node
+            if current_index == value_to_remove_index - 1:
+                self._remove_after(current_node)
+                return True
+
+            current_node = current_node.next_node
+            current_index += 1
+
+    def remove_all(self, value_to_remove):
+        """
+        Remove every occurrence of the given value in a single pass and
+        return the number of elements that were removed.
+
+        :param value_to_remove: value to find/remove in the list
+        :type value_to_remove: object
+
+        :returns: number of elements removed
+        :rtype: int
+        """
+
+        # If the list keeps a value index, we can go straight to the
+        # nodes holding the value (each removal updates the predecessor
+        # of the next occurrence, so this works even if occurrences
+        # are right next to each other)
+        if self.indexed:
+            nodes = self._indexed_nodes(value_to_remove)
+            if nodes is None:
+                return 0
+            num_removed = len(nodes)
+            for _ in range(num_removed):
+                self._remove_after(self.node_predecessors[nodes[0]])
+            return num_removed
+
+        return self.remove_if(lambda value: value == value_to_remove)
+
+    def remove_if(self, predicate):
+        """
+        Remove every element for which `predicate(value)` returns True
+        in a single pass and return the number of elements that were
+        removed.
+
+        :param predicate: function that takes a value and returns
+                          whether or not it should be removed
+        :type predicate: function
+
+        :returns: number of elements removed
+        :rtype: int
+        """
+
+        # Walk the list while keeping a reference to the node preceding
+        # the current node. When the next node needs to be removed, the
+        # preceding node is simply made to skip over it (and it stays
+        # where it is, since the node after it is now a new node that
+        # still needs to be checked).
+        num_removed = 0
+        prev_node = self.header_node
+        while prev_node.next_node is not None:
+            if predicate(prev_node.next_node.value):
+                self._remove_after(prev_node)
+                num_removed += 1
+            else:
+                prev_node = prev_node.next_node
+
+        return num_removed
+
+    def subsequence(self, i, j):
+        """
+        Return a new `LinkedList` object that consists of the elements
+        in the object's linked list that are from index `i` up to (but
+        not including) index `j`. If `j` represents a value that is
+        larger than the length of the linked list, just include the
+        rest of the list.
+
+        :param i: start index
+        :type i: int
+        :param j: stop index
+        :type j: int
+
+        :returns: new linked list consisting of a subsequence of the
+                  elements in the current linked list
+        :rtype: LinkedList
+
+        :raises IndexError: if `i` is too large
+        :raises ValueError: if the linked list is emtpy or if `i`/`j`
+                            are invalid values or `i` is larger than `j`
+        """
+
+        # Check parameter values and make sure they make sense
+        if not all(isinstance(x, int) for x in [i, j]):
+            raise ValueError("Parameters i and j should be integer values.")
+
+        # Check if `i` is larger than `j`
+        if i > j:
+            raise ValueError("Parameter i is larger than parameter j.")
+
+        # Check if list is empty
+        if self.is_empty():
+            raise ValueError("Linked list is currently empty!")
+
+        # Make sure there are enough elements in the list given the
+        # value of `i`
+        if len(self) - 1 <= i:
+            raise IndexError("The value of i is too large. The linked list "
+                             "only contains {} elements.".format(len(self)))
+
+        # Check if the length of the subsequence is zero
+        if i == j:
+            return self._new_empty()
+
+        # Make a new `LinkedList` and append each element starting at
+        # index `i` in the current linked list and ending right before
+        # index `j` (or ending when the linked list ends, whichever
+        # comes first)
+        subsequence_list = self._new_empty()
+        current_node = self.header_node.next_node
+        current_index = 0
+        while current_index < j:
+
+            # Stop if we've gone past the end of the list
+            if current_node is None:
+                break
+
+            if current_index >= i:
+                subsequence_list.append(current_node.value)
+
+            current_node = current_node.next_node
+            current_index += 1
+
+        return subsequence_list
+
+    def pop_from_beginning(self):
+        """
+        Remove and return the value of the first node (after the header
+        node).
+
+        :returns: value of first node
+        :rtype: object
+        
+        :raises ValueError: if list is empty
+        """
+
+        # Check if the list is empty, in which case there's no node to
+        # remove/return
+        if self.is_empty():
+            raise ValueError("Linked list is empty!")
+
+        # Unlink the first node by making the header node point to the
+        # node after it and return its value
+        return self._remove_after(self.header_node)
+
+    def pop_from_end(self):
+        """
+        Remove and return the value of the last node.
+
+        :returns: value of first node
+        :rtype: object
+
+        :raises ValueError: if list is empty
+        """
+
+        # There is nothing to remove/return if the list is empty
+        if self.is_empty():
+            raise ValueError("Linked list is empty!")
+
+        # If the list keeps a value index, it knows which node precedes
+        # the last node
+        if self.indexed:
+            return self._remove_after(self.node_predecessors[self.tail_node])
+
+        # Even though we know which node is the last one (`tail_node`),
+        # the nodes only link forward, so we still have to traverse the
+        # list to find the second-to-last node, which will become the
+        # new last node
+        current_node = self.header_node
+        while current_node.next_node is not self.tail_node:
+            current_node = current_node.next_node
+
+        return self._remove_after(current_node)
+
+    def delete_index(self, index):
+        """
+        Remove the element at the given index, shifting all succeeding
+        elements back by one. Return True if successful; False
+        otherwise.
+
+        :param index: index (starting from zero) of element to remove
+        :type index: int
+
+        :returns: boolean value confirming that the deletion was
+                  successful (or unsucessful)
+        :rtype: bool
+        """
+
+        # Return False if the linked list is empty or if the index
+        # can't possibly be in the list
+        if self.is_empty() or index < 0 or index >= len(self):
+            return False
+
+        # Find the node preceding the one at `index` and make it point
+        # to the node following the element we want to delete (or to
+        # None if the element we want to delete happens to be the last
+        # element in the list)
+        self._remove_after(self._node_at(index - 1))
+        return True
+
+    """
+    Just for fun/extra credit, implement a "magic" Python method called
+    `__add__`. When implemented, this will enable one to "add" two
+    linked list instances together in a way similar to the way that one
+    can add together two lists in Python, e.g.:
+
+    >>> [1, 2, 3] + [4, 5, 6]      # [1, 2, 3, 4, 5, 6]
+
+    Implementing the `__add__` method will not just enable this
+    capability in a general sense, it will actually enable a user to
+    use the `+` operator directly to add two linked lists together.
+    Isn't that so awesome?
+    """
+    def __add__(self, other_linked_list):
+        """
+        Combine one linked list together with another to make a larger
+        linked list.
+
+        :param other_linked_list: other linked list
+        :type other_linked_list: LinkedList
+
+        :returns: combined linked list
+        :rtype: LinkedList
+        """
+
+        # Create a new linked list and then iterate over this linked
+        # list and the other linked list, appending each value to the
+        # new linked list (since `append` doesn't have to search for
+        # the end of the list, this takes time proportional to the
+        # combined length of the two lists)
+        combined_list = self._new_empty()
+        for linked_list in [self, other_linked_list]:
+            for value in linked_list:
+                combined_list.append(value)
+
+        return combined_list
+
+    def extend(self, values):
+        """
+        Append each of the given values to the end of the list, like
+        the `extend` method of a Python list. The values are copied, so
+        if `values` is another linked list, it's left as it is (use
+        `splice` to move its nodes over instead).
+
+        :param values: values to append
+        :type values: iterable
+        """
+
+        # Extending a list with itself would never end since the list
+        # would keep growing while it's being iterated over
+        if values is self:
+            values = list(values)
+
+        self._chain_after_tail(values)
+
+    def _chain_after_tail(self, values):
+        """
+        Link new nodes holding the given values onto the end of the
+        list in one forward pass.
+
+        This does the same thing as calling `append` for each value,
+        but skips the bookkeeping that `_link_after` has to do for each
+        node: each new node is linked straight onto the one before it
+        and `tail_node`, `num_elements` and the value index (if there is
+        one) are updated once at the end. Like `_link_after`, it takes
+        the nodes from the node pool (if there is one).
+
+        :param values: values to append
+        :type values: iterable
+        """
+
+        node_type = self.node_type
+        take_node = None if self.node_pool is None else self.node_pool.take
+        prev_tail_node = self.tail_node
+        current_node = prev_tail_node
+        num_new_nodes = 0
+        for value in values:
+            if take_node is None:
+                new_node = node_type(value=value)
+            else:
+                new_node = take_node(value, None)
+            current_node.next_node = new_node
+            current_node = new_node
+            num_new_nodes += 1
+
+        self.tail_node = current_node
+        self.num_elements += num_new_nodes
+
+        if self.indexed:
+            self._index_chain(prev_tail_node)
+
+    @classmethod
+    def from_iterable(cls, values, **kwargs):
+        """
+        Make a new linked list out of the values of any iterable (a
+        Python list, a generator, another linked list, etc.) in one
+        forward pass.
+
+        :param values: values to put in the list
+        :type values: iterable
+        :param kwargs: keyword arguments for the list's constructor,
+                       e.g., `indexed=True`
+
+        :returns: new linked list
+        :rtype: LinkedList
+        """
+
+        linked_list = cls(**kwargs)
+        linked_list._chain_after_tail(values)
+
+        return linked_list
+
+    @classmethod
+    def from_file(cls, text_path, tokenizer=None, chunk_size=1 << 16,
+                  **kwargs):
+        """
+        Make a new linked list out of the tokens (e.g., words) in a text
+        file.
+
+        The file is read in chunks of `chunk_size` characters, so the
+        whole text is never held in memory at once, and the tokens go
+        straight into the list as they are found (see
+        `iter_file_tokens`).
+
+        :param text_path: path to text file
+        :type text_path: str
+        :param tokenizer: function that takes a piece of text and
+                          returns its tokens (by default, the text is
+                          lower-cased and split on whitespace); it is
+                          only ever given text that ends on whitespace
+                          (or at the end of the file), so tokens must
+                          not contain whitespace
+        :type tokenizer: function
+        :param chunk_size: number of characters to read at a time
+        :type chunk_size: int
+        :param kwargs: keyword arguments for the list's constructor,
+                       e.g., `indexed=True`
+
+        :returns: new linked list
+        :rtype: LinkedList
+        """
+
+        return cls.from_iterable(
+            iter_file_tokens(text_path, tokenizer=tokenizer,
+                             chunk_size=chunk_size),
+            **kwargs)
+
+    def __getstate__(self):
+        """
+        Return the state of the list for pickling (and copying).
+
+        By default, pickle would save each node along with the node it
+        links to, which links to another node, and so on, so pickling a
+        list of more than about a thousand elements would go past
+        Python's recursion limit. Instead, only the list's settings and
+        a flat Python list of its values are saved.
+
+        :returns: settings and values of the list
+        :rtype: dict
+        """
+
+        return {'settings': self._settings(), 'values': list(self)}
+
+    def __setstate__(self, state):
+        """
+        Rebuild an unpickled list from the state saved by
+        `__getstate__`.
+
+        :param state: settings and values of the list
+        :type state: dict
+        """
+
+        self.__init__(**state['settings'])
+        self._chain_after_tail(state['values'])
+
+    def dump(self, fileobj):
+        """
+        Write the values of the list to a binary file, which can be read
+        back much faster than a pickle (see `load`).
+
+        This only works if all of the values are strings or all of them
+        are integers (that fit in 64 bits). The values are written a
+        block at a time (see `_write_binary_block`): integers are packed
+        into arrays, and strings are joined together and encoded as
+        UTF-8 along with a table of their lengths.
+
+        :param fileobj: binary file to write to (e.g., opened with
+                        `open(path, 'wb')`)
+        :type fileobj: file
+
+        :raises TypeError: if the values aren't all strings or all
+                           integers
+        :raises OverflowError: if an integer doesn't fit in 64 bits
+        """
+
+        value_types = set(type(value) for value in self)
+        if value_types <= {str}:
+            typecode = 's'
+        elif value_types == {int}:
+            typecode = 'q'
+        else:
+            raise TypeError("Only lists of strings or of integers can be "
+                            "dumped.")
+
+        fileobj.write(BINARY_MAGIC + typecode.encode('ascii'))
+
+        block = []
+        for value in self:
+            block.append(value)
+            if len(block) == self.dump_block_size:
+                _write_binary_block(fileobj, typecode, block)
+                block = []
+        if block:
+            _write_binary_block(fileobj, typecode, block)
+
+        # An empty block marks the end of the values
+        fileobj.write(struct.pack('<I', 0))
+
+    @classmethod
+    def load(cls, fileobj, **kwargs):
+        """
+        Make a new linked list out of the values in a binary file
+        written by `dump`.
+
+        :param fileobj: binary file to read from (e.g., opened with
+                        `open(path, 'rb')`)
+        :type fileobj: file
+        :param kwargs: keyword arguments for the list's constructor,
+                       e.g., `indexed=True`
+
+        :returns: new linked list
+        :rtype: LinkedList
+
+        :raises ValueError: if the file isn't a binary linked list file or
+                            is truncated
+        """
+
+        return cls.from_iterable(_iter_binary_values(fileobj), **kwargs)
+
+    def splice(self, other_linked_list):
+        """
+        Move all of the nodes of another linked list onto the end of
+        this one, leaving the other linked list empty.
+
+        Unlike `__add__` or `extend`, nothing is copied: the last node
+        of this list is simply linked to the first node of the other
+        list, so this takes the same amount of time no matter how long
+        either list is. (If this list keeps a value index, though, the
+        moved nodes still need to be added to it one by one.)
+
+        :param other_linked_list: linked list whose nodes to move
+        :type other_linked_list: LinkedList
+
+        :raises TypeError: if the other list's nodes can't be used in
+                           this list
+        :raises ValueError: if the other list is this list
+        """
+
+        if (not isinstance(other_linked_list, LinkedList)
+            or not issubclass(other_linked_list.node_type, self.node_type)):
+            raise TypeError("Can't splice a {} onto a {}."
+                            .format(type(other_linked_list).__name__,
+                                    type(self).__name__))
+        if other_linked_list is self:
+            raise ValueError("Can't splice a linked list onto itself.")
+
+        if other_linked_list.is_empty():
+            return
+
+        prev_tail_node = self.tail_node
+        self.tail_node.next_node = other_linked_list.header_node.next_node
+        self.tail_node = other_linked_list.tail_node
+        self.num_elements += other_linked_list.num_elements
+
+        if self.indexed:
+            self._index_chain(prev_tail_node)
+
+        # Leave the other list empty
+        other_linked_list.header_node.next_node = None
+        other_linked_list.tail_node = other_linked_list.header_node
+        other_linked_list.num_elements = 0
+        if other_linked_list.indexed:
+            other_linked_list.value_index.clear()
+            other_linked_list.node_predecessors.clear()
+            other_linked_list.node_ordinals.clear()
+            other_linked_list.first_ordinal = 0
+            del other_linked_list.removed_ordinals[:]
+            other_linked_list.ordinals_stale = False
+
+    def __iadd__(self, other_linked_list):
+        """
+        Add another linked list onto the end of this one in place via
+        the `+=` operator, e.g., "linked_list_1 += linked_list_2".
+
+        Since this is meant for combining lists that aren't needed
+        separately anymore, the nodes of the other linked list are
+        moved over with `splice` (leaving it empty) rather than copied.
+        Any other kind of iterable is copied with `extend`.
+
+        :param other_linked_list: linked list (or other iterable) to
+                                  add
+        :type other_linked_list: LinkedList
+
+        :returns: this linked list
+        :rtype: LinkedList
+        """
+
+        if isinstance(other_linked_list, LinkedList):
+            self.splice(other_linked_list)
+        else:
+            self.extend(other_linked_list)
+
+        return self
+
+    def sort(self, key=None, reverse=False):
+        """
+        Sort the list in place, like the `sort` method of a Python list
+        (including `key` and `reverse`, and keeping elements with equal
+        keys in their original order).
+
+        This is a bottom-up merge sort: first, every pair of
+        neighboring nodes is merged into a sorted run of 2, then every
+        pair of runs of 2 into a sorted run of 4, and so on until there
+        is only one run. Merging two runs only takes relinking nodes,
+        so no new nodes are created and nothing is copied.
+
+        :param key: function for getting a value's sort key
+        :type key: function or None
+        :param reverse: whether to sort from largest to smallest
+        :type reverse: bool
+        """
+
+        if len(self) < 2:
+            return
+
+        # Like Python's `sort`, call the key function only once per
+        # element
+        cached_keys = None
+        if key is not None:
+            cached_keys = {}
+            current_node = self.header_node.next_node
+            while current_node is not None:
+                cached_keys[current_node] = key(current_node.value)
+                current_node = current_node.next_node
+        right_goes_first = _comparison(key, reverse, cached_keys)
+
+        run_length = 1
+        while run_length < len(self):
+            last_node = self.header_node
+            current_node = self.header_node.next_node
+            while current_node is not None:
+                left_node = current_node
+                right_node = _split_chain(left_node, run_length)
+                current_node = _split_chain(right_node, run_length)
+                first_node, merged_last_node = _merge_chains(
+                    left_node, right_node, right_goes_first)
+                last_node.next_node = first_node
+                last_node = merged_last_node
+            run_length *= 2
+
+        self.tail_node = last_node
+
+        if self.indexed:
+            self._rebuild_index()
+
+
+class LinkedListView:
+    """
+    Lazy view of a slice of a linked list (see `LinkedList.__getitem__`).
+
+    The view only remembers which list and which slice it refers to.
+    The slice is applied to the list as it is at the time the view is
+    used, so, if the list changes, so does the view.
+    """
+
+    def __init__(self, linked_list, slice_):
+        """
+        Initialize a view of part of a linked list.
+
+        :param linked_list: the list to view
+        :type linked_list: LinkedList
+        :param slice_: the part of the list to view
+        :type slice_: slice
+        """
+
+        self.linked_list = linked_list
+        self.slice = slice_
+
+    def __iter__(self):
+        """
+        Iterate over the values in the view.
+
+        :returns: generator of values
+        :rtype: generator
+        """
+
+        return self.linked_list._iter_slice(
+            *self.slice.indices(len(self.linked_list)))
+
+    def __len__(self):
+        """
+        Return the number of values in the view.
+
+        :returns: number of values
+        :rtype: int
+        """
+
+        return len(range(*self.slice.indices(len(self.linked_list))))
+
+    def to_linked_list(self):
+        """
+        Copy the values in the view into a new list of the same type as
+        the viewed list.
+
+        :returns: new linked list
+        :rtype: LinkedList
+        """
+
+        new_list = self.linked_list._new_empty()
+        for value in self:
+            new_list.append(value)
+
+        return new_list
+
+    def __str__(self):
+        """
+        Return a string representation of the view (in the same format
+        as the string representation of a `LinkedList`).
+
+        :returns: string representation of the view
+        :rtype: str
+        """
+
+        return "[[{}]]".format(", ".join(str(value) for value in self))
+
+
+"""
+- Doubly Linked Lists
+The nodes in `LinkedList` only know about the node that comes after
+them. This means that some operations, like popping a value off the end
+of the list, require walking through the entire list just to find the
+node before the last one. A doubly linked list fixes this by giving
+each node a second link, `prev_node`, which points to the node that
+comes before it. With both links, the list can be walked in either
+direction and any node can be unlinked without having to search for
+its predecessor.
+"""
+
+class DoublyLinkedNode(CompactNode):
+    __slots__ = ('prev_node',)
+
+    def __init__(self, value=None, next_node=None, prev_node=None):
+        CompactNode.__init__(self, value=value, next_node=next_node)
+        self.prev_node = prev_node
+
+
+class DoublyLinkedList(LinkedList):
+    """
+    Python implementation of a doubly linked list.
+
+    It has the same methods as `LinkedList`, but, since each node also
+    links back to the node before it, popping from either end takes the
+    same amount of time no matter how long the list is, the list can be
+    iterated over in reverse, and a node can be removed directly via
+    `remove_node` once you have a reference to it (`push` and `append`
+    return the nodes that they create).
+    """
+
+    node_type = DoublyLinkedNode
+
+    def _link_after(self, prev_node, new_value):
+        """
+        Insert a new node with the given value directly after
+        `prev_node` and return the new node (see
+        `LinkedList._link_after`), also setting the backward links of
+        the new node and the node after it.
+
+        :param prev_node: node after which to insert the new node (may
+                          be the header node)
+        :type prev_node: DoublyLinkedNode
+        :param new_value: value of the new node
+        :type new_value: object
+
+        :returns: the newly-inserted node
+        :rtype: DoublyLinkedNode
+        """
+
+        new_node = LinkedList._link_after(self, prev_node, new_value)
+        new_node.prev_node = prev_node
+        if new_node.next_node is not None:
+            new_node.next_node.prev_node = new_node
+
+        return new_node
+
+    def _unlink_after(self, prev_node):
+        """
+        Remove the node directly after `prev_node` from the list and
+        return it (see `LinkedList._unlink_after`), also fixing the
+        backward link of the node that followed it.
+
+        :param prev_node: node preceding the node to remove (may be the
+                          header node)
+        :type prev_node: DoublyLinkedNode
+
+        :returns: the removed node
+        :rtype: DoublyLinkedNode
+        """
+
+        removed_node = LinkedList._unlink_after(self, prev_node)
+        if prev_node.next_node is not None:
+            prev_node.next_node.prev_node = prev_node
+        removed_node.prev_node = None
+
+        return removed_node
+
+    def _node_at(self, index):
+        """
+        Return the node at the given index, where index -1 refers to
+        the header node, walking from whichever end of the list is
+        closer.
+
+        :param index: index of the node (from -1 up to the length of
+                      the list minus one)
+        :type index: int
+
+        :returns: node at the given index
+        :rtype: DoublyLinkedNode
+        """
+
+        if index < len(self)//2:
+            return LinkedList._node_at(self, index)
+
+        # Walk backward from the last node
+        i = len(self) - 1
+        current_node = self.tail_node
+        while i > index:
+            i -= 1
+            current_node = current_node.prev_node
+
+        return current_node
+
+    def _chain_after_tail(self, values):
+        """
+        Link new nodes holding the given values onto the end of the
+        list in one forward pass (see `LinkedList._chain_after_tail`),
+        also setting their backward links.
+
+        :param values: values to append
+        :type values: iterable
+        """
+
+        node_type = self.node_type
+        take_node = None if self.node_pool is None else self.node_pool.take
+        prev_tail_node = self.tail_node
+        current_node = prev_tail_node
+        num_new_nodes = 0
+        for value in values:
+            if take_node is None:
+                new_node = node_type(value=value, prev_node=current_node)
+            else:
+                new_node = take_node(value, None)
+                new_node.prev_node = current_node
+            current_node.next_node = new_node
+            current_node = new_node
+            num_new_nodes += 1
+
+        self.tail_node = current_node
+        self.num_elements += num_new_nodes
+
+        if self.indexed:
+            self._index_chain(prev_tail_node)
+
+    def remove_node(self, node):
+        """
+        Remove the given node from the list.
+
+        Since the node knows which node precedes it, there is no need
+        to search the list for it.
+
+        :param node: node to remove (it must currently be in this list)
+        :type node: DoublyLinkedNode
+
+        :returns: value of the removed node
+        :rtype: object
+
+        :raises ValueError: if the node is not linked into a list
+        """
+
+        if node.prev_node is None:
+            raise ValueError("The node is not part of a linked list.")
+
+        return self._remove_after(node.prev_node)
+
+    def pop_from_end(self):
+        """
+        Remove and return the value of the last node.
+
+        :returns: value of last node
+        :rtype: object
+
+        :raises ValueError: if list is empty
+        """
+
+        if self.is_empty():
+            raise ValueError("Linked list is empty!")
+
+        # The node before the last node is just a link away
+        return self._remove_after(self.tail_node.prev_node)
+
+    def splice(self, other_linked_list):
+        """
+        Move all of the nodes of another doubly linked list onto the
+        end of this one, leaving the other list empty (see
+        `LinkedList.splice`).
+
+        :param other_linked_list: linked list whose nodes to move
+        :type other_linked_list: DoublyLinkedList
+
+        :raises TypeError: if the other list's nodes can't be used in
+                           this list
+        :raises ValueError: if the other list is this list
+        """
+
+        prev_tail_node = self.tail_node
+        LinkedList.splice(self, other_linked_list)
+
+        # Point the first of the moved nodes back at this list
+        if prev_tail_node.next_node is not None:
+            prev_tail_node.next_node.prev_node = prev_tail_node
+
+    def sort(self, key=None, reverse=False):
+        """
+        Sort the list in place (see `LinkedList.sort`) and then fix the
+        backward links.
+
+        :param key: function for getting a value's sort key
+        :type key: function or None
+        :param reverse: whether to sort from largest to smallest
+        :type reverse: bool
+        """
+
+        LinkedList.sort(self, key=key, reverse=reverse)
+
+        prev_node = self.header_node
+        while prev_node.next_node is not None:
+            prev_node.next_node.prev_node = prev_node
+            prev_node = prev_node.next_node
+
+    def _iter_slice(self, start, stop, step):
+        """
+        Iterate over the values selected by a slice whose `start`,
+        `stop` and `step` have already been resolved with
+        `slice.indices` (see `LinkedList._iter_slice`), walking
+        backward along the `prev_node` links if `step` is negative.
+
+        :param start: start index
+        :type start: int
+        :param stop: stop index
+        :type stop: int
+        :param step: step size (may be negative)
+        :type step: int
+
+        :returns: generator of values
+        :rtype: generator
+        """
+
+        if step > 0:
+            for value in LinkedList._iter_slice(self, start, stop, step):
+                yield value
+            return
+
+        num_values = len(range(start, stop, step))
+        if num_values == 0:
+            return
+
+        current_node = self._node_at(start)
+        for i in range(num_values):
+            yield current_node.value
+            if i < num_values - 1:
+                for _ in range(-step):
+                    current_node = current_node.prev_node
+
+    def __reversed__(self):
+        """
+        Iterate over the values of the list from the last to the first,
+        one node at a time, e.g.:
+
+        >>> for value in reversed(doubly_linked_list):
+        ...     print(value)
+
+        :returns: generator of values in reverse order
+        :rtype: generator
+        """
+
+        current_node = self.tail_node
+        while current_node is not self.header_node:
+            yield current_node.value
+            current_node = current_node.prev_node
+
+
+"""
+- Sorted Linked Lists
+A sorted linked list is a linked list that always keeps its values in
+order. Adding a value means finding the right place for it, which means
+walking through the list, but two sorted lists can be merged into one
+in a single pass by repeatedly taking whichever of the two first nodes
+comes first, which is also how `LinkedList.sort` works.
+"""
+
+class SortedLinkedList(LinkedList):
+    """
+    Python implementation of a sorted linked list.
+
+    It has the same methods as `LinkedList`, but `push` and `append`
+    both put the new value where it belongs in the order, and adding
+    other lists to it (with `extend`, `splice`, `+`, etc.) merges them
+    in.
+    """
+
+    def __init__(self, key=None, reverse=False, indexed=False, pool_size=None):
+        """
+        Initialize an empty sorted linked list.
+
+        :param key: function for getting a value's sort key (like the
+                    `key` argument of `sorted`)
+        :type key: function or None
+        :param reverse: whether to keep the values in order from
+                        largest to smallest
+        :type reverse: bool
+        :param indexed: whether or not to keep a value index (see
+                        `LinkedList.__init__`)
+        :type indexed: bool
+        :param pool_size: maximum number of removed nodes to keep for
+                          reuse (see `LinkedList.__init__`)
+        :type pool_size: int or None
+        """
+
+        LinkedList.__init__(self, indexed=indexed, pool_size=pool_size)
+        self.key = key
+        self.reverse = reverse
+        self.right_goes_first = _comparison(key, reverse)
+
+    def _settings(self):
         """
+        Return the keyword arguments needed to make a new sorted list
+        with the same settings as this one (including its order).
 
-        # Create a new Node and set its `value` attribute to the given
-        # value and set its `next_node` attribute to the value of the
-        # current first node in the list, all of which can be done by
-        # passing in parameter values when instantiating the new node)
-        new_node = Node(value=new_value, next_node=self.header_node.next_node)
+        :returns: constructor keyword arguments
+        :rtype: dict
+        """
 
-        # Now, set the value of `header_node`'s `next_node` attribute
-        # to point to this new node
-        self.header_node.next_node = new_node
+        settings = LinkedList._settings(self)
+        settings['key'] = self.key
+        settings['reverse'] = self.reverse
 
+        return settings
 
-    def append(self, new_value):
+    def add(self, new_value):
         """
-        Append new value to the end of the linked list.
+        Add a new value to the list in its place in the order (after
+        any values with an equal key).
 
-        This is doing something very similar to what `push` is doing:
-        it adds a new value to the list, but it tacks it onto the end
-        rather than onto the beginning. The advantage of `push` is that
-        there is no need to traverse the list to find the last node: it
-        simply reassigns the header node's `next_node` attribute to
-        point to it instead of the current first node and its own
-        `next_node` link points to the that formerly-first node,
-        thereby shifting that node one index forward (and all nodes
-        that follow it). If the list is empty, then this new node's
-        link will actually be None since it will be the one and only
-        node (other than the header node, of course) in the list.
-        
-        :param new_value: new value to append to list (inside a node)
-        :type new_value: object (basically, this means any type)
-        """
+        Adding a value that belongs at the very end of the list doesn't
+        require any searching, so adding values that are already in
+        order is fast.
 
-        # Start at the beginning of the linked list, which can be
-        # reached via the object's `header_node` attribute
-        current_node = self.header_node
-        while True:
+        :param new_value: new value to add
+        :type new_value: object
 
-            # Check if this node happens to be the last node in the
-            # list, in which case we have found the location we need to
-            # modify
-            # Note: This would even work for an empty linked list since
-            # the value of `header_node`'s `next_node` attribute is
-            # `None` until it's changed by adding nodes to the list
-            # (i.e., by using this method, for example).
-            if current_node.next_node is None:
+        :returns: the new node
+        :rtype: CompactNode
+        """
 
-                # Make a new node with the given value and set
-                # `current_node`'s `next_node` attribute to point to
-                # this new node we're creating (which will be
-                # initialized to have a `value`, but will have a
-                # `next_node` value that gets the default value, i.e.,
-                # None)
-                current_node.next_node = Node(value=new_value)
+        # Work out the new value's key once and compare it with the key
+        # of each value passed. The new value only goes before a value
+        # whose key it comes strictly before, so that it goes after any
+        # values with an equal key
+        key = self.key
+        if key is None:
+            key = lambda value: value
+        new_key = key(new_value)
+        if self.reverse:
+            goes_before = lambda value: key(value) < new_key
+        else:
+            goes_before = lambda value: new_key < key(value)
 
-                # Break out of loop
-                break
+        # Check the end of the list first
+        if (self.tail_node is self.header_node
+            or not goes_before(self.tail_node.value)):
+            return self._link_after(self.tail_node, new_value)
 
-            # Otherwise, move to the next node
-            else:
-                current_node = ### FILL IN
+        # Otherwise, find the last node that doesn't come after the new
+        # value
+        prev_node = self.header_node
+        while (prev_node.next_node is not None
+               and not goes_before(prev_node.next_node.value)):
+            prev_node = prev_node.next_node
 
-    def find_index_of_value(self, value_to_find):
+        return self._link_after(prev_node, new_value)
+
+    def push(self, new_value):
         """
-        Find the index of the first occurrence of the given value in
-        the list. If it is not found, return -1 to signify that the
-        value was not found.
+        Add a new value to the list in its place in the order (same as
+        `add`).
 
-        :param value_to_find: value to look for in the elements of the
-                              linked list
-        :type value_to_find: object
+        :param new_value: new value to add
+        :type new_value: object
 
-        :returns: index of the first element matching the given value
-                  (or -1 if the value was not found in the list at all)
-        :rtype: int
+        :returns: the new node
+        :rtype: CompactNode
         """
 
-        # Let's first check to see if the list is empty by calling the
-        # object's `is_empty` function, which simply looks to see if
-        # the object's `header_node`'s `value` attribute is equal to
-        # `None`
-        if ### FILL IN:
-            return ### FILL IN (i.e., what value should be returned?)
+        return self.add(new_value)
 
-        # If the list is not empty, let's start at the first real node,
-        # i.e., the node that is pointed to by `header_node.next_node`
-        current_node = ### FILL IN
+    def append(self, new_value):
+        """
+        Add a new value to the list in its place in the order (same as
+        `add`).
 
-        # Loop through the elements of the list and keep a counter for
-        # the index
-        index = 0
-        while True:
-            
-            # If the value of the current node is equal to the value
-            # we're trying to find, then return the value of `index`
-            # since we're finished
-            if current_node.value == ### FILL IN:
-                return ### FILL IN (i.e., what value should be returned?)
+        :param new_value: new value to add
+        :type new_value: object
 
-            # Otherwise, check if this is the last node and, if so,
-            # return -1 since that means the value was nowhere to be
-            # found
-            if current_node.next_node is None:
-                return ### FILL IN (i.e., what value should be returned?)
+        :returns: the new node
+        :rtype: CompactNode
+        """
 
-            # Move forward one node and increment the counter
-            # Note: Notice that I am not using an `else` statement here
-            # (or even above after the second `if` block). Why/how can
-            # I do this? The reason is that the `if` condition, if met,
-            # would lead to a situation where the code below it would
-            # never be executed. Thus, logically, there is no need to
-            # put an `else` statement. This is naturally an `else`
-            # statement.
-            current_node = ### FILL IN
-            index += 1
+        return self.add(new_value)
 
-    # Note: Python includes something called "magic" methods. They are
-    # a set of predefined method/function names that allow objects to
-    # be used in certain very useful ways if they are implemented. For
-    # example, `__len__` is one of these so-called magic functions. If
-    # you create a custom class (as we are doing here), implementing a
-    # `__len__` function will mean that we will be able to call `len`
-    # on an object of type `LinkedList`. For example, consider the code
-    # below:
-    #
-    # >>> x = LinkedList()
-    # >>> x.push(5)
-    # >>> x.push(6)
-    # >>> print(len(x))
-    #
-    # The call to `print` will print out the length of `x` (should be
-    # 2). You might ask how `len` can be called since what actually was
-    # implemented was called `__len__`, but just know that this is the
-    # magic part. In Python, the `len` function can be used on many
-    # different types of objects (actually, any object for which
-    # `__len__` is implemented). It's nice to be able to print out the
-    # length of a list or the number of elements in a set or the number
-    # of keys in a dictionary, etc. But, we could implement `__len__`
-    # to do something weird, like return the value 67 no matter what.
-    # This would be kind of dumb, but it would be possible. The point
-    # is just to demonstrate this capability in Python. Other magic
-    # methods include `__add__` (which allow objects to be added
-    # together via the `+` operator), `__sub__` (same thing, but with
-    # `-`), `__mult__` (same thing, but with `*`), etc. Below I want
-    # you to implement the `__len__` function. Simply count the number
-    # of elements by iterating until you get to the end and return that
-    # number. I am going to implement another magic method here called
-    # `__str__`, which allows you to specify the way the object should
-    # be "printed", i.e., how you want to represent it. Let's use
-    # double braces to distinguish objects of type `LinkedList` from
-    # objects that are just regular Python lists.
-    def __len__(self):
+    def _chain_after_tail(self, values):
         """
-        Return the number of elements that are in the list (not
-        including the header node that does not contain an element).
-        
-        :returns: number of elements in list
-        :rtype: int
+        Add many values to the list at once by putting them in a
+        temporary list, sorting it and merging it in.
+
+        :param values: values to add
+        :type values: iterable
         """
 
-        ### IMPLEMENT THIS METHOD
-        # Hint: Check if list is empty. If so, return 0. Otherwise,
-        # make a counter and set it to 0 and iterate over the list's
-        # elements until you get to the element whose `next_node` value
-        # is equal to `None` (i.e., the last element).
+        # The temporary list takes its nodes from this list's pool, since
+        # they end up in this list
+        other_linked_list = self._new_empty()
+        other_linked_list.node_pool = self.node_pool
+        LinkedList._chain_after_tail(other_linked_list, values)
+        LinkedList.sort(other_linked_list, key=self.key, reverse=self.reverse)
+        self.merge(other_linked_list)
 
-    def __str__(self):
+    def sort(self, key=None, reverse=False):
         """
-        Return a string representation of the `LinkedList` object.
+        Change the order of the list (and keep it in that order from
+        now on).
 
-        :returns: string representation of the `LinkedList` object
-        :rtype: str
+        :param key: function for getting a value's sort key
+        :type key: function or None
+        :param reverse: whether to sort from largest to smallest
+        :type reverse: bool
         """
 
-        str_repr = ""
+        self.key = key
+        self.reverse = reverse
+        self.right_goes_first = _comparison(key, reverse)
+        LinkedList.sort(self, key=key, reverse=reverse)
 
-        # Add string representations of the linked list's values
-        # themselves to the string representation of the linked list
-        if not self.is_empty():
-            current_node = self.header_node.next_node
-            while True:
+    def merge(self, other_linked_list):
+        """
+        Merge all of the nodes of another linked list into this one,
+        leaving the other linked list empty.
 
-                # Concatenate the string value of the current node's
-                # value to the string representation of the linked list
-                # object
-                if str_repr != "":
-                    str_repr = ", ".join([str_repr, str(current_node.value)])
-                else:
-                    str_repr = str(current_node.value)
-                
-                # Break if the current node is the last node
-                if current_node.next_node is None:
-                    break
-                
-                # Move forward to next node
-                current_node = current_node.next_node
+        If the other list is a `SortedLinkedList` in the same order,
+        this takes a single pass over both lists, relinking the nodes
+        as it goes (nothing is copied). Otherwise, the other list is
+        sorted first.
 
-        # Wrap the elements string in double braces
-        str_repr = "[[{}]]".format(str_repr)
+        :param other_linked_list: linked list whose nodes to merge in
+        :type other_linked_list: LinkedList
 
-        return str_repr
+        :raises TypeError: if the other list's nodes can't be used in
+                           this list
+        :raises ValueError: if the other list is this list
+        """
 
-    def remove_value(self, value_to_remove):
+        if (not isinstance(other_linked_list, LinkedList)
+            or not issubclass(other_linked_list.node_type, self.node_type)):
+            raise TypeError("Can't merge a {} into a {}."
+                            .format(type(other_linked_list).__name__,
+                                    type(self).__name__))
+        if other_linked_list is self:
+            raise ValueError("Can't merge a linked list into itself.")
+
+        if other_linked_list.is_empty():
+            return
+
+        if (not isinstance(other_linked_list, SortedLinkedList)
+            or other_linked_list.key is not self.key
+            or other_linked_list.reverse != self.reverse):
+            LinkedList.sort(other_linked_list, key=self.key,
+                            reverse=self.reverse)
+
+        first_node, last_node = _merge_chains(
+            self.header_node.next_node,
+            other_linked_list.header_node.next_node, self.right_goes_first)
+        self.header_node.next_node = first_node
+        self.tail_node = last_node
+        self.num_elements += other_linked_list.num_elements
+
+        if self.indexed:
+            self._rebuild_index()
+
+        # Leave the other list empty
+        other_linked_list.header_node.next_node = None
+        other_linked_list.tail_node = other_linked_list.header_node
+        other_linked_list.num_elements = 0
+        if other_linked_list.indexed:
+            other_linked_list._rebuild_index()
+
+    def splice(self, other_linked_list):
         """
-        Find and remove the first occurrence of the given value and
-        return True if the removal was successful or False if the value
-        could not be located anywhere in the list.
+        Merge all of the nodes of another linked list into this one,
+        leaving the other linked list empty (same as `merge`, since the
+        nodes can't just go on the end).
 
-        :param value_to_remove: value to find/remove in the list
-        :tyep value_to_remove: object
+        :param other_linked_list: linked list whose nodes to merge in
+        :type other_linked_list: LinkedList
+        """
 
-        :returns: whether or not the value was found/removed
-        :rtype: bool
+        self.merge(other_linked_list)
+
+    def __add__(self, other_linked_list):
         """
+        Combine this sorted linked list with another linked list to make
+        a new sorted linked list (copies of both lists are merged
+        together, so this takes a single pass if the other list is
+        sorted in the same order).
 
-        ### IMPLEMENT THIS FUNCTION
-        # Hint: Use `find_index_of_value` to figure out whether the
-        # given value is even in the list. (You may also want to first
-        # use `is_empty`, which, if it returns True, would tell you
-        # that the return value is obviously False since there are no
-        # possible values to remove.) Once you have the index of the
-        # value to remove, iterate through the list's elements and stop
-        # at the index of the element preceding the index that you
-        # found. Store a reference to this node (as, say, `prev_node`).
-        # Then, store a reference to the next node's `next_node` value
-        # (i.e., to get the thing that that node is pointing to). If
-        # using the `prev_node` notation, you could refer to the next
-        # node's `next_node` value via `prev_node.next_node.next_node`,
-        # for example. It's possible that the thing that that next node
-        # points to is the value None, which would mean that the value
-        # you are removing is simply the last value in the list. This
-        # doesn't really change anything, though. Now, all you need to
-        # do is set the value of `prev_node.next_node` to the value of
-        # `prev_node.next_node.next_node`, i.e., skipping over a whole
-        # node. You don't need to do anything else. Removing the
-        # reference to a node is the same as deleting it (i.e., Python
-        # will take care of actually deleting it and freeing up the
-        # memory).
-        # I will start it off for you:
-        
-        # If it's empty, return False since there's nothing to remove
-        if self.is_empty():
-            return False
+        :param other_linked_list: other linked list
+        :type other_linked_list: LinkedList
 
-        # Get the index of the value to remove
-        ### HINT: Use the `find_index_of_value` function to 1) see if
-        ###       the value is even in the list (remember, that
-        ###       function will return -1 if it can't find the value in
-        ###       the list) and 2) get the index of the value in the
-        ###       list.
-        value_to_remove_index = ### FILL IN
+        :returns: combined sorted linked list
+        :rtype: SortedLinkedList
+        """
 
-        # If `value_to_remove_index` is -1, that means the value was
-        # not found, so return False
-        ### FILL IN
+        combined_list = self._new_empty()
+        LinkedList._chain_after_tail(combined_list, self)
 
-        # Now traverse the list until you get to the node that is
-        # directly preceding the node you want to remove. (Remember to
-        # break out of this loop or it will run forever!)
-        current_node = ### FILL IN
-        current_index = ### FILL IN
-        while True:
+        other_copy = self._new_empty()
+        LinkedList._chain_after_tail(other_copy, other_linked_list)
+        if not (isinstance(other_linked_list, SortedLinkedList)
+                and other_linked_list.key is self.key
+                and other_linked_list.reverse == self.reverse):
+            LinkedList.sort(other_copy, key=self.key, reverse=self.reverse)
 
-            # If we're at the node before the node we want to remove,
-            # we can stop and do the removal
-            if ### FILL IN:
+        combined_list.merge(other_copy)
 
-                current_node.next_node = ### FILL IN
-                return ### FILL IN (i.e., what value should be returned?)
+        return combined_list
 
-            current_node = ### FILL IN
-            current_index += 1
 
-    def subsequence(self, i, j):
-        """
-        Return a new `LinkedList` object that consists of the elements
-        in the object's linked list that are from index `i` up to (but
-        not including) index `j`. If `j` represents a value that is
-        larger than the length of the linked list, just include the
-        rest of the list.
+"""
+- Concurrent Queues
+A linked list makes a good queue: values are added at one end and
+removed from the other. If several threads use the same list at once,
+though, they can trip over each other (e.g., two threads could both
+read the same `tail_node` and each link a new node onto it, losing one
+of them), so every operation has to be protected by a lock. With a
+single lock, only one thread can use the list at a time. But adding a
+value only touches the last node and removing one only touches the
+first node, so the two ends can have separate locks, letting a thread
+that's adding values and a thread that's removing them work at the
+same time. This is known as the "two-lock queue".
+
+For this to work, the two ends must never share a node that both of
+them change, so the header node is not fixed. Instead, whichever node
+was removed last takes over as the header node (its value is thrown
+away) and the node after it holds the next value to remove.
+"""
 
-        :param i: start index
-        :type i: int
-        :param j: stop index
-        :type j: int
+class ConcurrentLinkedQueue:
+    """
+    Thread-safe first-in-first-out queue built on a singly linked list,
+    with separate locks for the two ends.
 
-        :returns: new linked list consisting of a subsequence of the
-                  elements in the current linked list
-        :rtype: LinkedList
+    Values are added with `push`/`push_many` and removed, oldest first,
+    with `pop`/`pop_many` (which matches using `LinkedList.push` with
+    `LinkedList.pop_from_end` as a queue). Removing can wait until a
+    value is available, for as long as needed or up to a time limit.
+    """
 
-        :raises IndexError: if `i` is too large
-        :raises ValueError: if the linked list is emtpy or if `i`/`j`
-                            are invalid values or `i` is larger than `j`
+    def __init__(self):
+        """
+        Initialize an empty queue.
         """
 
-        # IMPLEMENT THIS FUNCTION
-        # THIS IS PROBABLY GOING TO BE PRETTY HARD. IT'S EXTRA CREDIT.
-        # I will start you off by implementing the part that determines
-        # whether or not this can actually be done given the value of
-        # `i` (i.e., if `i` is an index that does not even occur in the
-        # list) and the part that checks the length of the proposed
-        # subsequence to see if it's zero, in which case an empty
-        # `LinkedList` will be returned, etc.
+        self.header_node = CompactNode()
+        self.tail_node = self.header_node
+        self.head_lock = threading.Lock()
+        self.tail_lock = threading.Lock()
 
-        # Check parameter values and make sure they make sense
-        if not all(isinstance(x, int) for x in [i, j]):
-            raise ValueError("Parameters i and j should be integer values.")
+        # Threads that find the queue empty wait on this (it shares the
+        # head lock); `num_waiting` lets the threads adding values skip
+        # taking the head lock to wake them up when nobody is waiting
+        self.not_empty = threading.Condition(self.head_lock)
+        self.num_waiting = 0
 
-        # Check if `i` is larger than `j`
-        if i > j:
-            raise ValueError("Parameter i is larger than parameter j.")
+        # Each count is only changed while holding the lock for its own
+        # end of the queue
+        self.num_pushed = 0
+        self.num_popped = 0
 
-        # Check if list is empty
-        if self.is_empty():
-            raise ValueError("Linked list is currently empty!")
+    def __len__(self):
+        """
+        Return the number of values in the queue (if other threads are
+        using the queue, this may change right away).
 
-        # Make sure there are enough elements in the list given the
-        # value of `i`
-        if len(self) - 1 <= i:
-            raise IndexError("The value of i is too large. The linked list "
-                             "only contains {} elements.".format(len(self)))
+        :returns: number of values in the queue
+        :rtype: int
+        """
 
-        # Check if the length of the subsequence is zero
-        if i == j:
-            return ### FILL IN (i.e., what value should be returned?
-                   ### Hint: you need to return a new linked list, so
-                   ### make one.)
-
-        # Ok, now you will do the rest. Basically, you're going to need
-        # to make a new `LinkedList` here and append each element
-        # starting at index `i` in the current linked list and ending
-        # right before index `j` (or ending when the linked list ends,
-        # whichever comes first).
-
-        subsequence_list = ### FILL IN (Hint: Make a new `LinkedList` object.)
-        current_node = ### FILL IN
-        current_index = 0
-        while current_index < j:
-            
-            ### IMPLEMENT THE REST OF THIS LOOP
+        return self.num_pushed - self.num_popped
 
-        return subsequence_list
+    def is_empty(self):
+        """
+        Return False if the queue contains any values; True otherwise
+        (with the same caveat as `__len__`).
 
-    def pop_from_beginning(self):
+        :returns: boolean value
+        :rtype: bool
         """
-        Remove and return the value of the first node (after the header
-        node).
 
-        :returns: value of first node
-        :rtype: object
-        
-        :raises ValueError: if list is empty
+        return len(self) == 0
+
+    def _link_chain(self, first_node, last_node, num_values):
+        """
+        Link a chain of new nodes onto the back of the queue and wake
+        up any threads waiting for values.
+
+        :param first_node: first node of the chain
+        :type first_node: CompactNode
+        :param last_node: last node of the chain
+        :type last_node: CompactNode
+        :param num_values: number of nodes in the chain
+        :type num_values: int
         """
 
-        ### IMPLEMENT THIS
-        # Hint: If there is at least one element to pop off the list,
-        # get the value of `header_node.next_node.value` and store it
-        # in a variable and then set `header_node.next_node` to
-        # `header_node.next_node.next_node`. Then, return the value
-        # that you stored in a variable. If the list is empty, raise an
-        # error. I will do this check for you.
+        with self.tail_lock:
+            self.tail_node.next_node = first_node
+            self.tail_node = last_node
+            self.num_pushed += num_values
 
-        # Check if the list is empty, in which case there's no node to
-        # remove/return
-        if self.is_empty():
-            raise ValueError("Linked list is empty!")
+        # A thread about to wait always counts itself as waiting before
+        # it checks whether the queue is empty, so, if it missed the
+        # new nodes, it will be counted here
+        if self.num_waiting:
+            with self.not_empty:
+                self.not_empty.notify(num_values)
 
-        # Implement the rest of this function.
+    def push(self, new_value):
+        """
+        Add a value to the back of the queue.
 
-    def pop_from_end(self):
+        :param new_value: value to add
+        :type new_value: object
         """
-        Remove and return the value of the last node.
 
-        :returns: value of first node
-        :rtype: object
+        new_node = CompactNode(value=new_value)
+        self._link_chain(new_node, new_node, 1)
 
-        :raises ValueError: if list is empty
+    def push_many(self, new_values):
         """
+        Add several values to the back of the queue at once (the nodes
+        are linked together before the lock is taken, so the lock is
+        only held for as long as it takes to link the whole batch in).
 
-        ### IMPLEMENT THIS
-        # Hint: Traverse the list until you're at the node before the
-        # last node. Then, get the value of the last node and set the
-        # second-to-last node's `next_node` attribute to None (since
-        # now it is the last node). Again, if the list is empty, there
-        # is nothing to remove/return. Raise an exception like I did
-        # above if the list is empty.
+        :param new_values: values to add
+        :type new_values: iterable
+        """
 
-    def delete_index(self, index):
+        start_node = CompactNode()
+        last_node = start_node
+        num_values = 0
+        for new_value in new_values:
+            last_node.next_node = CompactNode(value=new_value)
+            last_node = last_node.next_node
+            num_values += 1
+
+        if num_values > 0:
+            self._link_chain(start_node.next_node, last_node, num_values)
+
+    def _wait_for_value(self, block, timeout):
         """
-        Remove the element at the given index, shifting all succeeding
-        elements back by one. Return True if successful; False
-        otherwise.
+        Wait until the queue is not empty (must be called while holding
+        the head lock).
 
-        :param index: index (starting from zero) of element to remove
-        :type index: int
+        :param block: whether to wait at all
+        :type block: bool
+        :param timeout: maximum number of seconds to wait (None means
+                        wait forever)
+        :type timeout: float or None
 
-        :returns: boolean value confirming that the deletion was
-                  successful (or unsucessful)
+        :returns: whether there is a value to remove
         :rtype: bool
         """
 
-        ### IMPLEMENT THIS
-        # Hint: Traverse the list like usual, but keep a counter. Stop
-        # at the index before the one we want to remove. Make that
-        # element's `next_node` attribute point to the node following
-        # the element we want to delete (or to the value None if the
-        # element we want to delete happens to be the last element in
-        # the list). Return True. If the index is never reached (i.e.,
-        # because the linked list is too small), return False.
-        # I'll start you off like usual.
+        if self.header_node.next_node is not None:
+            return True
+        if not block:
+            return False
+
+        deadline = None if timeout is None else time.time() + timeout
+        self.num_waiting += 1
+        try:
+            while self.header_node.next_node is None:
+                if deadline is None:
+                    self.not_empty.wait()
+                else:
+                    remaining = deadline - time.time()
+                    if remaining <= 0:
+                        return False
+                    self.not_empty.wait(remaining)
+        finally:
+            self.num_waiting -= 1
+
+        return True
+
+    def _take(self, max_values):
+        """
+        Remove up to `max_values` values from the front of the queue
+        (must be called while holding the head lock).
+
+        :param max_values: maximum number of values to remove
+        :type max_values: int
 
-        # Return False if the linked list is empty
-        if self.is_empty(): return False
+        :returns: the removed values
+        :rtype: list
+        """
 
-        # Traverse list and stop when counter is one less than `index`
-        i = 0
+        values = []
         current_node = self.header_node
-        while True:
+        while len(values) < max_values and current_node.next_node is not None:
+            current_node = current_node.next_node
+            values.append(current_node.value)
+            current_node.value = None
 
-            # Stop if `i` is one less than `index
-            if i == index - 1:
-                ### FIGURE OUT WHAT TO DO HERE
-                ### Remember to return True when finished
+        # The last node removed becomes the new header node
+        self.header_node = current_node
+        self.num_popped += len(values)
 
-            # Stop if `current_node.next_node` is None (i.e., it's the
-            # last node in the list) and return False since there's no
-            # more nodes to traverse
-            elif ### IMPLEMENT THIS
-                ### IMPLEMENT THIS
-            else:
-                ### Increment `i`
-                ### Change `current_node` to point to next node
+        return values
 
-    """
-    Just for fun/extra credit, implement a "magic" Python method called
-    `__add__`. When implemented, this will enable one to "add" two
-    linked list instances together in a way similar to the way that one
-    can add together two lists in Python, e.g.:
+    def pop(self, block=True, timeout=None):
+        """
+        Remove and return the value at the front of the queue (i.e.,
+        the oldest value).
 
-    >>> [1, 2, 3] + [4, 5, 6]      # [1, 2, 3, 4, 5, 6]
+        :param block: whether to wait for a value if the queue is empty
+        :type block: bool
+        :param timeout: maximum number of seconds to wait (None means
+                        wait forever)
+        :type timeout: float or None
 
-    Implementing the `__add__` method will not just enable this
-    capability in a general sense, it will actually enable a user to
-    use the `+` operator directly to add two linked lists together.
-    Isn't that so awesome?
-    """
-    def __add__(self, other_linked_list):
+        :returns: the oldest value
+        :rtype: object
+
+        :raises ValueError: if the queue is empty (and `block` is False
+                            or the time limit ran out)
         """
-        Combine one linked list together with another to make a larger
-        linked list.
 
-        :param other_linked_list: other linked list
-        :type other_linked_list: LinkedList
+        with self.head_lock:
+            if not self._wait_for_value(block, timeout):
+                raise ValueError("Queue is empty!")
+            return self._take(1)[0]
 
-        :returns: combined linked list
-        :rtype: LinkedList
+    def pop_many(self, max_values, block=True, timeout=None):
+        """
+        Remove and return up to `max_values` values from the front of
+        the queue. Only the first value is waited for; after that,
+        however many of the remaining values are already in the queue
+        are removed along with it, all while holding the lock once.
+
+        :param max_values: maximum number of values to remove
+        :type max_values: int
+        :param block: whether to wait for a value if the queue is empty
+        :type block: bool
+        :param timeout: maximum number of seconds to wait (None means
+                        wait forever)
+        :type timeout: float or None
+
+        :returns: the removed values, oldest first (an empty list if
+                  the queue is empty and `block` is False or the time
+                  limit ran out)
+        :rtype: list
         """
 
-        ### IMPLEMENT THIS METHOD. YOU'LL GET NO HELP FROM ME.
-        ### Alright, fine, a little help. Simply create a new linked
-        ### list and then iterate over the linked list (refer to it as
-        ### `self`) and a second linked list and simply append new
-        ### values to the new linked list until you've traversed both
-        ### lists. Then, return the new linked list.
+        if max_values < 1:
+            return []
+
+        with self.head_lock:
+            if not self._wait_for_value(block, timeout):
+                return []
+            return self._take(max_values)
 
 
 def main():
@@ -728,96 +2917,66 @@ def main():
 
     # 2. Now let's make a big linked list that includes words instead
     #    of numbers. We'll then search for some values in it, remove
-    #    some values, get some subsequences, etc.
-    linked_list_2 = LinkedList()
-
-    with open('data/pride_and_prejudice.txt') as text_file:
-        for line in text_file.readlines():
-            
-            # Preprocess the line by stripping off whitespace and
-            # converting all letters to lower-case
-            line = line.strip().lower()
-
-            # Skip empty lines
-            if line == "": continue
-
-            # Now let's split the line on whitespace and add each word
-            # to the linked list as a separate element
-            for word in line.split():
-
-                # FILL IN
-                # Hint: I'll let you decide which way you want to add
-                # each word to `linked_list_2`, but be aware that using
-                # one will be much faster than using the other. Do you
-                # know which one will be faster and why?
+    #    some values, get some subsequences, etc. We could read in the
+    #    file line by line, split each line into words and `append`
+    #    each word to the list, but `from_file` does all of that for
+    #    us, reading the file a chunk at a time and linking the new
+    #    nodes together as it goes. Since we'll be doing a lot of
+    #    searching, we'll also have the list keep a value index.
+    linked_list_2 = LinkedList.from_file('data/pride_and_prejudice.txt',
+                                         indexed=True)
 
     print("Length of linked_list_2: {}".format(len(linked_list_2)))
 
     # Now that we have a pretty big linked list, let's search for some
     # values that are probably in it and some that are probably not in
     # it
-    print("Searching linked_list_2 for the word 'big'...")
-    ### Search for the word "big" in `linked_list_2` and, if found,
-    ### print out the index at which it occurs (which will be returned
-    ### by the function). If it is not found, the return value of the
-    ### function will be -1. So, it will be necessary to first get the
-    ### return value and then to see if it's not -1. If it is -1, then
-    ### print out a message that the word was not found.
-
-    ### Repeat this for the following words: "small", "hate", "table",
-    ### "plant", "stove", "yard", "umbrella", "jacket", "coffee". For
-    ### each word, first print out the message "Searching linked_list_2
-    ### for the word 'x'..." where `x` refers to the word being
-    ### searched for. It is probably best if you do this in a for loop
-    ### rather than writing the same code 8 or 9 times. I'll start you
-    ### off.
-    words = ["small", "hate", "table", "plant", "stove", "yard", "umbrella",
-             "jacket", "coffee"]
+    words = ["big", "small", "hate", "table", "plant", "stove", "yard",
+             "umbrella", "jacket", "coffee"]
     for word in words:
 
-        ### PRINT OUT THE MESSAGE INDICATING WHAT WORD IS BEING
-        ### SEARCHED FOR. THEN, SEARCH FOR THE WORD AND PRINT OUT THE
-        ### INDEX AT WHICH IT OCCURRED OR, IF IT DOESN'T OCCUR, PRINT
-        ### OUT A MESSAGE SAYING SO.
+        print("Searching linked_list_2 for the word '{}'...".format(word))
+        index = linked_list_2.find_index_of_value(word)
+        if index != -1:
+            print("Found '{}' at index {}.".format(word, index))
+        else:
+            print("'{}' was not found.".format(word))
 
     # Now let's try the same thing but with some words that surely will
     # not show up (at least probably)
     words = ["internet", "python", "camry"]
     for word in words:
 
-        ### FILL IN. DO THE SAME THING AS YOU DID ABOVE.
+        print("Searching linked_list_2 for the word '{}'...".format(word))
+        index = linked_list_2.find_index_of_value(word)
+        if index != -1:
+            print("Found '{}' at index {}.".format(word, index))
+        else:
+            print("'{}' was not found.".format(word))
 
     # Now let's remove some words just for fun. Let's remove all
     # occurrences of the word "him". Since the `remove_value` function
     # will remove the first occurrence of the passed-in value and
     # return `True` or `False` (indicating whether a removal actually
-    # took place), we can just keep on trying to remove a word until
-    # the return value is `False`. Once that's the case, all instances
-    # of that word have been removed. Since "him" most definitely
-    # occurs in the text, we can skip the check to see if it occurs. If
-    # you would like to do this, you get some extra credit and a
-    # sticker.
+    # took place), we could just keep on trying to remove a word until
+    # the return value is `False`. But each call would have to start
+    # looking from the beginning of the list again, so it's better to
+    # use `remove_all`, which removes all of them in one go (and tells
+    # us how many there were).
     print("Removing all instances of the value 'him'...")
-    while True:
-
-        removed_him = ### FILL IN THIS LINE SO THAT THE WORD `him` IS
-                      ### PASSED IN TO `remove_value`.
-        
-        # If the return value is False, we know all occurrences of the
-        # word are now gone since the word couldn't be removed
-        # successfully (i.e., because it couldn't be found), so that
-        # means we can break.
-        if removed_him is False:
-            break
+    num_removed = linked_list_2.remove_all('him')
+    print("Removed {} instances of 'him'.".format(num_removed))
 
     # Now that all occurrences of the word "him" have been removed
     # (cleaned?) from the `linked_list_2`, let's try to find the word
     # "him" in it.
-    found_him = ### FILL IN
+    found_him = linked_list_2.find_index_of_value('him')
+    print("Index of 'him' in linked_list_2: {}".format(found_him))
 
     # Now also let's print out the length of `linked_list_2`. It should
     # be quite different from the original value we printed out above
     # since less words are contained in the list.
+    print("Length of linked_list_2: {}".format(len(linked_list_2)))
 
     # Now let's try to get some subsequences within `linked_list_2`
     i = 67
@@ -825,13 +2984,23 @@ def main():
     
     # Use the `subsequence` function of the linked list to get the
     # subsequence of `linked_list_2` from `i` up to `j`.
-    part_of_linked_list_2 = ### FILL IN
-
-    ### PRINT OUT THE SUBSEQUENCE AND ITS LENGTH
+    part_of_linked_list_2 = linked_list_2.subsequence(i, j)
+    print("part_of_linked_list_2 = {}".format(str(part_of_linked_list_2)))
+    print("Length of part_of_linked_list_2: {}"
+          .format(len(part_of_linked_list_2)))
+
+    # `subsequence` copies the values into a new linked list. If we
+    # only want to look at them, we can use slicing instead, which
+    # gives us a "view" of that part of the list without copying
+    # anything. Since we implemented `__iter__`, we can loop over the
+    # view (or the list itself) like we would a Python list.
+    print("Every other word of linked_list_2[i:j]:")
+    for word in linked_list_2[i:j:2]:
+        print(word)
 
     # Let's try the `delete_index` function: delete the 500th element
     # of `linked_list_2`
-    ### FILL IN
+    linked_list_2.delete_index(499)
 
     print("Length of linked_list_2: {}".format(len(linked_list_2)))
 
@@ -839,9 +3008,9 @@ def main():
     # Specifically, add `part_of_linked_list_2` to `linked_list_1`
     # using the `+` operator and assign the result to `linked_list_3`
     # and print out the list and its length (like above)
-    linked_list_3 = ### FILL IN
-    ### FILL IN THE CODE FOR PRINTING OUT `linked_list_3` and its
-    ### length
+    linked_list_3 = linked_list_1 + part_of_linked_list_2
+    print("Length of linked_list_3: {}".format(len(linked_list_3)))
+    print("linked_list_3 = {}".format(str(linked_list_3)))
 
     print("Program complete!")
 
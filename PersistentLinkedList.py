@@ -0,0 +1,624 @@
+#!/usr/bin/env python
+from __future__ import print_function
+import mmap
+import os
+import struct
+
+"""
+A persistent linked list keeps its nodes in a file on disk instead of
+in memory, so it can hold more values than fit in memory and still be
+there the next time the program runs.
+
+The list is stored in two files. The "record file" (the path given to
+`PersistentLinkedList`) starts with a fixed-size header and is followed
+by one fixed-size record per node. Instead of referring to other nodes
+with Python references, a record refers to them by their record numbers
+(i.e., their positions in the file), so each record holds:
+
+    - where the node's value starts in the value file and its length
+    - the record number of the next node (-1 if there is none)
+    - the record number of the previous node (-1 if there is none)
+
+The values themselves (strings, encoded as UTF-8) are written one after
+another into the "value file" (the same path with ".values" added).
+
+Both files are memory-mapped with `mmap`, so reading or changing a
+record is just reading or changing bytes in memory, and the operating
+system takes care of loading the parts of the file that are used and
+writing changed parts back to disk. The program itself never holds
+more than a handful of records at a time, no matter how long the list
+is. Opening an existing list only reads the header.
+
+When a node is removed, its record is put on a "free list" (chained
+through the records' next record numbers) and reused for the next value
+that is added. The space its value took up in the value file is not
+reused, though, so the value file only ever grows.
+
+Changes are written to the files by the operating system in its own
+time (or when `flush` or `close` is called), so a list that was being
+changed when the program crashed may be left in an inconsistent state.
+"""
+
+# Header: magic bytes, number of elements, first record, last record,
+# first free record, number of records used so far (including freed
+# ones) and number of bytes used in the value file
+HEADER = struct.Struct('<8sQqqqQQ')
+HEADER_SIZE = 64
+MAGIC = b"PLLv1\0\0\0"
+
+# Record: value offset, value length, next record, previous record (the
+# last two can be changed on their own with `LINK_FIELD`)
+RECORD = struct.Struct('<QQqq')
+LINK_FIELD = struct.Struct('<q')
+NEXT_OFFSET = 16
+PREV_OFFSET = 24
+
+# Record number meaning "no record"
+NO_RECORD = -1
+
+
+class PersistentLinkedList:
+    """
+    Python implementation of a doubly linked list of strings stored in
+    memory-mapped files.
+    """
+
+    repr_max_elements = 20
+
+    def __init__(self, path, initial_capacity=1024):
+        """
+        Open the persistent linked list stored at `path`, creating an
+        empty one if the file doesn't exist yet (or is empty).
+
+        :param path: path to the record file (the values are stored in
+                     `path + ".values"`)
+        :type path: str
+        :param initial_capacity: number of records to make room for when
+                                 creating a new list (the files grow as
+                                 needed)
+        :type initial_capacity: int
+
+        :raises ValueError: if `initial_capacity` is less than 1 or the
+                            file isn't a persistent linked list
+        """
+
+        if initial_capacity < 1:
+            raise ValueError("initial_capacity must be at least 1.")
+
+        self.path = path
+        self.value_path = path + ".values"
+
+        is_new = not os.path.exists(path) or os.path.getsize(path) == 0
+        mode = 'w+b' if is_new else 'r+b'
+        self.record_file = open(path, mode)
+        if is_new:
+            self.record_file.truncate(HEADER_SIZE
+                                      + initial_capacity*RECORD.size)
+        self.record_map = mmap.mmap(self.record_file.fileno(), 0)
+
+        if is_new:
+            self.num_elements = 0
+            self.first_record = NO_RECORD
+            self.last_record = NO_RECORD
+            self.first_free_record = NO_RECORD
+            self.num_records = 0
+            self.value_size = 0
+            self._write_header()
+        else:
+            (magic, self.num_elements, self.first_record,
+             self.last_record, self.first_free_record, self.num_records,
+             self.value_size) = HEADER.unpack_from(self.record_map, 0)
+            if magic != MAGIC:
+                self.record_map.close()
+                self.record_file.close()
+                raise ValueError("Not a persistent linked list file.")
+
+        self.value_file = open(self.value_path, mode)
+        if is_new:
+            self.value_file.truncate(initial_capacity*16)
+        self.value_map = mmap.mmap(self.value_file.fileno(), 0)
+
+    def _write_header(self):
+        """
+        Write the list's bookkeeping attributes to the header of the
+        record file.
+        """
+
+        HEADER.pack_into(self.record_map, 0, MAGIC, self.num_elements,
+                         self.first_record, self.last_record,
+                         self.first_free_record, self.num_records,
+                         self.value_size)
+
+    def flush(self):
+        """
+        Write all changes out to disk.
+        """
+
+        self.record_map.flush()
+        self.value_map.flush()
+
+    def close(self):
+        """
+        Write all changes out to disk and close the files.
+        """
+
+        self.flush()
+        self.record_map.close()
+        self.value_map.close()
+        self.record_file.close()
+        self.value_file.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+    @staticmethod
+    def _grow(fileobj, file_map, min_size):
+        """
+        Make a memory-mapped file at least `min_size` bytes long
+        (doubling its size, so that growing the file one record at a
+        time takes constant time on average) and return the new map.
+
+        :param fileobj: the file
+        :type fileobj: file
+        :param file_map: the file's current map (which is closed)
+        :type file_map: mmap.mmap
+        :param min_size: minimum size in bytes
+        :type min_size: int
+
+        :returns: new map of the whole file
+        :rtype: mmap.mmap
+        """
+
+        new_size = max(min_size, 2*len(file_map))
+        file_map.flush()
+        file_map.close()
+        fileobj.truncate(new_size)
+
+        return mmap.mmap(fileobj.fileno(), new_size)
+
+    def _record_offset(self, record):
+        """
+        Return where a record starts in the record file.
+
+        :param record: record number
+        :type record: int
+
+        :returns: byte offset
+        :rtype: int
+        """
+
+        return HEADER_SIZE + record*RECORD.size
+
+    def _set_next(self, record, next_record):
+        """
+        Change the next record number of a record.
+
+        :param record: record number of the record to change
+        :type record: int
+        :param next_record: new next record number
+        :type next_record: int
+        """
+
+        LINK_FIELD.pack_into(self.record_map,
+                             self._record_offset(record) + NEXT_OFFSET,
+                             next_record)
+
+    def _set_prev(self, record, prev_record):
+        """
+        Change the previous record number of a record.
+
+        :param record: record number of the record to change
+        :type record: int
+        :param prev_record: new previous record number
+        :type prev_record: int
+        """
+
+        LINK_FIELD.pack_into(self.record_map,
+                             self._record_offset(record) + PREV_OFFSET,
+                             prev_record)
+
+    def _read_value(self, value_offset, value_length):
+        """
+        Read a value from the value file.
+
+        :param value_offset: where the value starts
+        :type value_offset: int
+        :param value_length: length of the encoded value in bytes
+        :type value_length: int
+
+        :returns: the value
+        :rtype: str
+        """
+
+        return self.value_map[value_offset:value_offset
+                              + value_length].decode('utf-8')
+
+    def _new_record(self, new_value, next_record, prev_record):
+        """
+        Write a new value to the value file and a new record for it to
+        the record file (reusing a freed record if there is one), and
+        return the record number. The neighboring records aren't
+        changed.
+
+        :param new_value: value of the new node
+        :type new_value: str
+        :param next_record: record number of the next node
+        :type next_record: int
+        :param prev_record: record number of the previous node
+        :type prev_record: int
+
+        :returns: record number of the new node
+        :rtype: int
+
+        :raises TypeError: if `new_value` isn't a string
+        """
+
+        if not isinstance(new_value, str):
+            raise TypeError("PersistentLinkedList can only store strings.")
+
+        data = new_value.encode('utf-8')
+        value_offset = self.value_size
+        if value_offset + len(data) > len(self.value_map):
+            self.value_map = self._grow(self.value_file, self.value_map,
+                                        value_offset + len(data))
+        self.value_map[value_offset:value_offset + len(data)] = data
+        self.value_size += len(data)
+
+        if self.first_free_record != NO_RECORD:
+            record = self.first_free_record
+            self.first_free_record = RECORD.unpack_from(
+                self.record_map, self._record_offset(record))[2]
+        else:
+            record = self.num_records
+            self.num_records += 1
+            record_end = self._record_offset(record + 1)
+            if record_end > len(self.record_map):
+                self.record_map = self._grow(self.record_file,
+                                             self.record_map, record_end)
+
+        RECORD.pack_into(self.record_map, self._record_offset(record),
+                         value_offset, len(data), next_record, prev_record)
+
+        return record
+
+    def _unlink(self, record):
+        """
+        Remove a node from the list, put its record on the free list and
+        return its value.
+
+        :param record: record number of the node to remove
+        :type record: int
+
+        :returns: value of the removed node
+        :rtype: str
+        """
+
+        value_offset, value_length, next_record, prev_record = \
+            RECORD.unpack_from(self.record_map, self._record_offset(record))
+
+        if prev_record == NO_RECORD:
+            self.first_record = next_record
+        else:
+            self._set_next(prev_record, next_record)
+        if next_record == NO_RECORD:
+            self.last_record = prev_record
+        else:
+            self._set_prev(next_record, prev_record)
+
+        self._set_next(record, self.first_free_record)
+        self.first_free_record = record
+        self.num_elements -= 1
+        self._write_header()
+
+        return self._read_value(value_offset, value_length)
+
+    def _iter_records(self):
+        """
+        Iterate over the nodes of the list, giving the record number,
+        value offset and value length of each.
+        """
+
+        record = self.first_record
+        while record != NO_RECORD:
+            value_offset, value_length, next_record, _ = RECORD.unpack_from(
+                self.record_map, self._record_offset(record))
+            yield record, value_offset, value_length
+            record = next_record
+
+    def _find_record(self, value_to_find):
+        """
+        Return the index and record number of the first node holding
+        the given value, or (-1, `NO_RECORD`) if there is none.
+
+        The value is encoded once and compared with the bytes in the
+        value file, so the values passed over never have to be decoded.
+
+        :param value_to_find: value to look for
+        :type value_to_find: str
+
+        :returns: index and record number
+        :rtype: tuple
+        """
+
+        if not isinstance(value_to_find, str):
+            return -1, NO_RECORD
+
+        data = value_to_find.encode('utf-8')
+        value_map = self.value_map
+        for index, (record, value_offset, value_length) in enumerate(
+                self._iter_records()):
+            if (value_length == len(data)
+                    and value_map[value_offset:value_offset
+                                  + value_length] == data):
+                return index, record
+
+        return -1, NO_RECORD
+
+    def is_empty(self):
+        """
+        Return True if the list is empty.
+
+        :returns: whether or not the list is empty
+        :rtype: bool
+        """
+
+        return self.num_elements == 0
+
+    def push(self, new_value):
+        """
+        Insert a new value at the beginning of the list.
+
+        :param new_value: new value to insert
+        :type new_value: str
+        """
+
+        record = self._new_record(new_value, self.first_record, NO_RECORD)
+        if self.first_record == NO_RECORD:
+            self.last_record = record
+        else:
+            self._set_prev(self.first_record, record)
+        self.first_record = record
+        self.num_elements += 1
+        self._write_header()
+
+    def append(self, new_value):
+        """
+        Insert a new value at the end of the list.
+
+        :param new_value: new value to insert
+        :type new_value: str
+        """
+
+        record = self._new_record(new_value, NO_RECORD, self.last_record)
+        if self.last_record == NO_RECORD:
+            self.first_record = record
+        else:
+            self._set_next(self.last_record, record)
+        self.last_record = record
+        self.num_elements += 1
+        self._write_header()
+
+    def extend(self, values):
+        """
+        Append all of the values of an iterable to the end of the list.
+
+        :param values: values to append
+        :type values: iterable
+        """
+
+        for value in values:
+            self.append(value)
+
+    def find_index_of_value(self, value_to_find):
+        """
+        Find the index of the first occurrence of the given value, or -1
+        if the value isn't in the list.
+
+        :param value_to_find: value to look for
+        :type value_to_find: str
+
+        :returns: index of value or -1
+        :rtype: int
+        """
+
+        return self._find_record(value_to_find)[0]
+
+    def __len__(self):
+        """
+        Return the number of elements in the list.
+
+        :returns: number of elements in the list
+        :rtype: int
+        """
+
+        return self.num_elements
+
+    def __contains__(self, value):
+        """
+        Return True if the value is in the list.
+
+        :param value: value to look for
+        :type value: str
+
+        :returns: whether or not the value is in the list
+        :rtype: bool
+        """
+
+        return self._find_record(value)[1] != NO_RECORD
+
+    def __iter__(self):
+        """
+        Iterate over the values of the list from first to last.
+        """
+
+        for _, value_offset, value_length in self._iter_records():
+            yield self._read_value(value_offset, value_length)
+
+    def __reversed__(self):
+        """
+        Iterate over the values of the list from last to first.
+        """
+
+        record = self.last_record
+        while record != NO_RECORD:
+            value_offset, value_length, _, prev_record = RECORD.unpack_from(
+                self.record_map, self._record_offset(record))
+            yield self._read_value(value_offset, value_length)
+            record = prev_record
+
+    def to_string(self, max_elements=None):
+        """
+        Return a string representation of the list in the same format
+        as `LinkedList.to_string`, e.g., "[[a, b, c]]" or
+        "[[a, b, c, ... (n=120345)]]".
+
+        :param max_elements: maximum number of elements to show (None
+                             means show all of them)
+        :type max_elements: int or None
+
+        :returns: string representation of the list
+        :rtype: str
+        """
+
+        values = []
+        for value in self:
+            if max_elements is not None and len(values) == max_elements:
+                values.append("... (n={})".format(len(self)))
+                break
+            values.append(value)
+
+        return "[[" + ", ".join(values) + "]]"
+
+    def __str__(self):
+        """
+        Return a string representation of the list.
+
+        :returns: string representation of the list
+        :rtype: str
+        """
+
+        return self.to_string()
+
+    def __repr__(self):
+        """
+        Return a string representation of the list that shows at most
+        `repr_max_elements` elements.
+
+        :returns: string representation of the list
+        :rtype: str
+        """
+
+        return self.to_string(max_elements=self.repr_max_elements)
+
+    def remove_value(self, value_to_remove):
+        """
+        Find and remove the first occurrence of the given value and
+        return True if the removal was successful or False if the value
+        could not be located anywhere in the list.
+
+        :param value_to_remove: value to find/remove in the list
+        :type value_to_remove: str
+
+        :returns: whether or not the value was found/removed
+        :rtype: bool
+        """
+
+        record = self._find_record(value_to_remove)[1]
+        if record == NO_RECORD:
+            return False
+
+        self._unlink(record)
+        return True
+
+    def pop_from_beginning(self):
+        """
+        Remove and return the first value of the list.
+
+        :returns: first value
+        :rtype: str
+
+        :raises ValueError: if list is empty
+        """
+
+        if self.is_empty():
+            raise ValueError("Linked list is empty!")
+
+        return self._unlink(self.first_record)
+
+    def pop_from_end(self):
+        """
+        Remove and return the last value of the list.
+
+        :returns: last value
+        :rtype: str
+
+        :raises ValueError: if list is empty
+        """
+
+        if self.is_empty():
+            raise ValueError("Linked list is empty!")
+
+        return self._unlink(self.last_record)
+
+    def delete_index(self, index):
+        """
+        Remove the element at the given index. Return True if successful;
+        False otherwise.
+
+        :param index: index (starting from zero) of element to remove
+        :type index: int
+
+        :returns: whether or not the deletion was successful
+        :rtype: bool
+        """
+
+        if index < 0 or index >= len(self):
+            return False
+
+        for current_index, (record, _, _) in enumerate(self._iter_records()):
+            if current_index == index:
+                self._unlink(record)
+                return True
+
+
+def main():
+
+    # Store the words of "Pride and Prejudice" in a persistent linked
+    # list (starting over if it was left behind by an earlier run)
+    path = 'pride_and_prejudice.pll'
+    for old_path in [path, path + ".values"]:
+        if os.path.exists(old_path):
+            os.remove(old_path)
+
+    with PersistentLinkedList(path) as persistent_linked_list:
+        with open('data/pride_and_prejudice.txt') as text_file:
+            for line in text_file:
+                persistent_linked_list.extend(line.lower().split())
+
+    # Reopening the list only reads the header of the file
+    with PersistentLinkedList(path) as persistent_linked_list:
+        print("Length of persistent_linked_list: {}"
+              .format(len(persistent_linked_list)))
+
+        for word in ["small", "hate", "table", "coffee", "python"]:
+            print("Index of '{}' in persistent_linked_list: {}"
+                  .format(word,
+                          persistent_linked_list.find_index_of_value(word)))
+
+        persistent_linked_list.remove_value("pride")
+        print("First word: {}"
+              .format(persistent_linked_list.pop_from_beginning()))
+        print("Last word: {}".format(persistent_linked_list.pop_from_end()))
+        print("persistent_linked_list = {!r}".format(persistent_linked_list))
+
+    for old_path in [path, path + ".values"]:
+        os.remove(old_path)
+
+    print("Program complete!")
+
+
+if __name__ == '__main__':
+    main()
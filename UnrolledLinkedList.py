@@ -0,0 +1,481 @@
+#!/usr/bin/env python
+from __future__ import print_function
+from array import array
+
+"""
+An "unrolled" linked list is a linked list in which each node holds a
+small, fixed-capacity array of values instead of a single value. When
+making a linked list out of all of the words in a novel with
+`LinkedList`, every single word gets its own node object, which takes
+up memory and scatters the values all over the place. With an unrolled
+linked list, a single node (or "chunk") might hold 64 words, so there
+are 64 times fewer node objects to create and follow, and most of the
+work of searching through the list happens inside of the arrays, which
+Python does very quickly.
+
+The values of a chunk are stored either in a plain Python list (which
+can hold any kind of object) or, if a `typecode` is given, in an
+`array.array`, which stores homogeneous numeric data (e.g., `'i'` for
+ints or `'d'` for floats) very compactly.
+
+`UnrolledLinkedList` has the same methods as `LinkedList`.
+"""
+
+class UnrolledNode(object):
+    __slots__ = ('values', 'next_node')
+
+    def __init__(self, values=None, next_node=None):
+        self.values = values
+        self.next_node = next_node
+
+
+class UnrolledLinkedList:
+    """
+    Python implementation of an unrolled linked list.
+    """
+
+    def __init__(self, chunk_capacity=64, typecode=None):
+        """
+        Initialize an empty unrolled linked list (other than a header
+        node that points to nothing).
+
+        Like `LinkedList`, the list keeps a reference to its last chunk
+        (`tail_node`, which is the header node when the list is empty)
+        and a count of its elements (`num_elements`).
+
+        :param chunk_capacity: maximum number of values stored in each
+                               chunk
+        :type chunk_capacity: int
+        :param typecode: `array.array` typecode to use for storing the
+                         values of each chunk (if None, values are
+                         stored in regular lists and can be any kind of
+                         object)
+        :type typecode: str or None
+
+        :raises ValueError: if `chunk_capacity` is less than 1
+        """
+
+        if chunk_capacity < 1:
+            raise ValueError("chunk_capacity must be at least 1.")
+
+        self.chunk_capacity = chunk_capacity
+        self.typecode = typecode
+        self.header_node = UnrolledNode()
+        self.tail_node = self.header_node
+        self.num_elements = 0
+
+    def _new_values(self, values=()):
+        """
+        Make a new container for the values of a chunk.
+
+        :param values: initial values
+        :type values: iterable
+
+        :returns: array of values
+        :rtype: array.array or list
+        """
+
+        if self.typecode is None:
+            return list(values)
+        return array(self.typecode, values)
+
+    def _link_chunk_after(self, prev_node, values=()):
+        """
+        Insert a new chunk directly after `prev_node` and return it.
+
+        :param prev_node: chunk after which to insert the new chunk (may
+                          be the header node)
+        :type prev_node: UnrolledNode
+        :param values: initial values of the new chunk
+        :type values: iterable
+
+        :returns: the newly-inserted chunk
+        :rtype: UnrolledNode
+        """
+
+        new_node = UnrolledNode(values=self._new_values(values),
+                                next_node=prev_node.next_node)
+        prev_node.next_node = new_node
+        if prev_node is self.tail_node:
+            self.tail_node = new_node
+
+        return new_node
+
+    def _unlink_chunk_after(self, prev_node):
+        """
+        Remove the chunk directly after `prev_node` from the list.
+
+        :param prev_node: chunk preceding the chunk to remove (may be
+                          the header node)
+        :type prev_node: UnrolledNode
+        """
+
+        removed_node = prev_node.next_node
+        prev_node.next_node = removed_node.next_node
+        if removed_node is self.tail_node:
+            self.tail_node = prev_node
+        removed_node.next_node = None
+
+    def _delete_from_chunk(self, prev_node, index_in_chunk):
+        """
+        Delete the value at the given position of the chunk following
+        `prev_node`, removing the chunk if it becomes empty or merging
+        it with the chunk after it if, together, they would fill no
+        more than half of a chunk (which keeps the chunks from becoming
+        sparse after many deletions).
+
+        :param prev_node: chunk preceding the chunk containing the value
+        :type prev_node: UnrolledNode
+        :param index_in_chunk: position of the value within its chunk
+        :type index_in_chunk: int
+
+        :returns: the deleted value
+        :rtype: object
+        """
+
+        current_node = prev_node.next_node
+        value = current_node.values.pop(index_in_chunk)
+        self.num_elements -= 1
+
+        if not current_node.values:
+            self._unlink_chunk_after(prev_node)
+        else:
+            next_node = current_node.next_node
+            if (next_node is not None
+                and (len(current_node.values) + len(next_node.values)
+                     <= self.chunk_capacity//2)):
+                current_node.values.extend(next_node.values)
+                self._unlink_chunk_after(current_node)
+
+        return value
+
+    def is_empty(self):
+        """
+        Return False if the list contains any elements; True otherwise.
+
+        :returns: boolean value
+        :rtype: bool
+        """
+
+        return self.header_node.next_node is None
+
+    def push(self, new_value):
+        """
+        Add the given value to the start of the list, shifting all other
+        values one index forward.
+
+        If the first chunk is full, a new chunk is added in front of it.
+
+        :param new_value: new value to add to the beginning of the list
+        :type new_value: object
+        """
+
+        first_node = self.header_node.next_node
+        if first_node is None or len(first_node.values) >= self.chunk_capacity:
+            first_node = self._link_chunk_after(self.header_node)
+        first_node.values.insert(0, new_value)
+        self.num_elements += 1
+
+    def append(self, new_value):
+        """
+        Append new value to the end of the list.
+
+        If the last chunk is full, a new chunk is added after it.
+
+        :param new_value: new value to append to list
+        :type new_value: object
+        """
+
+        if (self.tail_node is self.header_node
+            or len(self.tail_node.values) >= self.chunk_capacity):
+            self._link_chunk_after(self.tail_node)
+        self.tail_node.values.append(new_value)
+        self.num_elements += 1
+
+    def _find(self, value_to_find):
+        """
+        Find the first occurrence of the given value.
+
+        :param value_to_find: value to look for
+        :type value_to_find: object
+
+        :returns: tuple consisting of the index of the value in the
+                  list, the chunk preceding the chunk containing it and
+                  the position of the value within its chunk (or None
+                  if the value was not found)
+        :rtype: tuple or None
+        """
+
+        prev_node = self.header_node
+        offset = 0
+        while prev_node.next_node is not None:
+            values = prev_node.next_node.values
+
+            # Let the chunk's own `index` method do the searching (this
+            # raises a ValueError if the value is not in the chunk)
+            try:
+                index_in_chunk = values.index(value_to_find)
+            except (ValueError, TypeError):
+                offset += len(values)
+                prev_node = prev_node.next_node
+                continue
+
+            return offset + index_in_chunk, prev_node, index_in_chunk
+
+        return None
+
+    def find_index_of_value(self, value_to_find):
+        """
+        Find the index of the first occurrence of the given value in
+        the list. If it is not found, return -1 to signify that the
+        value was not found.
+
+        :param value_to_find: value to look for in the elements of the
+                              linked list
+        :type value_to_find: object
+
+        :returns: index of the first element matching the given value
+                  (or -1 if the value was not found in the list at all)
+        :rtype: int
+        """
+
+        found = self._find(value_to_find)
+        if found is None:
+            return -1
+        return found[0]
+
+    def __len__(self):
+        """
+        Return the number of elements that are in the list.
+
+        :returns: number of elements in list
+        :rtype: int
+        """
+
+        return self.num_elements
+
+    def __str__(self):
+        """
+        Return a string representation of the `UnrolledLinkedList`
+        object (in double braces, like `LinkedList`).
+
+        :returns: string representation of the `UnrolledLinkedList`
+                  object
+        :rtype: str
+        """
+
+        value_strs = []
+        current_node = self.header_node.next_node
+        while current_node is not None:
+            value_strs.extend(str(value) for value in current_node.values)
+            current_node = current_node.next_node
+
+        return "[[{}]]".format(", ".join(value_strs))
+
+    def remove_value(self, value_to_remove):
+        """
+        Find and remove the first occurrence of the given value and
+        return True if the removal was successful or False if the value
+        could not be located anywhere in the list.
+
+        :param value_to_remove: value to find/remove in the list
+        :type value_to_remove: object
+
+        :returns: whether or not the value was found/removed
+        :rtype: bool
+        """
+
+        found = self._find(value_to_remove)
+        if found is None:
+            return False
+
+        _, prev_node, index_in_chunk = found
+        self._delete_from_chunk(prev_node, index_in_chunk)
+
+        return True
+
+    def subsequence(self, i, j):
+        """
+        Return a new `UnrolledLinkedList` object that consists of the
+        elements in the list that are from index `i` up to (but not
+        including) index `j`. If `j` represents a value that is larger
+        than the length of the list, just include the rest of the list.
+
+        :param i: start index
+        :type i: int
+        :param j: stop index
+        :type j: int
+
+        :returns: new unrolled linked list consisting of a subsequence
+                  of the elements in the current list
+        :rtype: UnrolledLinkedList
+
+        :raises IndexError: if `i` is too large
+        :raises ValueError: if the linked list is emtpy or if `i`/`j`
+                            are invalid values or `i` is larger than `j`
+        """
+
+        if not all(isinstance(x, int) for x in [i, j]):
+            raise ValueError("Parameters i and j should be integer values.")
+
+        if i > j:
+            raise ValueError("Parameter i is larger than parameter j.")
+
+        if self.is_empty():
+            raise ValueError("Linked list is currently empty!")
+
+        if len(self) - 1 <= i:
+            raise IndexError("The value of i is too large. The linked list "
+                             "only contains {} elements.".format(len(self)))
+
+        subsequence_list = UnrolledLinkedList(
+            chunk_capacity=self.chunk_capacity, typecode=self.typecode)
+        if i == j:
+            return subsequence_list
+
+        # Skip over whole chunks until we get to the one containing
+        # index `i` and then copy over slices of chunks until we get to
+        # index `j` (or the end of the list)
+        current_node = self.header_node.next_node
+        offset = 0
+        while current_node is not None and offset < j:
+            values = current_node.values
+            if offset + len(values) > i:
+                start = max(i - offset, 0)
+                stop = min(j - offset, len(values))
+                subsequence_list._link_chunk_after(subsequence_list.tail_node,
+                                                   values[start:stop])
+                subsequence_list.num_elements += stop - start
+            offset += len(values)
+            current_node = current_node.next_node
+
+        return subsequence_list
+
+    def pop_from_beginning(self):
+        """
+        Remove and return the first value.
+
+        :returns: value of first element
+        :rtype: object
+
+        :raises ValueError: if list is empty
+        """
+
+        if self.is_empty():
+            raise ValueError("Linked list is empty!")
+
+        return self._delete_from_chunk(self.header_node, 0)
+
+    def pop_from_end(self):
+        """
+        Remove and return the last value.
+
+        :returns: value of last element
+        :rtype: object
+
+        :raises ValueError: if list is empty
+        """
+
+        if self.is_empty():
+            raise ValueError("Linked list is empty!")
+
+        value = self.tail_node.values.pop()
+        self.num_elements -= 1
+
+        # If the last chunk is now empty, we need to find the chunk
+        # before it so that it can be unlinked (this only happens once
+        # every `chunk_capacity` pops, at most)
+        if not self.tail_node.values:
+            prev_node = self.header_node
+            while prev_node.next_node is not self.tail_node:
+                prev_node = prev_node.next_node
+            self._unlink_chunk_after(prev_node)
+
+        return value
+
+    def delete_index(self, index):
+        """
+        Remove the element at the given index, shifting all succeeding
+        elements back by one. Return True if successful; False
+        otherwise.
+
+        :param index: index (starting from zero) of element to remove
+        :type index: int
+
+        :returns: boolean value confirming that the deletion was
+                  successful (or unsucessful)
+        :rtype: bool
+        """
+
+        if index < 0 or index >= len(self):
+            return False
+
+        # Skip over whole chunks until we get to the one containing
+        # `index`
+        prev_node = self.header_node
+        offset = 0
+        while offset + len(prev_node.next_node.values) <= index:
+            offset += len(prev_node.next_node.values)
+            prev_node = prev_node.next_node
+
+        self._delete_from_chunk(prev_node, index - offset)
+
+        return True
+
+    def __add__(self, other_linked_list):
+        """
+        Combine one unrolled linked list together with another to make a
+        larger unrolled linked list.
+
+        :param other_linked_list: other unrolled linked list
+        :type other_linked_list: UnrolledLinkedList
+
+        :returns: combined unrolled linked list
+        :rtype: UnrolledLinkedList
+        """
+
+        combined_list = UnrolledLinkedList(chunk_capacity=self.chunk_capacity,
+                                           typecode=self.typecode)
+
+        # Copy the values a chunk at a time
+        for linked_list in [self, other_linked_list]:
+            current_node = linked_list.header_node.next_node
+            while current_node is not None:
+                combined_list._link_chunk_after(combined_list.tail_node,
+                                                current_node.values)
+                combined_list.num_elements += len(current_node.values)
+                current_node = current_node.next_node
+
+        return combined_list
+
+
+def main():
+
+    # Load the words of "Pride and Prejudice" into an unrolled linked
+    # list and look for some of them
+    unrolled_linked_list = UnrolledLinkedList()
+    with open('data/pride_and_prejudice.txt') as text_file:
+        for line in text_file:
+            for word in line.lower().split():
+                unrolled_linked_list.append(word)
+
+    print("Length of unrolled_linked_list: {}"
+          .format(len(unrolled_linked_list)))
+
+    for word in ["small", "hate", "table", "coffee", "python"]:
+        print("Index of '{}' in unrolled_linked_list: {}"
+              .format(word, unrolled_linked_list.find_index_of_value(word)))
+
+    # Numbers can be stored compactly in arrays
+    numbers = UnrolledLinkedList(chunk_capacity=8, typecode='i')
+    for x in range(20):
+        numbers.append(x)
+    numbers.remove_value(7)
+    numbers.delete_index(0)
+    print("numbers = {}".format(str(numbers)))
+
+    print("Program complete!")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,183 @@
+#!/usr/bin/env python
+from __future__ import print_function
+import argparse
+import threading
+import time
+
+try:
+    from queue import Queue
+except ImportError:
+    from Queue import Queue
+
+from LinkedList import ConcurrentLinkedQueue, LinkedList
+
+"""
+Measure the throughput of a producer/consumer queue as the number of
+threads grows.
+
+For each number of threads N, N producer threads each push
+`--num-values` values onto a shared queue while N consumer threads pop
+them off. The following queues are compared:
+
+    - `LinkedList` protected by a single global lock (appending at one
+      end and popping from the other)
+    - `ConcurrentLinkedQueue`, one value at a time
+    - `ConcurrentLinkedQueue`, in batches (`push_many`/`pop_many`)
+    - Python's own `queue.Queue`
+
+Run with:
+
+    python benchmark_concurrent_queue.py [--threads 1 2 4 8]
+"""
+
+# Pushed once per consumer after the producers are done to tell the
+# consumers to stop
+STOP = None
+
+
+class GlobalLockQueue:
+    """
+    Queue made from a `LinkedList` with every operation wrapped in the
+    same lock.
+    """
+
+    def __init__(self):
+        self.linked_list = LinkedList()
+        self.not_empty = threading.Condition(threading.Lock())
+
+    def push(self, new_value):
+        with self.not_empty:
+            self.linked_list.append(new_value)
+            self.not_empty.notify()
+
+    def pop(self):
+        with self.not_empty:
+            while self.linked_list.is_empty():
+                self.not_empty.wait()
+            return self.linked_list.pop_from_beginning()
+
+
+class StandardQueue(Queue):
+    """
+    `queue.Queue` with the same method names as the other queues.
+    """
+
+    def push(self, new_value):
+        self.put(new_value)
+
+    def pop(self):
+        return self.get()
+
+
+def produce_one_at_a_time(queue, num_values):
+    for value in range(num_values):
+        queue.push(value)
+
+
+def consume_one_at_a_time(queue):
+    while queue.pop() is not STOP:
+        pass
+
+
+def produce_in_batches(queue, num_values, batch_size):
+    for start in range(0, num_values, batch_size):
+        queue.push_many(range(start, min(start + batch_size, num_values)))
+
+
+def consume_in_batches(queue, batch_size):
+    while True:
+        values = queue.pop_many(batch_size)
+        num_stops = values.count(STOP)
+        if num_stops:
+
+            # Leave any extra stop signals for the other consumers
+            for _ in range(num_stops - 1):
+                queue.push(STOP)
+            return
+
+
+def run(make_queue, num_threads, num_values, batch_size=None):
+    """
+    Run the producers and consumers and return the number of values
+    that went through the queue per second.
+
+    :param make_queue: function that makes an empty queue
+    :type make_queue: function
+    :param num_threads: number of producer threads (and of consumer
+                        threads)
+    :type num_threads: int
+    :param num_values: number of values pushed by each producer
+    :type num_values: int
+    :param batch_size: number of values to push/pop at a time (None
+                       means one at a time)
+    :type batch_size: int or None
+
+    :returns: values per second
+    :rtype: float
+    """
+
+    queue = make_queue()
+    if batch_size is None:
+        producer_args = (queue, num_values)
+        producer, consumer = produce_one_at_a_time, consume_one_at_a_time
+        consumer_args = (queue,)
+    else:
+        producer_args = (queue, num_values, batch_size)
+        producer, consumer = produce_in_batches, consume_in_batches
+        consumer_args = (queue, batch_size)
+
+    producers = [threading.Thread(target=producer, args=producer_args)
+                 for _ in range(num_threads)]
+    consumers = [threading.Thread(target=consumer, args=consumer_args)
+                 for _ in range(num_threads)]
+
+    start_time = time.time()
+    for thread in producers + consumers:
+        thread.start()
+    for thread in producers:
+        thread.join()
+    for _ in consumers:
+        queue.push(STOP)
+    for thread in consumers:
+        thread.join()
+    elapsed = time.time() - start_time
+
+    return num_threads*num_values/elapsed
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description="Measure producer/consumer queue throughput as the "
+                    "number of threads grows.")
+    parser.add_argument('--threads', type=int, nargs='+', default=[1, 2, 4, 8],
+                        help="Numbers of producer (and consumer) threads to "
+                             "try (default: 1 2 4 8).")
+    parser.add_argument('--num-values', type=int, default=50000,
+                        help="Number of values pushed by each producer "
+                             "(default: 50000).")
+    parser.add_argument('--batch-size', type=int, default=100,
+                        help="Batch size for push_many/pop_many (default: "
+                             "100).")
+    args = parser.parse_args()
+
+    queue_types = [
+        ("LinkedList + global lock", GlobalLockQueue, None),
+        ("ConcurrentLinkedQueue", ConcurrentLinkedQueue, None),
+        ("ConcurrentLinkedQueue (batched)", ConcurrentLinkedQueue,
+         args.batch_size),
+        ("queue.Queue", StandardQueue, None),
+    ]
+
+    print("{:<35}".format("values/second")
+          + "".join("{:>14}".format("{} threads".format(num_threads))
+                    for num_threads in args.threads))
+    for name, make_queue, batch_size in queue_types:
+        results = [run(make_queue, num_threads, args.num_values,
+                       batch_size=batch_size)
+                   for num_threads in args.threads]
+        print("{:<35}".format(name)
+              + "".join("{:>14.0f}".format(result) for result in results))
+
+
+if __name__ == '__main__':
+    main()
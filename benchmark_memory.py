@@ -0,0 +1,124 @@
+#!/usr/bin/env python
+from __future__ import print_function
+import argparse
+import glob
+import sys
+import tracemalloc
+
+from LinkedList import LinkedList, DoublyLinkedList, Node
+
+"""
+Measure how many bytes each element of a linked list costs by loading
+the words of the bundled texts into linked lists and tracing the
+memory that gets allocated with `tracemalloc`.
+
+The words are read in before tracing starts, so the numbers only
+reflect the memory used by the nodes themselves (the strings are shared
+with the list of words and are not counted). `LinkedList` (which uses
+the `__slots__`-based `CompactNode`) is compared against a linked list
+made out of plain `Node` objects and against `DoublyLinkedList`.
+
+Run with:
+
+    python benchmark_memory.py [FILE1 FILE2 ...]
+
+If no files are given, all of the texts in `data` are used.
+"""
+
+
+class PlainNodeLinkedList(LinkedList):
+    """
+    `LinkedList` made up of plain `Node` objects (i.e., nodes that each
+    have their own `__dict__`).
+    """
+
+    node_type = Node
+
+
+LIST_TYPES = [PlainNodeLinkedList, LinkedList, DoublyLinkedList]
+
+
+def read_words(text_path):
+    """
+    Read in the words of a text (lower-cased and split on whitespace).
+
+    :param text_path: path to text file
+    :type text_path: str
+
+    :returns: list of words
+    :rtype: list
+    """
+
+    words = []
+    with open(text_path) as text_file:
+        for line in text_file:
+            words.extend(line.lower().split())
+
+    return words
+
+
+def measure_bytes_per_element(list_type, words):
+    """
+    Load the words into a new linked list of the given type and return
+    the number of bytes allocated per element.
+
+    :param list_type: linked list class to measure
+    :type list_type: type
+    :param words: list of words to load
+    :type words: list
+
+    :returns: bytes per element
+    :rtype: float
+    """
+
+    tracemalloc.start()
+    try:
+        linked_list = list_type()
+        for word in words:
+            linked_list.append(word)
+        allocated, _ = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+
+    return float(allocated)/max(len(linked_list), 1)
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description="Measure the memory used per element by the linked "
+                    "list implementations.")
+    parser.add_argument('text_paths', nargs='*',
+                        default=sorted(glob.glob('data/*.txt')),
+                        help="Text files to load (default: data/*.txt).")
+    parser.add_argument('--max-bytes-per-element', type=float, default=None,
+                        help="Exit with a non-zero status if `LinkedList` "
+                             "uses more than this many bytes per element "
+                             "on any text.")
+    args = parser.parse_args()
+
+    print("{:<45}{:>10}".format("text_path", "num_words")
+          + "".join("{:>22}".format(list_type.__name__)
+                    for list_type in LIST_TYPES))
+
+    too_big = False
+    for text_path in args.text_paths:
+        words = read_words(text_path)
+        results = [measure_bytes_per_element(list_type, words)
+                   for list_type in LIST_TYPES]
+        print("{:<45}{:>10}".format(text_path, len(words))
+              + "".join("{:>22.1f}".format(bytes_per_element)
+                        for bytes_per_element in results))
+
+        if (args.max_bytes_per_element is not None
+            and results[LIST_TYPES.index(LinkedList)]
+                > args.max_bytes_per_element):
+            too_big = True
+
+    if too_big:
+        print("LinkedList used more than {} bytes per element!"
+              .format(args.max_bytes_per_element))
+        sys.exit(1)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,161 @@
+#!/usr/bin/env python
+from __future__ import print_function
+import argparse
+import gc
+import time
+
+from LinkedList import CompactNode, LinkedList
+
+"""
+Measure how much a node pool helps a linked list that is used as a queue.
+
+The list is filled with `--queue-length` values and then, for
+`--num-rounds` rounds, a burst of `--burst-size` values is appended at
+the end and the same number of values is popped from the beginning, so
+the list keeps growing and shrinking back to the same length. Without a
+pool, every value appended needs a new node; with one, the nodes popped
+in one round are reused in the next. This is run with and without a
+node pool (see `NodePool` in `LinkedList.py`), and the following are
+reported:
+
+    - how long the rounds took
+    - how many nodes had to be created (counted by the node type that
+      both lists use, `CountingNode`, and, with a pool, checked against
+      the pool's own statistics)
+    - how many times the garbage collector ran (any generation) and
+      for how long in total (the collector runs after enough objects it
+      tracks, such as nodes, have been created without being freed)
+
+Run with:
+
+    python benchmark_node_pool.py [--num-rounds 1000] [--burst-size 1000]
+"""
+
+
+class CountingNode(CompactNode):
+    """
+    `CompactNode` that counts how many times one is created.
+    """
+
+    __slots__ = ()
+    num_created = 0
+
+    def __init__(self, value=None, next_node=None):
+        CountingNode.num_created += 1
+        CompactNode.__init__(self, value=value, next_node=next_node)
+
+
+class CountingLinkedList(LinkedList):
+    """
+    `LinkedList` whose nodes count how many of them are created.
+    """
+
+    node_type = CountingNode
+
+
+class GCTimer:
+    """
+    Count garbage collector runs and add up how long they take, using
+    `gc.callbacks`.
+    """
+
+    def __init__(self):
+        self.num_collections = 0
+        self.total_pause = 0.0
+        self.start_time = None
+
+    def __call__(self, phase, info):
+        if phase == 'start':
+            self.start_time = time.perf_counter()
+        elif self.start_time is not None:
+            self.total_pause += time.perf_counter() - self.start_time
+            self.num_collections += 1
+            self.start_time = None
+
+    def __enter__(self):
+        gc.callbacks.append(self)
+        return self
+
+    def __exit__(self, *exc_info):
+        gc.callbacks.remove(self)
+
+
+def run(pool_size, queue_length, num_rounds, burst_size):
+    """
+    Churn a queue made from a `LinkedList` and return the time taken,
+    the number of nodes created and the garbage collector statistics.
+
+    :param pool_size: maximum size of the node pool (None means no pool)
+    :type pool_size: int or None
+    :param queue_length: number of values in the queue between rounds
+    :type queue_length: int
+    :param num_rounds: number of append/pop rounds
+    :type num_rounds: int
+    :param burst_size: number of values appended and popped per round
+    :type burst_size: int
+
+    :returns: elapsed time, number of nodes created, number of
+              collections and total pause time
+    :rtype: tuple
+    """
+
+    queue = CountingLinkedList(pool_size=pool_size)
+    for i in range(queue_length):
+        queue.append(i)
+
+    num_created_before = CountingNode.num_created
+    if queue.node_pool is not None:
+        num_pool_created_before = queue.node_pool.stats()['num_created']
+    gc.collect()
+    with GCTimer() as gc_timer:
+        start_time = time.perf_counter()
+        for _ in range(num_rounds):
+            for i in range(burst_size):
+                queue.append(i)
+            for _ in range(burst_size):
+                queue.pop_from_beginning()
+        elapsed = time.perf_counter() - start_time
+
+    num_created = CountingNode.num_created - num_created_before
+
+    # Every node a list with a pool creates should come from the pool
+    if queue.node_pool is not None:
+        num_pool_created = (queue.node_pool.stats()['num_created']
+                            - num_pool_created_before)
+        if num_pool_created != num_created:
+            raise RuntimeError("{} nodes were created, but the pool only "
+                               "created {}.".format(num_created,
+                                                    num_pool_created))
+
+    return elapsed, num_created, gc_timer.num_collections, gc_timer.total_pause
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description="Compare a linked list queue with and without a node "
+                    "pool.")
+    parser.add_argument('--queue-length', type=int, default=10000,
+                        help="Number of values in the queue (default: "
+                             "10000).")
+    parser.add_argument('--num-rounds', type=int, default=1000,
+                        help="Number of append/pop rounds (default: 1000).")
+    parser.add_argument('--burst-size', type=int, default=1000,
+                        help="Number of values appended and popped per "
+                             "round (default: 1000).")
+    parser.add_argument('--pool-size', type=int, default=1024,
+                        help="Maximum size of the node pool (default: "
+                             "1024).")
+    args = parser.parse_args()
+
+    print("{:<20}{:>12}{:>16}{:>16}{:>16}".format(
+        "", "seconds", "nodes created", "GC runs", "GC pause (ms)"))
+    for name, pool_size in [("no pool", None),
+                            ("pool", args.pool_size)]:
+        elapsed, num_created, num_collections, total_pause = run(
+            pool_size, args.queue_length, args.num_rounds, args.burst_size)
+        print("{:<20}{:>12.3f}{:>16}{:>16}{:>16.1f}".format(
+            name, elapsed, num_created, num_collections, 1000*total_pause))
+
+
+if __name__ == '__main__':
+    main()
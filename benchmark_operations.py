@@ -0,0 +1,412 @@
+#!/usr/bin/env python
+from __future__ import print_function
+import argparse
+import glob
+import json
+import platform
+import sys
+import time
+from collections import deque, namedtuple
+from functools import partial
+from itertools import chain, cycle, islice, repeat
+
+from LinkedList import LinkedList, iter_file_tokens
+
+"""
+Time the operations of `LinkedList` against the same operations on
+Python's own `list` and `collections.deque`, for lists of 100 up to
+1,000,000 words taken from the texts in `data`.
+
+Each operation is timed in the style of `timeit`: it is called over and
+over (in batches that double in size, so that reading the clock doesn't
+add much to the time) until `--max-calls` calls have been made or
+`--time-budget` seconds have passed, and the time per call is worked
+out from the total. This is repeated `--repeat` times and the best time
+is kept, since anything slower than the best is just noise from other
+programs running at the same time. Operations that change the list are
+given a freshly-built list for every repetition.
+
+The results are printed as a table and can be written to a JSON file
+with `--output`. Passing an earlier JSON file to `--compare` prints
+every result that got slower by more than `--threshold` times and exits
+with a non-zero status if there are any, so that the benchmark can
+catch regressions between versions.
+
+Run with:
+
+    python benchmark_operations.py [--sizes 100 1000 10000]
+        [--output results.json]
+"""
+
+# Value looked for by `find_index_of_value` and removed by
+# `remove_value`; copies of it are placed from the middle of each list
+# on, so that those operations all have to search through half of it
+MARKER = "\0marker"
+
+# Value added by `push` and `append`
+NEW_VALUE = "\0new"
+
+CONTAINER_TYPES = [
+    ("LinkedList", LinkedList.from_iterable),
+    ("list", list),
+    ("deque", deque),
+]
+
+# `make_call` takes a container and the size of the benchmark and returns
+# a function that does the operation once; `changes_container` says
+# whether a fresh container is needed for every repetition
+Operation = namedtuple('Operation', ['name', 'changes_container',
+                                     'make_call'])
+
+
+def _num_markers(size):
+    """
+    Return how many copies of `MARKER` are put in a list of the given
+    size (this is also the most times `remove_value` can be called).
+
+    :param size: number of values in the list
+    :type size: int
+
+    :returns: number of markers
+    :rtype: int
+    """
+
+    return max(1, min(1000, size//4))
+
+
+def _subsequence_bounds(size):
+    """
+    Return the start and stop indices used by `subsequence`.
+
+    :param size: number of values in the list
+    :type size: int
+
+    :returns: start and stop indices
+    :rtype: tuple
+    """
+
+    # `subsequence` needs at least one value after the start index
+    start = min(size//2, size - 2)
+    return start, start + max(1, min(100, size//4))
+
+
+def _delete_middle(container):
+    """
+    Delete the value in the middle of a `list` or `deque`.
+
+    :param container: container to delete from
+    :type container: list or collections.deque
+    """
+
+    del container[len(container)//2]
+
+
+OPERATIONS = [
+    Operation('push', True, {
+        'LinkedList': lambda c, size: partial(c.push, NEW_VALUE),
+        'list': lambda c, size: partial(c.insert, 0, NEW_VALUE),
+        'deque': lambda c, size: partial(c.appendleft, NEW_VALUE)}),
+    Operation('append', True, {
+        'LinkedList': lambda c, size: partial(c.append, NEW_VALUE),
+        'list': lambda c, size: partial(c.append, NEW_VALUE),
+        'deque': lambda c, size: partial(c.append, NEW_VALUE)}),
+    Operation('find_index_of_value', False, {
+        'LinkedList': lambda c, size: partial(c.find_index_of_value, MARKER),
+        'list': lambda c, size: partial(c.index, MARKER),
+        'deque': lambda c, size: partial(c.index, MARKER)}),
+    Operation('remove_value', True, {
+        'LinkedList': lambda c, size: partial(c.remove_value, MARKER),
+        'list': lambda c, size: partial(c.remove, MARKER),
+        'deque': lambda c, size: partial(c.remove, MARKER)}),
+    Operation('subsequence', False, {
+        'LinkedList': lambda c, size: partial(c.subsequence,
+                                              *_subsequence_bounds(size)),
+        'list': lambda c, size: partial(c.__getitem__,
+                                        slice(*_subsequence_bounds(size))),
+        'deque': lambda c, size: lambda: deque(
+            islice(c, *_subsequence_bounds(size)))}),
+    Operation('delete_index', True, {
+        'LinkedList': lambda c, size: lambda: c.delete_index(len(c)//2),
+        'list': lambda c, size: partial(_delete_middle, c),
+        'deque': lambda c, size: partial(_delete_middle, c)}),
+    Operation('pop_from_beginning', True, {
+        'LinkedList': lambda c, size: c.pop_from_beginning,
+        'list': lambda c, size: partial(c.pop, 0),
+        'deque': lambda c, size: c.popleft}),
+    Operation('pop_from_end', True, {
+        'LinkedList': lambda c, size: c.pop_from_end,
+        'list': lambda c, size: c.pop,
+        'deque': lambda c, size: c.pop}),
+    Operation('__add__', False, {
+        'LinkedList': lambda c, size: partial(c.__add__, c),
+        'list': lambda c, size: partial(c.__add__, c),
+        'deque': lambda c, size: partial(c.__add__, c)}),
+    Operation('__str__', False, {
+        'LinkedList': lambda c, size: partial(str, c),
+        'list': lambda c, size: partial(str, c),
+        'deque': lambda c, size: partial(str, c)}),
+]
+
+
+def max_calls_for(operation_name, size, max_calls):
+    """
+    Return the most times an operation can be called on a list of the
+    given size (operations that remove values can't remove more values
+    than the list has, and `remove_value` can only remove markers).
+
+    :param operation_name: name of the operation
+    :type operation_name: str
+    :param size: number of values in the list
+    :type size: int
+    :param max_calls: maximum number of calls asked for
+    :type max_calls: int
+
+    :returns: maximum number of calls
+    :rtype: int
+    """
+
+    if operation_name == 'remove_value':
+        return min(max_calls, _num_markers(size))
+    if operation_name in ('delete_index', 'pop_from_beginning',
+                          'pop_from_end'):
+        return min(max_calls, size)
+
+    return max_calls
+
+
+def load_tokens(text_paths, max_size):
+    """
+    Read the words of the given texts (cycling through them again if
+    they don't have enough words) and return the first `max_size`.
+
+    :param text_paths: paths to text files
+    :type text_paths: list
+    :param max_size: number of words needed
+    :type max_size: int
+
+    :returns: list of words
+    :rtype: list
+    """
+
+    tokens = list(islice(chain.from_iterable(
+        iter_file_tokens(text_path) for text_path in text_paths), max_size))
+    if not tokens:
+        raise ValueError("No words found in the given texts.")
+
+    return list(islice(cycle(tokens), max_size))
+
+
+def make_values(tokens, size):
+    """
+    Return the first `size` words with markers placed from the middle
+    on (see `MARKER`).
+
+    :param tokens: words to use
+    :type tokens: list
+    :param size: number of values
+    :type size: int
+
+    :returns: list of values
+    :rtype: list
+    """
+
+    values = tokens[:size]
+    middle = size//2
+    num_markers = _num_markers(size)
+    values[middle:middle + num_markers] = [MARKER]*num_markers
+
+    return values
+
+
+def time_calls(call, max_calls, time_budget):
+    """
+    Call a function up to `max_calls` times (or until `time_budget`
+    seconds have passed) and return the average time per call.
+
+    :param call: function to time
+    :type call: function
+    :param max_calls: maximum number of calls
+    :type max_calls: int
+    :param time_budget: number of seconds after which to stop calling
+    :type time_budget: float
+
+    :returns: seconds per call
+    :rtype: float
+    """
+
+    num_calls = 0
+    elapsed = 0.0
+    batch_size = 1
+    while num_calls < max_calls and elapsed < time_budget:
+        batch_size = min(batch_size, max_calls - num_calls)
+        start_time = time.perf_counter()
+        for _ in repeat(None, batch_size):
+            call()
+        elapsed += time.perf_counter() - start_time
+        num_calls += batch_size
+        batch_size *= 2
+
+    return elapsed/num_calls
+
+
+def run(tokens, sizes, operations, num_repeats, max_calls, time_budget):
+    """
+    Time every operation on every type of container for every size and
+    return a list of results (one dictionary per container type,
+    operation and size).
+
+    :param tokens: words to fill the containers with
+    :type tokens: list
+    :param sizes: sizes of containers to try
+    :type sizes: list
+    :param operations: operations to time
+    :type operations: list
+    :param num_repeats: number of times to repeat each timing
+    :type num_repeats: int
+    :param max_calls: maximum number of calls per timing
+    :type max_calls: int
+    :param time_budget: maximum number of seconds per timing
+    :type time_budget: float
+
+    :returns: list of results
+    :rtype: list
+    """
+
+    results = []
+    for size in sizes:
+        values = make_values(tokens, size)
+        for container_name, make_container in CONTAINER_TYPES:
+            shared_container = make_container(values)
+            for operation in operations:
+                num_calls = max_calls_for(operation.name, size, max_calls)
+                timings = []
+                for _ in range(num_repeats):
+                    if operation.changes_container:
+                        container = make_container(values)
+                    else:
+                        container = shared_container
+                    call = operation.make_call[container_name](container,
+                                                               size)
+                    timings.append(time_calls(call, num_calls, time_budget))
+
+                result = {'container': container_name,
+                          'operation': operation.name,
+                          'size': size,
+                          'seconds_per_call': min(timings),
+                          'timings': timings}
+                results.append(result)
+                print("{:<12}{:<22}{:>10}{:>16.3f}".format(
+                    container_name, operation.name, size,
+                    1e6*result['seconds_per_call']))
+                sys.stdout.flush()
+
+    return results
+
+
+def compare(results, baseline_results, threshold):
+    """
+    Print every result that is more than `threshold` times slower than
+    the matching result in an earlier run and return how many there
+    are.
+
+    :param results: results of this run
+    :type results: list
+    :param baseline_results: results of the earlier run
+    :type baseline_results: list
+    :param threshold: slowdown ratio above which a result counts as a
+                      regression
+    :type threshold: float
+
+    :returns: number of regressions
+    :rtype: int
+    """
+
+    baseline = dict(((result['container'], result['operation'],
+                      result['size']), result['seconds_per_call'])
+                    for result in baseline_results)
+
+    num_regressions = 0
+    for result in results:
+        key = (result['container'], result['operation'], result['size'])
+        if key not in baseline or baseline[key] <= 0:
+            continue
+        ratio = result['seconds_per_call']/baseline[key]
+        if ratio > threshold:
+            num_regressions += 1
+            print("Regression: {} {} (size {}) is {:.2f} times slower "
+                  "({:.3f} us vs {:.3f} us)".format(
+                      key[0], key[1], key[2], ratio,
+                      1e6*result['seconds_per_call'], 1e6*baseline[key]))
+
+    return num_regressions
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description="Time LinkedList operations against list and deque.")
+    parser.add_argument('--sizes', type=int, nargs='+',
+                        default=[100, 1000, 10000, 100000, 1000000],
+                        help="Numbers of values to put in the containers "
+                             "(default: 100 1000 10000 100000 1000000).")
+    parser.add_argument('--operations', nargs='+',
+                        choices=[operation.name for operation in OPERATIONS],
+                        default=None,
+                        help="Operations to time (default: all of them).")
+    parser.add_argument('--texts', nargs='+',
+                        default=sorted(glob.glob('data/*.txt')),
+                        help="Text files to take words from (default: "
+                             "data/*.txt).")
+    parser.add_argument('--repeat', type=int, default=3,
+                        help="Number of times to repeat each timing "
+                             "(default: 3).")
+    parser.add_argument('--max-calls', type=int, default=1000,
+                        help="Maximum number of calls per timing (default: "
+                             "1000).")
+    parser.add_argument('--time-budget', type=float, default=0.2,
+                        help="Maximum number of seconds per timing "
+                             "(default: 0.2).")
+    parser.add_argument('--output', default=None,
+                        help="JSON file to write the results to.")
+    parser.add_argument('--compare', default=None,
+                        help="JSON file from an earlier run to compare "
+                             "against.")
+    parser.add_argument('--threshold', type=float, default=1.5,
+                        help="Slowdown ratio that counts as a regression "
+                             "when comparing (default: 1.5).")
+    args = parser.parse_args()
+    if min(args.sizes) < 2:
+        parser.error("--sizes must all be at least 2.")
+
+    operations = [operation for operation in OPERATIONS
+                  if args.operations is None
+                  or operation.name in args.operations]
+    tokens = load_tokens(args.texts, max(args.sizes))
+
+    print("{:<12}{:<22}{:>10}{:>16}".format("container", "operation", "size",
+                                            "us/call"))
+    results = run(tokens, args.sizes, operations, args.repeat,
+                  args.max_calls, args.time_budget)
+
+    if args.output is not None:
+        with open(args.output, 'w') as output_file:
+            json.dump({'python_version': platform.python_version(),
+                       'python_implementation':
+                           platform.python_implementation(),
+                       'platform': platform.platform(),
+                       'time': time.strftime('%Y-%m-%dT%H:%M:%S'),
+                       'texts': args.texts,
+                       'repeat': args.repeat,
+                       'max_calls': args.max_calls,
+                       'time_budget': args.time_budget,
+                       'results': results},
+                      output_file, indent=2)
+
+    if args.compare is not None:
+        with open(args.compare) as baseline_file:
+            baseline_results = json.load(baseline_file)['results']
+        if compare(results, baseline_results, args.threshold):
+            sys.exit(1)
+
+
+if __name__ == '__main__':
+    main()
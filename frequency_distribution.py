@@ -1,5 +1,21 @@
 #!/usr/bin/env python
 from __future__ import print_function
+import locale
+import mmap
+import os
+import re
+from concurrent.futures import ProcessPoolExecutor
+from functools import reduce
+from itertools import repeat
+
+try:
+    # `collections.Counter` counts with this function, which is written
+    # in C (in Python 3)
+    from collections import _count_elements
+except ImportError:
+    def _count_elements(mapping, iterable):
+        for element in iterable:
+            mapping[element] = mapping.get(element, 0) + 1
 
 # Main idea: Count the words in a file and make a frequency
 # distribution and then print out a list of the top 20 words and their
@@ -14,10 +30,43 @@ from __future__ import print_function
 
 # Text to read in: data/pride_and_prejudice.txt
 
+def _most_common_first(word_freq):
+    """
+    Sort key that puts word/frequency pairs in order from most to least
+    frequent (and words with the same frequency in alphabetical order).
+
+    :param word_freq: word/frequency pair
+    :type word_freq: tuple
+
+    :returns: sort key
+    :rtype: tuple
+    """
+
+    return -word_freq[1], word_freq[0]
+
+
+def _least_common_first(word_freq):
+    """
+    Sort key that puts word/frequency pairs in order from least to most
+    frequent (and words with the same frequency in alphabetical order).
+
+    :param word_freq: word/frequency pair
+    :type word_freq: tuple
+
+    :returns: sort key
+    :rtype: tuple
+    """
+
+    return word_freq[1], word_freq[0]
+
+
 def get_sorted_word_freqs(freq_dist, n, reverse=False):
     """
-    Sort a dictionary of word/frequency pairs and return the first n
-    word/frequency pairs as a list of tuples.
+    Rank the word/frequency pairs of a dictionary from least to most
+    frequent (or, if `reverse` is True, from most to least frequent)
+    and return the first n word/frequency pairs as a list of tuples.
+    Words with the same frequency are ranked in alphabetical order, so
+    the result doesn't depend on the order of the dictionary.
 
     :param freq_dist: frequency distribution of words
     :type freq_dist: dict
@@ -31,45 +80,117 @@ def get_sorted_word_freqs(freq_dist, n, reverse=False):
     :rtype: list
     """
 
-    # Let's first turn the dictionary of word/frequency pairs into a
-    # list of word/frequency tuples. This can be done automatically
-    # using the "items()" method, i.e., "d.items()", where `d` is 
-    # dictionary.
-    word_freq_tuples = # FILL IN
-
-    # Now sort the list by the second value of every tuple (i.e., the
-    # frequency part)
-    # To do this, we'll use the "sorted" function and define an
-    # anonymous function, i.e., a "lambda" function, to define the
-    # sorting
-    word_freq_tuples = sorted(word_freq_tuples, key=lambda x: x[1])
-    # This lambda function in the line above basically says, for each
-    # `x` in `word_freq_tuples`, give me the index 1 part (i.e., the
-    # second part of the tuple). This is what the sorting uses to sort.
-
-    # Now we need to deal with whether or not we're sorting from lowest
-    # to highest or highest to lowest. Normally, it will be the former.
-    if reverse: # Same as "if reverse == True"
-
-        # Note: Either use the "reversed" function to reverse the list
-        # and assign it back to itself or use the reverse slicing
-        # trick, which I really like personally. The reverse slicing
-        # trick goes like:
-        #
-        # >>> [1, 2, 3, 4, 5][::-1]
-        # [5, 4, 3, 2, 1].
-        #
-        # The `[::-1]` part is what does the slicing.
-        word_freq_tuples = # FILL IN
-
-    # Now we need to return a list of first `n` samples in the list.
-    # Hint: Use slicing to get the first `n` elements in the list and
-    # return only that part of the list.
-    n_word_freq_tuples = # FILL IN
+    # We could turn the dictionary into a list of word/frequency tuples
+    # (with the "items()" method), sort the whole list by frequency and
+    # then slice off the first `n` tuples. But sorting a list of tens
+    # of thousands of words just to keep 20 of them is a waste of time,
+    # so `_select_word_freqs` only keeps track of the best `n` tuples
+    # as it goes through the dictionary.
+    most_common, least_common = _select_word_freqs(
+        freq_dist, n, want_most_common=reverse,
+        want_least_common=not reverse)
+    n_word_freq_tuples = most_common if reverse else least_common
 
     return n_word_freq_tuples
 
 
+def get_top_and_bottom_word_freqs(freq_dist, n):
+    """
+    Return both the n most frequent and the n least frequent
+    word/frequency pairs of a dictionary (the same as
+    `get_sorted_word_freqs(freq_dist, n, reverse=True)` and
+    `get_sorted_word_freqs(freq_dist, n)`) from a single pass over it.
+
+    :param freq_dist: frequency distribution of words
+    :type freq_dist: dict
+    :param n: number of pairs to return from each end
+    :type n: int
+
+    :returns: most frequent pairs and least frequent pairs
+    :rtype: tuple
+    """
+
+    return _select_word_freqs(freq_dist, n, want_most_common=True,
+                              want_least_common=True)
+
+
+def _keep_best(word_freq_tuples, n, key):
+    """
+    Sort a list of word/frequency pairs in place by the given key and
+    cut it down to the first n pairs.
+
+    :param word_freq_tuples: word/frequency pairs
+    :type word_freq_tuples: list
+    :param n: number of pairs to keep
+    :type n: int
+    :param key: sort key
+    :type key: function
+    """
+
+    word_freq_tuples.sort(key=key)
+    del word_freq_tuples[n:]
+
+
+def _select_word_freqs(freq_dist, n, want_most_common, want_least_common):
+    """
+    Go through a dictionary of word/frequency pairs once and return the
+    n most frequent pairs and/or the n least frequent pairs, ranked as
+    in `get_sorted_word_freqs`, in O(V log n) time for a vocabulary of V
+    words.
+
+    Pairs that might make it into the top (or bottom) `n` are collected
+    in a list, and whenever the list gets twice as long as it needs to
+    be, it is sorted and cut back down to the best `n`. After that, a
+    pair only has to be added to the list if it ranks ahead of the last
+    pair kept, which most pairs don't.
+
+    :param freq_dist: frequency distribution of words
+    :type freq_dist: dict
+    :param n: number of pairs to return from each end
+    :type n: int
+    :param want_most_common: whether to find the most frequent pairs
+    :type want_most_common: bool
+    :param want_least_common: whether to find the least frequent pairs
+    :type want_least_common: bool
+
+    :returns: most frequent pairs and least frequent pairs (empty lists
+              for whichever weren't wanted)
+    :rtype: tuple
+    """
+
+    most_common = []
+    least_common = []
+    if n <= 0:
+        return most_common, least_common
+
+    # Word and frequency of the last pair kept at each end (the pair
+    # that the next one has to beat)
+    top_word = top_freq = None
+    bottom_word = bottom_freq = None
+
+    for word, freq in freq_dist.items():
+
+        if want_most_common and (top_freq is None or freq > top_freq
+                                 or (freq == top_freq and word < top_word)):
+            most_common.append((word, freq))
+            if len(most_common) == 2*n:
+                _keep_best(most_common, n, _most_common_first)
+                top_word, top_freq = most_common[-1]
+
+        if want_least_common and (bottom_freq is None or freq < bottom_freq
+                                  or (freq == bottom_freq
+                                      and word < bottom_word)):
+            least_common.append((word, freq))
+            if len(least_common) == 2*n:
+                _keep_best(least_common, n, _least_common_first)
+                bottom_word, bottom_freq = least_common[-1]
+
+    _keep_best(most_common, n, _most_common_first)
+    _keep_best(least_common, n, _least_common_first)
+
+    return most_common, least_common
+
+
 def print_most_common(freq_dist):
     """
     Print out the 20 most common words and their frequencies.
@@ -80,14 +201,11 @@ def print_most_common(freq_dist):
     :returns: None
     """
 
-    # Call `get_sorted_word_freqs` with the correct parameters (is this
-    # the one where the `reverse` parameter has to be specified or is
-    # it the other one?) AND REMEMBER TO PRINT OUT THE VALUES (use
-    # syntax that can be read by either Python using the `print`
-    # function).
-    # Hint: Remember to use the `freq_dist` parameter that gets passed
-    # in to this function!
-    # FILL IN
+    # The pairs are ranked from least to most common by default, so we
+    # need to start from the back end of the ranking
+    print("20 most common words:")
+    for word, freq in get_sorted_word_freqs(freq_dist, 20, reverse=True):
+        print("{}\t{}".format(word, freq))
 
 
 def print_least_common(freq_dist):
@@ -100,18 +218,26 @@ def print_least_common(freq_dist):
     :returns: None
     """
 
-    # Call `get_sorted_word_freqs` with the correct parameters AND
-    # REMEMBER TO PRINT OUT THE VALUES (use syntax that can be read by
-    # either Python using the `print` function).
-    # FILL IN
+    print("20 least common words:")
+    for word, freq in get_sorted_word_freqs(freq_dist, 20):
+        print("{}\t{}".format(word, freq))
 
 
-def get_freq_dist(word_list):
+def get_freq_dist(word_list, batched=False):
     """
     Make a dictionary that has word-to-frequency mappings.
 
-    :param word_list: list of word tokens
-    :type word_list: list
+    `word_list` doesn't have to be a list: it can be any iterable of
+    words, such as a generator that reads them from a file, so that all
+    of the words never have to be held in memory at once. If `batched`
+    is True, `word_list` is instead an iterable of batches of words
+    (e.g., the list of words on each line of a file), and each batch is
+    counted in one go.
+
+    :param word_list: word tokens (or batches of word tokens)
+    :type word_list: iterable
+    :param batched: whether `word_list` is made up of batches of words
+    :type batched: bool
 
     :returns: dictionary of word-to-frequency mappings
     :rtype: dict
@@ -120,76 +246,354 @@ def get_freq_dist(word_list):
     # Make empty dictionary
     word_freqs = {}
 
-    # Iterate over the words in the word list and, for each word, check
-    # if it's in `word_freqs`: if it is, add 1 to the number and, if
-    # it's not, add an entry for the word to the dictionary and then
-    # set it to 1.
-    # Hint: To check whether a word is in the dictionary, use the
-    # `get()` method, i.e., `word_freqs.get(word)`
-    for word in word_list:
+    # The simple way to fill in the dictionary is to iterate over the
+    # words in the word list and, for each word, check if it's in
+    # `word_freqs` (using the `get()` method, i.e.,
+    # `word_freqs.get(word)`): if it is, add 1 to the number and, if
+    # it's not, add an entry for the word to the dictionary and set it
+    # to 1. But running those steps in Python for every single word
+    # takes most of the time of the whole program on a long book, so
+    # we let `_count_elements` do exactly the same thing in C instead
+    if batched:
+        for batch in word_list:
+            _count_elements(word_freqs, batch)
+    else:
+        _count_elements(word_freqs, word_list)
 
-        # Check if the word is in the dictionary first; if it is, you
-        # can just add 1 to its current frequency value
-        if # FILL IN
-            # FILL IN
+    return word_freqs
 
-        # Now deal with the situation where the word is not yet in the
-        # dictionary
-        else:
-            # FILL IN
 
-    return word_freqs
+def iter_text_chunks(text_path, chunk_size=1 << 16):
+    """
+    Iterate over a text file in chunks of about `chunk_size` characters
+    that never end in the middle of a word.
 
+    A chunk read from the file will usually end in the middle of a
+    word, so the part of the chunk after its last whitespace character
+    is held back and put in front of the next chunk. This way, words
+    are never split in two.
+
+    :param text_path: path to text file
+    :type text_path: str
+    :param chunk_size: number of characters to read at a time
+    :type chunk_size: int
+
+    :returns: generator of pieces of the text
+    :rtype: generator
+    """
+
+    leftover = ""
+    with open(text_path) as text_file:
+        while True:
+            chunk = text_file.read(chunk_size)
+            if not chunk:
+                break
+
+            text = leftover + chunk
+            if text[-1].isspace():
+                leftover = ""
+            else:
+
+                # Hold back the (possibly partial) word at the end
+                parts = text.rsplit(None, 1)
+                if len(parts) == 2:
+                    text, leftover = parts
+                else:
+                    text, leftover = "", parts[0]
+
+            yield text
+
+    if leftover:
+        yield leftover
+
+
+def iter_word_batches(text_path, chunk_size=1 << 16):
+    """
+    Iterate over the lower-cased words of a text file, reading it in
+    chunks of `chunk_size` characters (see `iter_text_chunks`) and
+    giving back the words of each chunk as a list.
+
+    :param text_path: path to text file
+    :type text_path: str
+    :param chunk_size: number of characters to read at a time
+    :type chunk_size: int
+
+    :returns: generator of lists of words
+    :rtype: generator
+    """
+
+    for text in iter_text_chunks(text_path, chunk_size=chunk_size):
+        yield text.lower().split()
 
-def main():
 
-    # Read in the file
-    inf = open # finish the line (the file's name is
-               # `pride-and-prejudice.txt`)
+def get_file_freq_dist(text_path, chunk_size=1 << 16):
+    """
+    Make a dictionary that has word-to-frequency mappings for the
+    (lower-cased) words of a text file without ever holding all of the
+    words (or the whole text) in memory (see `iter_word_batches`).
+
+    :param text_path: path to text file
+    :type text_path: str
+    :param chunk_size: number of characters to read at a time
+    :type chunk_size: int
+
+    :returns: dictionary of word-to-frequency mappings
+    :rtype: dict
+    """
+
+    return get_freq_dist(iter_word_batches(text_path, chunk_size=chunk_size),
+                         batched=True)
+
+
+# Bytes that can end a byte range in `split_byte_ranges`: ASCII
+# whitespace, which always separates words (and, in UTF-8 and other
+# ASCII-compatible encodings, never shows up inside of a multi-byte
+# character)
+_RANGE_END_PATTERN = re.compile(br"[ \t\n\r\x0b\x0c]")
+
+
+def split_byte_ranges(text_path, num_ranges):
+    """
+    Split a text file into (up to) `num_ranges` byte ranges of about the
+    same size that each end on whitespace, so that no word is split
+    between two ranges.
+
+    :param text_path: path to text file
+    :type text_path: str
+    :param num_ranges: number of ranges to split the file into
+    :type num_ranges: int
+
+    :returns: list of (start, end) byte offsets
+    :rtype: list
+    """
+
+    size = os.path.getsize(text_path)
+    boundaries = [0]
+    with open(text_path, 'rb') as text_file:
+        for i in range(1, num_ranges):
+
+            # Move forward from the ideal boundary to just after the
+            # next whitespace byte
+            boundary = max(size*i//num_ranges, boundaries[-1])
+            text_file.seek(boundary)
+            while True:
+                block = text_file.read(1 << 12)
+                if not block:
+                    boundary = size
+                    break
+                match = _RANGE_END_PATTERN.search(block)
+                if match is not None:
+                    boundary += match.end()
+                    break
+                boundary += len(block)
+
+            boundaries.append(boundary)
+    boundaries.append(size)
+
+    return [(start, end) for start, end in zip(boundaries, boundaries[1:])
+            if end > start]
+
+
+def iter_byte_range_words(text_path, ranges, encoding):
+    """
+    Iterate over the (lower-cased) words in some byte ranges of a text
+    file, giving back the words of each range as a list.
+
+    :param text_path: path to text file
+    :type text_path: str
+    :param ranges: (start, end) byte offsets of the ranges
+    :type ranges: list
+    :param encoding: encoding of the file
+    :type encoding: str
+
+    :returns: generator of lists of words
+    :rtype: generator
+    """
+
+    with open(text_path, 'rb') as text_file:
+        for start, end in ranges:
+            text_file.seek(start)
+            data = text_file.read(end - start)
+            yield data.decode(encoding).lower().split()
+
+
+def get_byte_ranges_freq_dist(text_path, ranges, encoding):
+    """
+    Make a dictionary that has word-to-frequency mappings for the
+    (lower-cased) words in some byte ranges of a text file, reading in
+    one range at a time.
+
+    :param text_path: path to text file
+    :type text_path: str
+    :param ranges: (start, end) byte offsets of the ranges
+    :type ranges: list
+    :param encoding: encoding of the file
+    :type encoding: str
+
+    :returns: dictionary of word-to-frequency mappings
+    :rtype: dict
+    """
+
+    return get_freq_dist(iter_byte_range_words(text_path, ranges, encoding),
+                         batched=True)
+
+
+# Runs of bytes that aren't ASCII whitespace, i.e., the raw words of a
+# text
+_TOKEN_PATTERN = re.compile(br"\S+")
+
+
+def iter_mapped_word_batches(text_path, encoding=None, window_size=1 << 16):
+    """
+    Iterate over the lower-cased words of a text file by memory-mapping
+    it and finding the words in the raw bytes, so that neither the text
+    nor its lines are ever copied into memory; only the words
+    themselves are decoded. The words are found `window_size` bytes
+    (give or take a word) at a time and the words of each window are
+    given back as a list.
+
+    The raw words of each window are joined together (with a space
+    between each pair) and decoded, lower-cased and split in one go,
+    which gives the same words as `text.lower().split()` (including
+    when a raw word has whitespace in it that isn't ASCII, e.g., a
+    no-break space) without decoding the whitespace between the words.
+
+    :param text_path: path to text file
+    :type text_path: str
+    :param encoding: encoding of the file, which must be ASCII-compatible
+                     (e.g., UTF-8); by default, the same encoding that
+                     `open` uses
+    :type encoding: str
+    :param window_size: number of bytes to find words in at a time
+    :type window_size: int
+
+    :returns: generator of lists of words
+    :rtype: generator
+    """
+
+    if encoding is None:
+        encoding = locale.getpreferredencoding(False)
+
+    with open(text_path, 'rb') as text_file:
+
+        # An empty file can't be memory-mapped (and has no words)
+        size = os.fstat(text_file.fileno()).st_size
+        if size == 0:
+            return
+
+        mapped_text = mmap.mmap(text_file.fileno(), 0, access=mmap.ACCESS_READ)
+        try:
+            start = 0
+            while start < size:
+
+                # Stretch the window to the next whitespace byte so that
+                # no word is split between two windows
+                end = start + window_size
+                match = (_RANGE_END_PATTERN.search(mapped_text, end)
+                         if end < size else None)
+                end = size if match is None else match.end()
+
+                tokens = _TOKEN_PATTERN.findall(mapped_text, start, end)
+                yield b" ".join(tokens).decode(encoding).lower().split()
+
+                start = end
+        finally:
+            mapped_text.close()
+
+
+def merge_freq_dists(freq_dist_1, freq_dist_2):
+    """
+    Add the frequencies of one word-to-frequency dictionary to another
+    and return the result (the smaller dictionary is merged into the
+    larger one, which is changed and returned).
+
+    :param freq_dist_1: frequency distribution of words
+    :type freq_dist_1: dict
+    :param freq_dist_2: frequency distribution of words
+    :type freq_dist_2: dict
+
+    :returns: merged frequency distribution
+    :rtype: dict
+    """
+
+    if len(freq_dist_1) < len(freq_dist_2):
+        freq_dist_1, freq_dist_2 = freq_dist_2, freq_dist_1
+
+    for word, freq in freq_dist_2.items():
+        freq_dist_1[word] = freq_dist_1.get(word, 0) + freq
+
+    return freq_dist_1
+
+
+def get_parallel_file_freq_dist(text_path, jobs, max_range_size=1 << 23,
+                                encoding=None):
+    """
+    Make a dictionary that has word-to-frequency mappings for the
+    (lower-cased) words of a text file, splitting the file into byte
+    ranges (see `split_byte_ranges`) that are counted by `jobs` worker
+    processes and merging the counts (see `merge_freq_dists`). The
+    result is exactly the same as that of `get_file_freq_dist`.
+
+    There are at least as many ranges as workers, and more if needed
+    to keep each range within `max_range_size` bytes, since a worker
+    reads a whole range into memory at a time. The ranges are dealt
+    out to the workers, and each worker counts all of its ranges into
+    a single dictionary, so only one dictionary per worker is sent
+    back (sending dictionaries between processes is slow) and merged
+    in this process.
+
+    :param text_path: path to text file
+    :type text_path: str
+    :param jobs: number of worker processes (1 means count the ranges
+                 in this process)
+    :type jobs: int
+    :param max_range_size: maximum number of bytes in a range
+    :type max_range_size: int
+    :param encoding: encoding of the file, which must be ASCII-compatible
+                     (e.g., UTF-8); by default, the same encoding that
+                     `open` uses
+    :type encoding: str
+
+    :returns: dictionary of word-to-frequency mappings
+    :rtype: dict
+    """
+
+    if encoding is None:
+        encoding = locale.getpreferredencoding(False)
+
+    size = os.path.getsize(text_path)
+    num_ranges = max(jobs, -(-size//max_range_size))
+    ranges = split_byte_ranges(text_path, num_ranges)
+
+    if jobs == 1:
+        return get_byte_ranges_freq_dist(text_path, ranges, encoding)
+
+    range_groups = [ranges[i::jobs] for i in range(jobs)]
+    with ProcessPoolExecutor(max_workers=jobs) as executor:
+        freq_dists = executor.map(get_byte_ranges_freq_dist,
+                                  repeat(text_path), range_groups,
+                                  repeat(encoding))
+        return reduce(merge_freq_dists, freq_dists, {})
+
+
+def main():
 
-    # Let's make a list of the words that occur in the text
+    # The simple way to count the words would be to read the lines of
+    # the file one at a time, strip off spaces at the ends of each line
+    # and lower-case it (`line.strip().lower()`), split it on
+    # whitespace to get the actual words (`line.split()`) and add them
+    # to a big, big list of words (with `words.extend(...)`, since
+    # `append()` would add the whole list of words as a single
+    # element), and then hand the list to `get_freq_dist`. But that
+    # list needs memory for every single word in the text, which is a
+    # problem for very large texts. Instead, `get_file_freq_dist` reads
+    # the file a chunk at a time and counts the words of each chunk
+    # right away, so only the frequency distribution itself (with one
+    # entry per unique word) needs to be kept in memory.
     # Note: Don't worry about commas and weird stuff in the text. Just
     # assume that every line looks like "this is a line", no weird
     # stuff.
-    words = []
-    for line in inf.readlines():
-
-        # Strip off spaces at the ends of the line (either beginning or
-        # end) and lower-case the line, but do it in only one line,
-        # hint: use the `strip()` method and the `lower()` method and
-        # chain them together
-        line = # FILL IN
-        # Note: The line above starts off with `line = ...`. This
-        # will just change the value of the "line" variable, so we can
-        # keep reusing the same name and not need to create new
-        # variables for each step. Although, obviously, once it's been
-        # changed, its original value can't be recovered (unless you
-        # specifically save it to a different variable, for example).
-
-        # Split line on whitespace to get actual words, hint: use the
-        # `split()` method
-        # Note: This will turn the string into a list of strings, so,
-        # after executing, `line` will be a list of strings, not a
-        # string.
-        line = # FILL IN
-
-        # Add words to list of words
-        # Hint: Use `extend()` method on the words list
-        # Question: Why can't you just use `append()` instead of
-        # `extend()`?
-        # FILL IN
-
-    # Ok, now we got a big, big list of words
-    # In order to deal with it, I'm going to explain what I think you
-    # should do and I want you to do it, but there's a twist. I want
-    # you to implement it in a function which is actually above. It's
-    # called `get_freq_dist` and it accepts a list of words. This is
-    # what learning programming is all about. You find out what a
-    # function needs and you build that so that you can use the
-    # function or you are tasked with designing a function that is
-    # supposed to handle a thing like a list and do something like get
-    # the frequencies of all the items. So, you'll do that now.
-    freq_dist = get_freq_dist(words)
+    freq_dist = get_file_freq_dist('data/pride_and_prejudice.txt')
 
     # Now, for the last part
     # This is going to be a little more difficult in some ways. What I
@@ -205,8 +609,8 @@ def main():
     # method). See the functions/method above for more info. Hint: work
     # on the more abstract function first. It will be used by the other
     # methods, so it should be finished first.
-    print_most_common(word_freqs)
-    print_least_common(word_freqs)
+    print_most_common(freq_dist)
+    print_least_common(freq_dist)
 
 
 if __name__ == '__main__':
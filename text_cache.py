@@ -0,0 +1,264 @@
+#!/usr/bin/env python
+from __future__ import print_function
+import hashlib
+import json
+import os
+import sqlite3
+import time
+import zlib
+
+"""
+A cache of the results of processing texts (see `text_processor.py`),
+stored in an SQLite database on disk so that the results are still
+there the next time the program runs.
+
+Each text's results are stored under the text's path, along with the
+size, modification time and SHA-256 hash of its contents when it was
+processed. A text's results are only used if its file hasn't changed:
+if its size or contents are different, the results are ignored. (The
+hash is only computed when the size is the same but the modification
+time isn't, e.g., when the file was touched or copied but not changed,
+so checking an unchanged file is quick.)
+
+The frequency distribution of each text is stored compressed, and,
+when the frequency distributions in the cache take up more than
+`max_bytes` bytes, the results that were used least recently are
+thrown away.
+"""
+
+DEFAULT_MAX_BYTES = 64 << 20
+
+
+def hash_file(path, chunk_size=1 << 20):
+    """
+    Compute the SHA-256 hash of the contents of a file.
+
+    :param path: path to the file
+    :type path: str
+    :param chunk_size: number of bytes to read at a time
+    :type chunk_size: int
+
+    :returns: hexadecimal hash
+    :rtype: str
+    """
+
+    sha256 = hashlib.sha256()
+    with open(path, 'rb') as hashed_file:
+        while True:
+            chunk = hashed_file.read(chunk_size)
+            if not chunk:
+                break
+            sha256.update(chunk)
+
+    return sha256.hexdigest()
+
+
+def get_file_state(path):
+    """
+    Get the size, modification time and SHA-256 hash of a file, which
+    results are stored with to tell whether the file has changed since.
+    This should be called before the file is processed, so that, if the
+    file changes while it's being processed, the results aren't stored
+    as if they were for its new contents.
+
+    :param path: path to the file
+    :type path: str
+
+    :returns: size, modification time (in nanoseconds) and hexadecimal
+              hash
+    :rtype: tuple
+    """
+
+    stat = os.stat(path)
+    return stat.st_size, stat.st_mtime_ns, hash_file(path)
+
+
+class TextCache:
+    """
+    On-disk cache of the statistics and frequency distributions of
+    processed texts.
+    """
+
+    def __init__(self, cache_path, max_bytes=DEFAULT_MAX_BYTES):
+        """
+        Open the cache stored at `cache_path`, creating it if it doesn't
+        exist yet.
+
+        :param cache_path: path to the SQLite database
+        :type cache_path: str
+        :param max_bytes: maximum total size of the stored frequency
+                          distributions
+        :type max_bytes: int
+        """
+
+        self.cache_path = cache_path
+        self.max_bytes = max_bytes
+
+        # Worker processes may write to the cache at the same time, so
+        # wait for each other's writes rather than failing right away
+        self.connection = sqlite3.connect(cache_path, timeout=60)
+        with self.connection:
+            self.connection.execute(
+                "CREATE TABLE IF NOT EXISTS results ("
+                "text_path TEXT PRIMARY KEY, "
+                "size INTEGER NOT NULL, "
+                "mtime_ns INTEGER NOT NULL, "
+                "sha256 TEXT NOT NULL, "
+                "num_words INTEGER NOT NULL, "
+                "num_unique_words INTEGER NOT NULL, "
+                "top_20_words TEXT NOT NULL, "
+                "freq_dist BLOB NOT NULL, "
+                "num_bytes INTEGER NOT NULL, "
+                "last_used REAL NOT NULL)")
+
+        # The maximum size may be smaller than when the cache was last
+        # used
+        self.evict()
+
+    def close(self):
+        """
+        Close the cache.
+        """
+
+        self.connection.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+    def _find_valid_row(self, text_path, columns):
+        """
+        Look up the given columns of a text's results, returning None
+        if there are none or the text has changed since they were
+        stored. Results that are found are marked as just used.
+
+        :param text_path: path to the text
+        :type text_path: str
+        :param columns: names of the columns to get
+        :type columns: list
+
+        :returns: values of the columns or None
+        :rtype: tuple or None
+        """
+
+        text_path = os.path.abspath(text_path)
+        row = self.connection.execute(
+            "SELECT size, mtime_ns, sha256, {} FROM results "
+            "WHERE text_path = ?".format(", ".join(columns)),
+            (text_path,)).fetchone()
+        if row is None:
+            return None
+
+        size, mtime_ns, sha256 = row[:3]
+        stat = os.stat(text_path)
+        if stat.st_size != size:
+            return None
+
+        with self.connection:
+            if stat.st_mtime_ns != mtime_ns:
+                if hash_file(text_path) != sha256:
+                    return None
+
+                # The file was touched but not changed, so remember its
+                # new modification time to avoid hashing it next time
+                self.connection.execute(
+                    "UPDATE results SET mtime_ns = ? WHERE text_path = ?",
+                    (stat.st_mtime_ns, text_path))
+
+            self.connection.execute(
+                "UPDATE results SET last_used = ? WHERE text_path = ?",
+                (time.time(), text_path))
+
+        return row[3:]
+
+    def get_stats(self, text_path):
+        """
+        Return the stored statistics of a text, or None if there are
+        none or the text has changed since they were stored.
+
+        :param text_path: path to the text
+        :type text_path: str
+
+        :returns: number of words, number of unique words and top 20
+                  words, or None
+        :rtype: tuple or None
+        """
+
+        row = self._find_valid_row(
+            text_path, ['num_words', 'num_unique_words', 'top_20_words'])
+        if row is None:
+            return None
+
+        num_words, num_unique_words, top_20_words = row
+        return num_words, num_unique_words, json.loads(top_20_words)
+
+    def put(self, text_path, file_state, freq_dist, num_words,
+            num_unique_words, top_20_words):
+        """
+        Store the results of processing a text (replacing any results
+        stored for it before), then throw away the least recently used
+        results if the cache has grown too big.
+
+        If the size or modification time of the text is no longer the
+        same as in `file_state`, the text changed while it was being
+        processed, so the results aren't stored.
+
+        :param text_path: path to the text
+        :type text_path: str
+        :param file_state: size, modification time and hash of the text
+                           from before it was processed (see
+                           `get_file_state`)
+        :type file_state: tuple
+        :param freq_dist: frequency distribution of the text's words
+        :type freq_dist: dict
+        :param num_words: number of words in the text
+        :type num_words: int
+        :param num_unique_words: number of unique words in the text
+        :type num_unique_words: int
+        :param top_20_words: top 20 words in the text
+        :type top_20_words: list
+        """
+
+        text_path = os.path.abspath(text_path)
+        size, mtime_ns, sha256 = file_state
+        stat = os.stat(text_path)
+        if stat.st_size != size or stat.st_mtime_ns != mtime_ns:
+            return
+
+        compressed_freq_dist = zlib.compress(
+            json.dumps(freq_dist, ensure_ascii=False).encode('utf-8'))
+
+        with self.connection:
+            self.connection.execute(
+                "INSERT OR REPLACE INTO results VALUES "
+                "(?, ?, ?, ?, ?, ?, ?, ?, ?, ?)",
+                (text_path, size, mtime_ns, sha256,
+                 num_words, num_unique_words, json.dumps(top_20_words),
+                 sqlite3.Binary(compressed_freq_dist),
+                 len(compressed_freq_dist), time.time()))
+
+        self.evict()
+
+    def evict(self):
+        """
+        Throw away the least recently used results until the stored
+        frequency distributions take up at most `max_bytes` bytes.
+        """
+
+        with self.connection:
+            total_bytes, = self.connection.execute(
+                "SELECT COALESCE(SUM(num_bytes), 0) FROM results").fetchone()
+            if total_bytes <= self.max_bytes:
+                return
+
+            rows = self.connection.execute(
+                "SELECT text_path, num_bytes FROM results "
+                "ORDER BY last_used").fetchall()
+            for text_path, num_bytes in rows:
+                if total_bytes <= self.max_bytes:
+                    break
+                self.connection.execute(
+                    "DELETE FROM results WHERE text_path = ?", (text_path,))
+                total_bytes -= num_bytes
@@ -1,6 +1,9 @@
 #!/usr/bin/env python
 from __future__ import print_function
-import sys
+import argparse
+from collections import namedtuple
+from concurrent.futures import ProcessPoolExecutor
+from itertools import repeat
 
 """
 In this exercise, follow along with text below sequentially instead of
@@ -28,7 +31,12 @@ with a slightly different name).
 ###       can find the file and import stuff from it. Python will
 ###       search the directory you're currently in by default.
 
-from frequency_distribution import get_freq_dist, get_sorted_word_freqs
+from frequency_distribution import (get_file_freq_dist, get_freq_dist,
+                                    get_parallel_file_freq_dist,
+                                    get_sorted_word_freqs,
+                                    iter_mapped_word_batches,
+                                    iter_word_batches)
+from text_cache import DEFAULT_MAX_BYTES, TextCache, get_file_state
 
 """
 Notice how I was able to import from `frequency_distribution` (which is
@@ -73,15 +81,79 @@ Go down to the `main` method and follow along with the comments until
 you are directed elsewhere.
 """
 
+class LazyAttribute(object):
+    """
+    Attribute of a `TextProcessing` object that is only computed the
+    first time it is used and then kept.
+
+    The attribute is computed by calling the method of the object named
+    `method_name`, which must set the attribute (e.g., `get_words` sets
+    `self.word_list`). The value it sets is stored in the object's own
+    `__dict__`, which Python looks in before asking the `LazyAttribute`
+    again, so the method is only called once (until the value is thrown
+    away by `TextProcessing.invalidate`).
+
+    `depends_on` lists the names of the other attributes that the value
+    is computed from, so that `invalidate` knows which values have to
+    be thrown away when one of them changes.
+    """
+
+    def __init__(self, method_name, depends_on=()):
+        """
+        Initialize a lazy attribute.
+
+        :param method_name: name of the method that computes the value
+        :type method_name: str
+        :param depends_on: names of the attributes that the value is
+                           computed from
+        :type depends_on: iterable
+        """
+
+        self.method_name = method_name
+        self.depends_on = tuple(depends_on)
+        self.name = None
+
+    def __set_name__(self, owner, name):
+        self.name = name
+
+    def __get__(self, instance, owner):
+        if instance is None:
+            return self
+
+        getattr(instance, self.method_name)()
+        try:
+            return instance.__dict__[self.name]
+        except KeyError:
+            raise AttributeError("{} did not set {}."
+                                 .format(self.method_name, self.name))
+
+
 class TextProcessing:
     """
     Class for representing an instance of text processing (where the
     "processing" refers to what we're specifically doing in this case,
     i.e., getting a frequency distribution and some other data about an
     input text).
+
+    None of the attributes computed from the text are computed until
+    they are used (not even the text itself is read in until then), so
+    that, e.g., asking for `num_words` doesn't make a frequency
+    distribution that isn't needed (see `LazyAttribute`).
     """
 
-    def __init__(self, text_path):
+    # Each of these attributes is computed by the method named next to
+    # it the first time it is used, from the attributes it depends on
+    text = LazyAttribute('read_text')
+    word_list = LazyAttribute('get_words', depends_on=['text'])
+    freq_dist = LazyAttribute('get_freq_dist', depends_on=['word_list'])
+    num_words = LazyAttribute('get_num_words',
+                              depends_on=['word_list', 'freq_dist'])
+    num_unique_words = LazyAttribute('get_num_unique_words',
+                                     depends_on=['freq_dist'])
+    top_20_words = LazyAttribute('get_top_20_words',
+                                 depends_on=['freq_dist'])
+
+    def __init__(self, text_path, streaming=False, jobs=1, mapped=False):
         """
         Initialize a `TextProcessing` object.
 
@@ -105,33 +177,102 @@ class TextProcessing:
 
         This will print out the `text` attribute of the `text1` object.
 
+        If `streaming` is True, the frequency distribution and the
+        number of words are computed straight from the file a chunk at
+        a time (see `get_file_freq_dist`) instead of from `text` and
+        `word_list`, so very large texts can be processed with memory
+        proportional only to the number of unique words. When
+        streaming, a single large file can also be split up and counted
+        by `jobs` processes at the same time (see
+        `get_parallel_file_freq_dist`).
+
+        If `mapped` is True, the words are found straight in a
+        memory map of the file instead of in `text` (see
+        `iter_mapped_word_batches`), so the text is never read in as a
+        string or split into lines and only the words themselves are
+        decoded. This is for large texts: at most, the list of words is
+        held in memory (or, when streaming too, only the words of one
+        part of the file at a time).
+
         :param text_path: path to text file
         :type text_path: str
+        :param streaming: whether to count the words straight from the
+                          file instead of reading in the whole text
+        :type streaming: bool
+        :param jobs: number of processes to count the words with when
+                     streaming
+        :type jobs: int
+        :param mapped: whether to find the words in a memory map of
+                       the file instead of in `text`
+        :type mapped: bool
+        """
+
+        # Save the text path and how to process it
+        self.text_path = text_path
+        self.streaming = streaming
+        self.jobs = jobs
+        self.mapped = mapped
+
+        # The other attributes (`text`, `word_list`, `freq_dist`,
+        # `num_words`, `num_unique_words` and `top_20_words`) aren't
+        # created here. They are defined on the class as
+        # `LazyAttribute`s instead, so each one is computed by one of
+        # the methods below when it's first used.
+        # Add some other attributes if you want, but, if you do, know
+        # that you will have to design a function to compute them
+
+    def invalidate(self, changed=None):
+        """
+        Throw away cached attribute values so that they are computed
+        again the next time they are used.
+
+        If `changed` is the name of an attribute (e.g., "text" after
+        setting `self.text` to a new text), every value computed from
+        it (directly or indirectly) is thrown away. If it is None (e.g.,
+        after the file has changed), all of the values are thrown away,
+        including the text itself.
+
+        :param changed: name of the attribute that changed
+        :type changed: str or None
+        """
+
+        lazy_attributes = dict(
+            (name, attribute) for name, attribute in vars(type(self)).items()
+            if isinstance(attribute, LazyAttribute))
+
+        if changed is None:
+            stale_names = set(lazy_attributes)
+        else:
+
+            # Keep going through the attributes until no more are found
+            # that depend on ones already known to be stale
+            changed_names = set([changed])
+            stale_names = set()
+            while True:
+                new_stale_names = set(
+                    name for name, attribute in lazy_attributes.items()
+                    if name not in stale_names
+                    and changed_names.intersection(attribute.depends_on))
+                if not new_stale_names:
+                    break
+                stale_names.update(new_stale_names)
+                changed_names.update(new_stale_names)
+
+        for name in stale_names:
+            self.__dict__.pop(name, None)
+
+    def read_text(self):
+        """
+        Read in the text.
         """
 
         # Get text from file at given path and make a `text` attribute,
         # i.e., in the line "self.text = text_file.read()" below,
         # `self.text` is the thing that actually creates the attribute
-        text_file = open(text_path)
+        text_file = open(self.text_path)
         self.text = text_file.read()
         text_file.close()
 
-        # Save the text path
-        self.text_path = text_path
-
-        # Let's create some other attributes, but leave their values
-        # assigned to None for now (their value will be computed as
-        # part of this object's other methods)
-        self.word_list = None
-        self.freq_dist = None
-        self.num_words = None
-        self.num_unique_words = None
-        self.top_20_words = None
-
-        # Add some other attributes if you want, but, if you do, know
-        # that you will have to design a function to compute them later
-        # on
-
     # Make a function that processes `self.text` into a list of words
     def get_words(self):
         """
@@ -140,15 +281,20 @@ class TextProcessing:
 
         self.word_list = []
 
+        # When the file is memory-mapped, the words come from the file
+        # a batch at a time instead of from `self.text`
+        if self.mapped:
+            for words in iter_mapped_word_batches(self.text_path):
+                self.word_list.extend(words)
+            return
+
         # Iterate over the lines in `self.text` by splitting on
         # newlines ("\n")
         for line in self.text.split('\n'):
 
             # Make `line` lower-case and strip off spaces from either
             # end
-            # Hint: Use "lower()" and "strip()" (both with no
-            # arguments).
-            line = ### FILL IN
+            line = line.lower().strip()
 
             # Discard empty lines
             if line == "":
@@ -166,10 +312,20 @@ class TextProcessing:
     def get_freq_dist(self):
         """
         Use the imported `get_freq_dist` to get the frequency
-        distribution.
+        distribution (or `get_file_freq_dist` or
+        `get_parallel_file_freq_dist` when streaming).
         """
 
-        self.freq_dist = get_freq_dist(self.word_list)
+        if self.streaming and self.jobs > 1:
+            self.freq_dist = get_parallel_file_freq_dist(self.text_path,
+                                                         self.jobs)
+        elif self.streaming and self.mapped:
+            self.freq_dist = get_freq_dist(
+                iter_mapped_word_batches(self.text_path), batched=True)
+        elif self.streaming:
+            self.freq_dist = get_file_freq_dist(self.text_path)
+        else:
+            self.freq_dist = get_freq_dist(self.word_list)
 
     # Make a function that returns the number of total words
     def get_num_words(self):
@@ -177,7 +333,20 @@ class TextProcessing:
         Get the total number of words in the text.
         """
 
-        self.num_words = ### Fill in
+        # When streaming, there is no list of words to count, but adding
+        # up the frequencies of all of the words comes to the same thing
+        # (if the frequency distribution hasn't been made, the words of
+        # the file are counted as they are read instead)
+        if not self.streaming:
+            self.num_words = len(self.word_list)
+        elif 'freq_dist' in self.__dict__:
+            self.num_words = sum(self.freq_dist.values())
+        elif self.mapped:
+            self.num_words = sum(len(words) for words
+                                 in iter_mapped_word_batches(self.text_path))
+        else:
+            self.num_words = sum(len(words) for words
+                                 in iter_word_batches(self.text_path))
 
     # Make a function that gets the total number of unique words
     def get_num_unique_words(self):
@@ -185,12 +354,11 @@ class TextProcessing:
         Get the number of unique words.
         """
 
-        # Use `self.word_list` to compute the number of unique words
-        # Hint: Use `set()` and take the length of it
-        # Another way to do it would be to get the length of
-        # `self.freq_dist`, which will count the keys in the
-        # dictionary.
-        self.num_unique_words = ### FILL IN
+        # We could use `self.word_list` to compute the number of unique
+        # words by making a `set()` out of it and taking its length,
+        # but the keys of `self.freq_dist` are already exactly the
+        # unique words, so we can just count them
+        self.num_unique_words = len(self.freq_dist)
 
     # Get the top 20 words (words only) in terms of frequency
     def get_top_20_words(self):
@@ -207,16 +375,18 @@ class TextProcessing:
         # `get_sorted_word_freqs` function defined in the previous
         # assignment takes 2 required positional arguments: 1) a
         # frequency distribution dictionary that maps words to their
-        # frequencies and a value named `n`, and 2) an integer value
-        # that tells the function how many results to return. The last
-        # argument, named `reverse`, is optional. It has a default
-        # value (`False`) that tells the function to return results
-        # that are the most frequent. While this argument has a default
-        # value and need not be specified, it can be specified by
-        # either including the value directly in the third position,
-        # e.g. `False`, or by providing a key/value, e.g.
-        # `reverse=False` in the call to the function. 
-        top_20_word_and_frequency_tuples = ### FILL IN
+        # frequencies and 2) an integer value named `n` that tells the
+        # function how many results to return. The last argument, named
+        # `reverse`, is optional. It has a default value (`False`) that
+        # tells the function to return the least frequent results, so,
+        # to get the most frequent ones, it has to be specified, either
+        # by including the value directly in the third position, e.g.
+        # `True`, or by providing a key/value, e.g. `reverse=True` in
+        # the call to the function. The function only keeps track of
+        # the best 20 words as it goes instead of sorting the whole
+        # vocabulary.
+        top_20_word_and_frequency_tuples = get_sorted_word_freqs(
+            self.freq_dist, 20, reverse=True)
 
         # The code below gets the words out of the word/frequency
         # tuples contained in `top_20_word_and_frequency_tuples`
@@ -226,46 +396,158 @@ class TextProcessing:
                              in top_20_word_and_frequency_tuples]
 
     # So far, we have only defined functions that compute specific
-    # things, but none of them are executed at any point and, in fact,
-    # the order in which they are executed is important since the
-    # computation of some attributes depends on the computation of
-    # others. Let's create a general `process_text` function that
-    # executes all of the processing functions defined above (when
+    # things, and they are only executed when the attributes they
+    # compute are used (in the right order, since using an attribute
+    # like `freq_dist` uses `word_list`, which computes it first if it
+    # hasn't been computed yet). Let's create a general `process_text`
+    # function that computes all of the attributes at once (when
     # called).
     def process_text(self):
         """
-        Get all of the attributes of the text.
+        Get all of the attributes of the text (other than `text` and
+        `word_list` when streaming). Attributes that have already been
+        computed aren't computed again.
+        """
+
+        names = ['freq_dist', 'num_words', 'num_unique_words', 'top_20_words']
+        if not self.streaming:
+            names.insert(0, 'word_list')
+        self.compute(*names)
+
+    def compute(self, *names):
+        """
+        Get the attributes with the given names, computing the ones that
+        haven't been computed yet.
+
+        :param names: names of the attributes
+        :type names: str
+
+        :returns: values of the attributes (in the same order)
+        :rtype: list
         """
 
-        self.get_words()
-        self.get_freq_dist()
-        self.get_num_words()
+        return [getattr(self, name) for name in names]
+
+
+# Compact record of the statistics of a processed text (this is all
+# that `main` writes out, so it's all that a worker process needs to
+# send back, rather than the whole `TextProcessing` object with its
+# frequency distribution)
+TextStats = namedtuple('TextStats', ['text_path', 'num_words',
+                                     'num_unique_words', 'top_20_words'])
+
+
+def get_text_stats(text_path, jobs=1, cache_path=None,
+                   cache_max_bytes=DEFAULT_MAX_BYTES):
+    """
+    Process a text (streaming it from its file) and return its
+    statistics.
+
+    If `cache_path` is given, the statistics stored in the cache there
+    (see `TextCache`) are returned instead if the text hasn't changed
+    since it was last processed. Otherwise, the text is processed and
+    its frequency distribution and statistics are stored in the cache.
+
+    :param text_path: path to text file
+    :type text_path: str
+    :param jobs: number of processes to count the words of the text with
+    :type jobs: int
+    :param cache_path: path to the cache of results (None means no
+                       cache)
+    :type cache_path: str or None
+    :param cache_max_bytes: maximum size of the frequency distributions
+                            kept in the cache
+    :type cache_max_bytes: int
+
+    :returns: statistics of the text
+    :rtype: TextStats
+    """
+
+    cache = None
+    if cache_path is not None:
+        cache = TextCache(cache_path, cache_max_bytes)
+
+    try:
+        if cache is not None:
+            stats = cache.get_stats(text_path)
+            if stats is not None:
+                print("Using cached results for {}...".format(text_path))
+                return TextStats(text_path, *stats)
+
+        print("Processing {}...".format(text_path))
+
+        # Remember what the file was like before processing it, so that
+        # the results aren't cached if it changes in the meantime
+        if cache is not None:
+            file_state = get_file_state(text_path)
+
+        # Only the statistics are needed, so there is no need to hold
+        # the text and its list of words in memory
+        text = TextProcessing(text_path, streaming=True, jobs=jobs)
+
+        # Compute the attributes
+        text.process_text()
 
-        # FILL IN THE CALLS TO THE REMAINING FUNCTIONS
+        if cache is not None:
+            cache.put(text.text_path, file_state, text.freq_dist,
+                      text.num_words, text.num_unique_words,
+                      text.top_20_words)
 
-        # After all of the functions have been called, all of the
-        # attributes defined in `__init__` will have values.
-        # After finishing this part, go back to the `main` method where
-        # we left off.
+        return TextStats(text.text_path, text.num_words,
+                         text.num_unique_words, text.top_20_words)
+    finally:
+        if cache is not None:
+            cache.close()
 
 
 def main():
 
-    # Let's read in the arguments passed in. This can be done using
+    # Let's read in the arguments passed in. These can be found in
     # `sys.argv`, which is a list of arguments that the user supplies
     # when the program is run. `sys.argv[0]` is the name of the script,
     # `sys.argv[1]` is the name of the first argument, `sys.argv[2]`
     # the next, and so on.
-    # NOTE: Always rememner that the first value in `sys.argv` is the
-    #       name of the script itself.
-
-    # First check if any arguments were provided (other than the script
-    # name itself)
-    if len(sys.argv) == 1:
-        raise ValueError("No arguments were passed in!")
-
-    # Now, since we know there were arguments, let's get them and put
-    # them in a list
+    # Rather than going through `sys.argv` ourselves, we'll let the
+    # `argparse` module do it. We tell it what arguments to expect (one
+    # or more text paths and an optional `--jobs` option followed by a
+    # number) and it checks them, converts them and prints out an
+    # error (and a usage message) if they don't make sense, e.g., if no
+    # text paths were passed in.
+    parser = argparse.ArgumentParser(
+        description="Compute word statistics for texts and write them to "
+                    "processed_texts.tsv.")
+    parser.add_argument('text_paths', nargs='+', metavar='text_path',
+                        help="Paths to the text files to process.")
+    parser.add_argument('--jobs', type=int, default=1,
+                        help="Number of texts to process at the same time, "
+                             "each in its own process (default: 1).")
+    parser.add_argument('--split', action='store_true',
+                        help="Instead of processing several texts at the "
+                             "same time, process the texts one at a time, "
+                             "splitting each one up to be counted by --jobs "
+                             "processes (for a few large texts).")
+    parser.add_argument('--cache-path', default='processed_texts_cache.sqlite',
+                        help="Where to keep the results of processing each "
+                             "text, so that texts that haven't changed "
+                             "aren't processed again the next time "
+                             "(default: processed_texts_cache.sqlite).")
+    parser.add_argument('--cache-max-mb', type=float,
+                        default=DEFAULT_MAX_BYTES/float(1 << 20),
+                        help="Maximum size (in MiB) of the frequency "
+                             "distributions kept in the cache; the least "
+                             "recently used ones are thrown away first "
+                             "(default: {:g}).".format(
+                                 DEFAULT_MAX_BYTES/float(1 << 20)))
+    parser.add_argument('--no-cache', action='store_true',
+                        help="Process every text, without using or "
+                             "updating the cache.")
+    args = parser.parse_args()
+    if args.jobs < 1:
+        parser.error("--jobs must be at least 1.")
+    cache_path = None if args.no_cache else args.cache_path
+    cache_max_bytes = int(args.cache_max_mb*(1 << 20))
+
+    # Now let's put the text paths in a list
     # We'll also check that each one is a valid path. To do this, we
     # can use the `os.path` module, which includes an `exists` function
     # and some other very useful functions. Get used to these functions
@@ -273,13 +555,8 @@ def main():
     from os.path import exists, abspath, join
     text_paths = []
 
-    # Let's iterate over the list of arguments (skipping over the
-    # first). Notice the brackets following `sys.argv`. Basically, I'm
-    # saying: Use everything in `sys.argv` from index 1 and up (i.e.,
-    # skip over index 0). This is called "slicing". It allows you to
-    # work with "slices" of a list instead of the whole thing without
-    # needing to create a new list.
-    for arg in sys.argv[1:]:
+    # Let's iterate over the list of text path arguments
+    for arg in args.text_paths:
 
         # Get the absolute path (deals with arguments that have
         # relative paths, such as `../file.txt`)
@@ -306,23 +583,28 @@ def main():
     # comments and implement the class. Then, come back down here where
     # the class will be used to process the texts.
 
-    # Now we'll iterate over the text file paths, processing each text
-    # one at a time and add them to the `texts` (defined below). Each
-    # element of this list will be an object of type `TextProcessing`
-    # and will have the attributes we're looking for, including the
-    # number of total words, the number of unique words, etc.
-    texts = []
-    for text_path in text_paths:
-
-        print("Processing {}...".format(text_path))
-
-        text = TextProcessing(text_path)
-
-        ### FILL IN THIS PART THAT ACTUALLY PROCESSES THE TEXT
-        # Hint: Call the `text` object's `process_text` function to
-        # compute the attributes.
-
-        texts.append(text)
+    # Now we'll process each text (see `get_text_stats`) and collect
+    # the results in `texts`. Each element of this list will have the
+    # attributes we're looking for, including the number of total
+    # words, the number of unique words, etc.
+    # With `--jobs` greater than 1, the texts are spread over a pool of
+    # worker processes so that several of them can be processed at the
+    # same time on different CPU cores. `executor.map` gives back the
+    # results in the same order as the text paths, no matter which
+    # worker finishes first, so the output file is always the same.
+    # With `--split`, the workers share the work of each text instead.
+    # Texts that haven't changed since the last run aren't processed
+    # again; their statistics are taken from the cache instead (unless
+    # `--no-cache` is given).
+    if args.jobs == 1 or args.split:
+        texts = [get_text_stats(text_path, args.jobs, cache_path,
+                                cache_max_bytes)
+                 for text_path in text_paths]
+    else:
+        with ProcessPoolExecutor(max_workers=args.jobs) as executor:
+            texts = list(executor.map(get_text_stats, text_paths, repeat(1),
+                                      repeat(cache_path),
+                                      repeat(cache_max_bytes)))
 
     # Now, let's make an output file that compiles all of the data we
     # just computed when the texts were processed
@@ -353,17 +635,14 @@ def main():
         # read.)
         output_string = text.text_path
         output_string = output_string + '\t' + str(text.num_words)
-        output_string = ### FILL IN THE REST AND REMEMBER THAT THE
-                        ### VALUES NEED TO BE SEPARATED BY A TAB AS IS
-                        ### DONE ABOVE
-                        ### NOTE: I had to use `str` to convert the
-                        ###       number of words to a string since it
-                        ###       is actually an int. This will need to
-                        ###       be done for the other values also.
-                        ###       (But not fot `text.text_path`. Why?)
+        # NOTE: `str` is needed to convert the numbers to strings, but
+        #       not for `text.text_path`, which is already a string.
+        #       The top 20 words are joined together with commas.
+        output_string = (output_string + '\t' + str(text.num_unique_words)
+                         + '\t' + ','.join(text.top_20_words) + '\n')
 
         # Write the line to the file
-        ### FILL IN
+        output_file.write(output_string)
 
     # Close the file
     output_file.close()